@@ -0,0 +1,9 @@
+# StrategyExtractor Package
+# Crime Intelligence Engine - Information Extraction Module
+
+from .extractor import CrimeExtractor, EXTRACTION_FIELDS
+from .ruleBasedExtractor import RuleBasedExtractor
+from .llmExtractor import LLMExtractor
+from .mockLLMServer import MockLLMServer
+
+__all__ = ['CrimeExtractor', 'EXTRACTION_FIELDS', 'RuleBasedExtractor', 'LLMExtractor', 'MockLLMServer']
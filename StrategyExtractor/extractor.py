@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+# Structured fields every extractor fills for an article
+EXTRACTION_FIELDS = ['who', 'what', 'where', 'when', 'how']
+
+
+class CrimeExtractor(ABC):
+
+    # Identifies the backend in cache keys and stored records
+    name = "extractor"
+
+    @abstractmethod
+    def ExtractBatch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        """
+        Extract structured crime information from a batch of article texts.
+        Returns one dict per text, in order, keyed by EXTRACTION_FIELDS with a
+        list of string values each.
+
+        :param texts: Full article texts.
+        """
+        pass
@@ -0,0 +1,35 @@
+import requests
+from typing import Dict, List
+from .extractor import CrimeExtractor, EXTRACTION_FIELDS
+
+
+class LLMExtractor(CrimeExtractor):
+    """
+    Extractor backed by an LLM behind a local HTTP endpoint.
+
+    A whole batch goes out in one request:
+        POST {endpoint}  {"model": ..., "fields": [...], "inputs": [text, ...]}
+    and the server answers {"results": [{field: [values]}, ...]} in input order.
+    MockLLMServer speaks the same protocol for tests.
+    """
+
+    name = "llm"
+
+    def __init__(self, endpoint: str = "http://127.0.0.1:8765/extract", model: str = "local", timeout: float = 120):
+        self.endpoint = endpoint
+        self.model = model
+        self.timeout = timeout
+        self.name = f"llm:{model}"
+        self._session = requests.Session()
+
+    def ExtractBatch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        resp = self._session.post(
+            self.endpoint,
+            json={"model": self.model, "fields": EXTRACTION_FIELDS, "inputs": texts},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        results = resp.json().get("results", [])
+        if len(results) != len(texts):
+            raise ValueError(f"LLM returned {len(results)} results for {len(texts)} inputs")
+        return [{field: list(result.get(field, [])) for field in EXTRACTION_FIELDS} for result in results]
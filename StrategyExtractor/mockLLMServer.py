@@ -0,0 +1,63 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from .ruleBasedExtractor import RuleBasedExtractor
+
+
+class MockLLMServer:
+    """
+    Local stand-in for an LLM extraction endpoint, speaking the LLMExtractor
+    protocol and answering with RuleBasedExtractor. Counts requests and
+    inputs so tests can check batching and caching.
+
+    Usage:
+        with MockLLMServer() as server:
+            extractor = LLMExtractor(server.endpoint)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.requests = 0
+        self.inputs = 0
+        extractor = RuleBasedExtractor()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                texts = payload.get("inputs", [])
+                server.requests += 1
+                server.inputs += len(texts)
+
+                body = json.dumps({"results": extractor.ExtractBatch(texts)}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/extract"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,79 @@
+import re
+from typing import Dict, List
+from .extractor import CrimeExtractor, EXTRACTION_FIELDS
+
+
+class RuleBasedExtractor(CrimeExtractor):
+    """
+    Local regex/keyword extractor. Cheap and deterministic, so it is the
+    default backend and the reference the mock LLM server answers with.
+    """
+
+    name = "rules"
+
+    CRIME_TYPES = {
+        'murder': r'murder(?:ed|s)?|homicide|killed|killing',
+        'shooting': r'shooting|shot dead|opened fire|gunman',
+        'stabbing': r'stabb(?:ed|ing)',
+        'robbery': r'robber(?:y|ies)|robbed|mugg(?:ed|ing)',
+        'burglary': r'burglar(?:y|ies)|break-in',
+        'theft': r'theft|stole(?:n)?|shoplift(?:ing)?',
+        'assault': r'assault(?:ed)?|attack(?:ed)?|beaten',
+        'sexual assault': r'rape(?:d)?|sexual assault|sexually assaulted',
+        'kidnapping': r'kidnapp(?:ed|ing)|abduct(?:ed|ion)',
+        'fraud': r'fraud|scam|embezzl(?:ed|ement)|money laundering',
+        'drug trafficking': r'drug (?:trafficking|smuggling|bust)|narcotics|cocaine|heroin|fentanyl',
+        'arson': r'arson|set (?:on )?fire',
+        'terrorism': r'terror(?:ism|ist)|bombing',
+        'cybercrime': r'hack(?:ed|ers?|ing)|ransomware|cyber ?attack',
+    }
+
+    METHODS = {
+        'firearm': r'gun(?:s|fire)?|firearm|rifle|pistol|shot',
+        'knife': r'knife|stabb(?:ed|ing)|blade',
+        'explosive': r'bomb|explosive|grenade',
+        'vehicle': r'car|truck|vehicle|run over|rammed',
+        'online': r'online|hack(?:ed|ers?|ing)|phishing|ransomware',
+        'poison': r'poison(?:ed|ing)?',
+        'arson': r'fire|petrol|gasoline',
+    }
+
+    ROLES = r'police|suspects?|victims?|gunman|gunmen|attacker|officers?|prosecutors?|judge|gang|teenager|woman|man|boy|girl'
+
+    MONTHS = r'January|February|March|April|May|June|July|August|September|October|November|December'
+
+    def __init__(self):
+        # Compiled once, reused for every article
+        self._crime_types = {k: re.compile(rf'\b(?:{v})\b', re.I) for k, v in self.CRIME_TYPES.items()}
+        self._methods = {k: re.compile(rf'\b(?:{v})\b', re.I) for k, v in self.METHODS.items()}
+        self._roles = re.compile(rf'\b(?:{self.ROLES})\b', re.I)
+        self._names = re.compile(r'\b(?:(?:Mr|Mrs|Ms|Dr|Officer|Sgt|Det)\.? )?[A-Z][a-z]+(?: [A-Z][a-z]+){1,2}\b')
+        self._places = re.compile(r'\b(?:in|at|near|outside) ((?:the )?[A-Z][\w-]+(?:,? [A-Z][\w-]+){0,2})')
+        self._dates = re.compile(
+            rf'\b(?:(?:on )?(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)'
+            rf'|(?:{self.MONTHS}) \d{{1,2}}(?:, \d{{4}})?|\d{{1,2}} (?:{self.MONTHS})(?: \d{{4}})?'
+            rf'|yesterday|last (?:night|week|month)|earlier this (?:week|month)'
+            rf'|\d{{1,2}}(?::\d{{2}})? ?[ap]\.?m\.?)\b'
+        )
+
+    @staticmethod
+    def _unique(values) -> List[str]:
+        return list(dict.fromkeys(v.strip() for v in values if v.strip()))
+
+    def _extract_one(self, text: str) -> Dict[str, List[str]]:
+        places = self._unique(self._places.findall(text))
+        place_set = set(places)
+        names = [n for n in self._names.findall(text) if n not in place_set]
+        roles = [r.lower() for r in self._roles.findall(text)]
+
+        record = {
+            'who': self._unique(names + roles)[:10],
+            'what': [k for k, pattern in self._crime_types.items() if pattern.search(text)],
+            'where': places[:5],
+            'when': self._unique(self._dates.findall(text))[:5],
+            'how': [k for k, pattern in self._methods.items() if pattern.search(text)],
+        }
+        return {field: record[field] for field in EXTRACTION_FIELDS}
+
+    def ExtractBatch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        return [self._extract_one(text) for text in texts]
@@ -0,0 +1,8 @@
+# StrategyQueue Package
+# Crime Intelligence Engine - Distributed Work Queue Module
+
+from .workQueue import WorkQueue, READY, LEASED, DONE, DEAD
+from .sqliteWorkQueue import SQLiteWorkQueue
+from .redisWorkQueue import RedisWorkQueue
+
+__all__ = ['WorkQueue', 'READY', 'LEASED', 'DONE', 'DEAD', 'SQLiteWorkQueue', 'RedisWorkQueue']
@@ -0,0 +1,261 @@
+import json
+import time
+import uuid
+from typing import Dict, List
+from .workQueue import WorkQueue, READY, LEASED, DONE, DEAD
+
+
+def _str(value):
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+STATES = {'ready': READY, 'leased': LEASED, 'done': DONE, 'dead': DEAD}
+
+# Job fields, each stored in its own hash of job id -> value
+FIELDS = ['kind', 'payload', 'state', 'attempts', 'max_attempts', 'key', 'token', 'worker', 'result', 'error']
+
+# Every state change runs as one Lua script, which Redis executes atomically:
+# a worker crashing mid-lease can no longer leave a job popped from the ready
+# list but missing from the leased set, nor Collect lose a result it popped.
+# Scripts only touch keys passed in KEYS (as Redis Cluster requires): their
+# own keys first, then one hash per job field, bound to F.<field> here.
+
+
+def _script(own_keys: int, body: str) -> str:
+    names = ", ".join(f"'{name}'" for name in FIELDS)
+    prelude = (
+        "local F = {}\n"
+        f"for i, name in ipairs({{{names}}}) do F[name] = KEYS[{own_keys} + i] end\n"
+    )
+    return prelude + body % STATES
+
+
+# KEYS: ready, kinds, keys, seq; ARGV: kind, max attempts, then payload and dedup key ('' for none) per job
+ENQUEUE_SCRIPT = _script(4, """
+local ready, kinds, keyset, seq = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local kind, max_attempts = ARGV[1], ARGV[2]
+redis.call('SADD', kinds, kind)
+local added = 0
+for i = 3, #ARGV, 2 do
+    local payload, key = ARGV[i], ARGV[i + 1]
+    if key == '' or redis.call('SADD', keyset, key) == 1 then
+        local id = redis.call('INCR', seq)
+        redis.call('HSET', F.kind, id, kind)
+        redis.call('HSET', F.payload, id, payload)
+        redis.call('HSET', F.state, id, '%(ready)s')
+        redis.call('HSET', F.attempts, id, 0)
+        redis.call('HSET', F.max_attempts, id, max_attempts)
+        redis.call('HSET', F.key, id, key)
+        redis.call('LPUSH', ready, id)
+        added = added + 1
+    end
+end
+return added
+""")
+
+# KEYS: ready, leased, dead, keys; ARGV: now, lease expiry, max jobs, worker, token per job
+LEASE_SCRIPT = _script(4, """
+local ready, leased, dead, keyset = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local now, expires, max_jobs = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local worker = ARGV[4]
+
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', leased, '-inf', now)) do
+    redis.call('ZREM', leased, id)
+    local attempts = tonumber(redis.call('HGET', F.attempts, id) or '0')
+    local max_attempts = tonumber(redis.call('HGET', F.max_attempts, id) or '1')
+    redis.call('HSET', F.token, id, '')
+    if attempts >= max_attempts then
+        redis.call('HSET', F.state, id, '%(dead)s')
+        redis.call('HSET', F.error, id, 'lease expired')
+        local key = redis.call('HGET', F.key, id)
+        if key and key ~= '' then redis.call('SREM', keyset, key) end
+        redis.call('LPUSH', dead, id)
+    else
+        redis.call('HSET', F.state, id, '%(ready)s')
+        -- Back at the pop end, so the retry goes out next
+        redis.call('RPUSH', ready, id)
+    end
+end
+
+local jobs = {}
+for i = 1, max_jobs do
+    local id = redis.call('RPOP', ready)
+    if not id then break end
+    local token = ARGV[4 + i]
+    local attempts = redis.call('HINCRBY', F.attempts, id, 1)
+    redis.call('HSET', F.state, id, '%(leased)s')
+    redis.call('HSET', F.token, id, token)
+    redis.call('HSET', F.worker, id, worker)
+    redis.call('ZADD', leased, expires, id)
+    jobs[#jobs + 1] = {id, redis.call('HGET', F.payload, id), attempts, token}
+end
+return jobs
+""")
+
+# KEYS: leased, done; ARGV: id, token, result
+ACK_SCRIPT = _script(2, """
+local id = ARGV[1]
+if redis.call('HGET', F.token, id) ~= ARGV[2] then return 0 end
+if redis.call('ZREM', KEYS[1], id) == 0 then return 0 end
+redis.call('HSET', F.state, id, '%(done)s')
+redis.call('HSET', F.token, id, '')
+redis.call('HSET', F.result, id, ARGV[3])
+redis.call('LPUSH', KEYS[2], id)
+return 1
+""")
+
+# KEYS: leased, ready, dead, keys; ARGV: id, token, error
+FAIL_SCRIPT = _script(4, """
+local id = ARGV[1]
+if redis.call('HGET', F.token, id) ~= ARGV[2] then return 0 end
+if redis.call('ZREM', KEYS[1], id) == 0 then return 0 end
+local attempts = tonumber(redis.call('HGET', F.attempts, id))
+local max_attempts = tonumber(redis.call('HGET', F.max_attempts, id))
+redis.call('HSET', F.token, id, '')
+redis.call('HSET', F.error, id, ARGV[3])
+if attempts >= max_attempts then
+    redis.call('HSET', F.state, id, '%(dead)s')
+    local key = redis.call('HGET', F.key, id)
+    if key and key ~= '' then redis.call('SREM', KEYS[4], key) end
+    redis.call('LPUSH', KEYS[3], id)
+else
+    redis.call('HSET', F.state, id, '%(ready)s')
+    redis.call('LPUSH', KEYS[2], id)
+end
+return 1
+""")
+
+# KEYS: done, keys; ARGV: limit
+COLLECT_SCRIPT = _script(2, """
+local jobs = {}
+for i = 1, tonumber(ARGV[1]) do
+    local id = redis.call('RPOP', KEYS[1])
+    if not id then break end
+    jobs[#jobs + 1] = {id, redis.call('HGET', F.payload, id), redis.call('HGET', F.attempts, id),
+                       redis.call('HGET', F.result, id)}
+    local key = redis.call('HGET', F.key, id)
+    if key and key ~= '' then redis.call('SREM', KEYS[2], key) end
+    for _, field in pairs(F) do redis.call('HDEL', field, id) end
+end
+return jobs
+""")
+
+
+class RedisWorkQueue(WorkQueue):
+    """
+    WorkQueue on Redis, for workers spread over several machines.
+
+    Takes any client with the redis-py command API (e.g. redis.Redis, or
+    fakeredis.FakeRedis as a local stand-in), so redis itself is only needed
+    where it is used. Enqueue, Lease, Ack, Fail and Collect are Lua scripts,
+    so every state transition is atomic on the server.
+
+    Layout under the namespace, which is a hash tag ({crimenet:queue}) so
+    every key maps to one Redis Cluster slot and a script may touch them all:
+      seq                 job id counter
+      job:<field>         hash of job id -> field value, one per field in FIELDS
+      ready:<kind>        list of ready ids (LPUSH in, RPOP out)
+      leased:<kind>       sorted set of leased ids scored by lease expiry
+      done:<kind>         list of acked ids awaiting Collect
+      dead:<kind>         list of ids that ran out of attempts
+      keys, kinds         sets of dedup keys and known kinds
+    A job that goes DEAD gives up its dedup key, so its payload can be
+    enqueued again.
+    """
+
+    # Jobs per Enqueue script call, to keep each call's arguments bounded
+    ENQUEUE_BATCH = 500
+
+    def __init__(self, client, namespace: str = 'crimenet:queue'):
+        self.redis = client
+        self.ns = namespace
+        self._enqueue = client.register_script(ENQUEUE_SCRIPT)
+        self._lease = client.register_script(LEASE_SCRIPT)
+        self._ack = client.register_script(ACK_SCRIPT)
+        self._fail = client.register_script(FAIL_SCRIPT)
+        self._collect = client.register_script(COLLECT_SCRIPT)
+
+    def _key(self, *parts) -> str:
+        return ':'.join((f"{{{self.ns}}}",) + tuple(str(p) for p in parts))
+
+    def _fields(self) -> List[str]:
+        return [self._key('job', field) for field in FIELDS]
+
+    def _kinds(self, kinds: List[str] = None) -> List[str]:
+        return list(kinds) if kinds else sorted(_str(k) for k in self.redis.smembers(self._key('kinds')))
+
+    def Enqueue(self, kind: str, payloads: List[Dict], keys: List[str] = None, max_attempts: int = 3) -> int:
+        keys = keys or [None] * len(payloads)
+        jobs = [(json.dumps(payload), key or '') for payload, key in zip(payloads, keys)]
+        added = 0
+        for i in range(0, len(jobs), self.ENQUEUE_BATCH):
+            added += self._enqueue(
+                keys=[self._key('ready', kind), self._key('kinds'), self._key('keys'), self._key('seq')]
+                + self._fields(),
+                args=[kind, max_attempts] + [value for job in jobs[i:i + self.ENQUEUE_BATCH] for value in job],
+            )
+        return added
+
+    def Lease(self, worker: str, kinds: List[str] = None, max_jobs: int = 1,
+              visibility_timeout: float = 60) -> List[Dict]:
+        now = time.time()
+        jobs = []
+        for kind in self._kinds(kinds):
+            # Runs even with nothing wanted, to reclaim the kind's expired leases
+            wanted = max(max_jobs - len(jobs), 0)
+            leased = self._lease(
+                keys=[self._key('ready', kind), self._key('leased', kind), self._key('dead', kind), self._key('keys')]
+                + self._fields(),
+                args=[now, now + visibility_timeout, wanted, worker] + [uuid.uuid4().hex for _ in range(wanted)],
+            )
+            for job_id, payload, attempts, token in leased:
+                jobs.append({'id': _str(job_id), 'kind': kind, 'payload': json.loads(_str(payload)),
+                             'attempts': int(attempts), 'token': _str(token)})
+        return jobs
+
+    def _kind_of(self, job_id) -> str:
+        return _str(self.redis.hget(self._key('job', 'kind'), job_id))
+
+    def Ack(self, job_id, token: str, result=None) -> bool:
+        kind = self._kind_of(job_id)
+        if kind is None:
+            return False
+        return bool(self._ack(
+            keys=[self._key('leased', kind), self._key('done', kind)] + self._fields(),
+            args=[job_id, token, json.dumps(result)],
+        ))
+
+    def Fail(self, job_id, token: str, error: str = '') -> bool:
+        kind = self._kind_of(job_id)
+        if kind is None:
+            return False
+        return bool(self._fail(
+            keys=[self._key('leased', kind), self._key('ready', kind), self._key('dead', kind), self._key('keys')]
+            + self._fields(),
+            args=[job_id, token, error],
+        ))
+
+    def Collect(self, kind: str, limit: int = 1000) -> List[Dict]:
+        collected = self._collect(keys=[self._key('done', kind), self._key('keys')] + self._fields(), args=[limit])
+        return [
+            {'id': _str(job_id), 'kind': kind, 'payload': json.loads(_str(payload)),
+             'attempts': int(attempts), 'result': json.loads(_str(result))}
+            for job_id, payload, attempts, result in collected
+        ]
+
+    def Stats(self, kind: str = None) -> Dict[str, int]:
+        # One MULTI/EXEC, so the counts are a single snapshot and a job moving
+        # between states is never missed (or counted twice)
+        names = self._kinds([kind] if kind else None)
+        pipe = self.redis.pipeline(transaction=True)
+        for name in names:
+            pipe.llen(self._key('ready', name))
+            pipe.zcard(self._key('leased', name))
+            pipe.llen(self._key('done', name))
+            pipe.llen(self._key('dead', name))
+        counts = pipe.execute()
+        stats = {READY: 0, LEASED: 0, DONE: 0, DEAD: 0}
+        for i in range(0, len(counts), 4):
+            for state, count in zip((READY, LEASED, DONE, DEAD), counts[i:i + 4]):
+                stats[state] += count
+        return stats
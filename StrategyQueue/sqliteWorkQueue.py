@@ -0,0 +1,142 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, List
+from .workQueue import WorkQueue, READY, LEASED, DONE, DEAD
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT UNIQUE,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    token TEXT,
+    lease_expires REAL,
+    worker TEXT,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_kind_state ON jobs(kind, state, id);
+"""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    WorkQueue in a single SQLite file, for workers on one machine (or sharing
+    a local filesystem). Leases are taken inside BEGIN IMMEDIATE, so SQLite's
+    write lock is what keeps two workers from leasing the same job. A job
+    that goes DEAD gives up its dedup key, so its payload can be enqueued again.
+    """
+
+    def __init__(self, db_path: str = 'data/work_queue.db'):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def _transaction(self, fn):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                value = fn(self._conn)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return value
+
+    def Enqueue(self, kind: str, payloads: List[Dict], keys: List[str] = None, max_attempts: int = 3) -> int:
+        keys = keys or [None] * len(payloads)
+
+        def enqueue(conn):
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs(kind, key, payload, state, max_attempts) VALUES (?, ?, ?, ?, ?)",
+                [(kind, key, json.dumps(payload), READY, max_attempts) for payload, key in zip(payloads, keys)],
+            )
+            return conn.total_changes - before
+
+        return self._transaction(enqueue)
+
+    def Lease(self, worker: str, kinds: List[str] = None, max_jobs: int = 1,
+              visibility_timeout: float = 60) -> List[Dict]:
+        def lease(conn):
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET state = ?, token = NULL, key = NULL, error = 'lease expired' "
+                "WHERE state = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (DEAD, LEASED, now),
+            )
+            sql = "SELECT id, kind, payload, attempts FROM jobs WHERE (state = ? OR (state = ? AND lease_expires < ?))"
+            params = [READY, LEASED, now]
+            if kinds:
+                sql += f" AND kind IN ({','.join('?' * len(kinds))})"
+                params += list(kinds)
+            rows = conn.execute(sql + " ORDER BY id LIMIT ?", params + [max_jobs]).fetchall()
+
+            jobs = []
+            for row in rows:
+                token = uuid.uuid4().hex
+                conn.execute(
+                    "UPDATE jobs SET state = ?, attempts = attempts + 1, token = ?, lease_expires = ?, worker = ? "
+                    "WHERE id = ?",
+                    (LEASED, token, now + visibility_timeout, worker, row['id']),
+                )
+                jobs.append({'id': row['id'], 'kind': row['kind'], 'payload': json.loads(row['payload']),
+                             'attempts': row['attempts'] + 1, 'token': token})
+            return jobs
+
+        return self._transaction(lease)
+
+    def Ack(self, job_id, token: str, result=None) -> bool:
+        def ack(conn):
+            return conn.execute(
+                "UPDATE jobs SET state = ?, token = NULL, result = ? WHERE id = ? AND state = ? AND token = ?",
+                (DONE, json.dumps(result), job_id, LEASED, token),
+            ).rowcount == 1
+
+        return self._transaction(ack)
+
+    def Fail(self, job_id, token: str, error: str = '') -> bool:
+        def fail(conn):
+            return conn.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END, "
+                "key = CASE WHEN attempts >= max_attempts THEN NULL ELSE key END, "
+                "token = NULL, error = ? WHERE id = ? AND state = ? AND token = ?",
+                (DEAD, READY, error, job_id, LEASED, token),
+            ).rowcount == 1
+
+        return self._transaction(fail)
+
+    def Collect(self, kind: str, limit: int = 1000) -> List[Dict]:
+        def collect(conn):
+            rows = conn.execute(
+                "SELECT id, kind, payload, attempts, result FROM jobs WHERE kind = ? AND state = ? ORDER BY id LIMIT ?",
+                (kind, DONE, limit),
+            ).fetchall()
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(row['id'],) for row in rows])
+            return [{'id': row['id'], 'kind': row['kind'], 'payload': json.loads(row['payload']),
+                     'attempts': row['attempts'], 'result': json.loads(row['result'])} for row in rows]
+
+        return self._transaction(collect)
+
+    def Stats(self, kind: str = None) -> Dict[str, int]:
+        # A single SELECT reads one snapshot, so all states are counted consistently
+        with self._lock:
+            sql = "SELECT state, COUNT(*) FROM jobs"
+            params = []
+            if kind:
+                sql += " WHERE kind = ?"
+                params.append(kind)
+            counts = dict(self._conn.execute(sql + " GROUP BY state", params).fetchall())
+        return {state: counts.get(state, 0) for state in (READY, LEASED, DONE, DEAD)}
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+# Job states shared by every backend
+READY = 'ready'
+LEASED = 'leased'
+DONE = 'done'
+DEAD = 'dead'
+
+
+class WorkQueue(ABC):
+    """
+    Job queue shared by a coordinator and any number of worker processes or nodes.
+
+    A job is a dict {'id', 'kind', 'payload', 'attempts', 'token'}. Lease hands
+    jobs out for visibility_timeout seconds; a job that is neither acked nor
+    failed within that time becomes leasable again, so a crashed worker only
+    delays its jobs. Every lease counts as an attempt and a job that has used
+    max_attempts is moved to DEAD instead of being retried again. Ack and Fail
+    must present the token of the current lease, so a worker whose lease ran
+    out cannot overwrite the result of the worker that took the job over.
+    """
+
+    @abstractmethod
+    def Enqueue(self, kind: str, payloads: List[Dict], keys: List[str] = None, max_attempts: int = 3) -> int:
+        """
+        Adds one job per payload.
+
+        :param kind: Job kind workers select on, e.g. 'source' or 'article'.
+        :param payloads: JSON-serialisable job payloads.
+        :param keys: Optional dedup key per payload; a key already queued (and
+                     neither collected nor dead) is skipped.
+        :param max_attempts: Leases allowed before the job is declared dead.
+        :return: Number of jobs added.
+        """
+        pass
+
+    @abstractmethod
+    def Lease(self, worker: str, kinds: List[str] = None, max_jobs: int = 1,
+              visibility_timeout: float = 60) -> List[Dict]:
+        """
+        Leases up to max_jobs ready (or lease-expired) jobs of the given kinds.
+        """
+        pass
+
+    @abstractmethod
+    def Ack(self, job_id, token: str, result=None) -> bool:
+        """
+        Completes a leased job and stores its JSON-serialisable result.
+        Returns False if the lease was lost.
+        """
+        pass
+
+    @abstractmethod
+    def Fail(self, job_id, token: str, error: str = '') -> bool:
+        """
+        Releases a leased job for retry (or DEAD once out of attempts).
+        Returns False if the lease was lost.
+        """
+        pass
+
+    @abstractmethod
+    def Collect(self, kind: str, limit: int = 1000) -> List[Dict]:
+        """
+        Removes and returns up to limit DONE jobs of a kind, each with its 'result'.
+        """
+        pass
+
+    @abstractmethod
+    def Stats(self, kind: str = None) -> Dict[str, int]:
+        """
+        Number of jobs per state, optionally for one kind, read as one
+        consistent snapshot.
+        """
+        pass
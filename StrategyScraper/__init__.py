@@ -1,10 +1,11 @@
 # StrategyScraper Package
 # Crime Intelligence Engine - News Scraping Module
 
-from .scraper import NewsScraper
+from .scraper import NewsScraper, ThreadLocalSession
 from .bbcNewsScraper import BBCNewsScraper
 from .yahooNewsScraper import YahooNewsScraper
 from .googleNewsScraper import GoogleNewsScraper
 from .newYorkTimesScraper import NewYorkTimesScraper
+from .genericScraper import GenericScraper
 
-__all__ = ['NewsScraper', 'BBCNewsScraper', 'YahooNewsScraper', 'GoogleNewsScraper', 'NewYorkTimesScraper']
+__all__ = ['NewsScraper', 'ThreadLocalSession', 'BBCNewsScraper', 'YahooNewsScraper', 'GoogleNewsScraper', 'NewYorkTimesScraper', 'GenericScraper']
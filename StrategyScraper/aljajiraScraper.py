@@ -1,17 +1,28 @@
 import requests
 from bs4 import BeautifulSoup, Tag
 from typing import List, Union, Dict
-from .scraper import NewsScraper
+from .scraper import NewsScraper, ThreadLocalSession
 
 class AlJazeeraScraper(NewsScraper):
     def __init__(self, base_url="https://www.aljazeera.com"):
         self.base_url = base_url
+        self._session = ThreadLocalSession()
         
     def ScrapeHome(self) -> Union[List[Dict[str, str]], str]:
+        content = self.FetchHome()
+        return content if isinstance(content, str) else self.ParseHome(content)
+
+    def FetchHome(self) -> Union[bytes, str]:
         try:
-            response = requests.get(self.base_url, timeout=10)
+            response = self._session.get(self.base_url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            return response.content
+        except requests.RequestException as e:
+            return f"Request error: {str(e)}"
+
+    def ParseHome(self, content: bytes) -> Union[List[Dict[str, str]], str]:
+        try:
+            soup = BeautifulSoup(content, "html.parser")
 
             articles = []
             
@@ -61,8 +72,6 @@ class AlJazeeraScraper(NewsScraper):
             
             return articles if articles else "No valid articles found"
             
-        except requests.RequestException as e:
-            return f"Request error: {str(e)}"
         except Exception as e:
             return f"Parsing error: {str(e)}"
     
@@ -122,7 +131,7 @@ class AlJazeeraScraper(NewsScraper):
         Scrapes a full article's text from the given URL.
         """
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -162,7 +171,7 @@ class AlJazeeraScraper(NewsScraper):
         Scrapes special content from a specific Al Jazeera URL.
         """
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
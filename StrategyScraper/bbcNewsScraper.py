@@ -1,61 +1,67 @@
-import requests
 from bs4 import BeautifulSoup, Tag
 from typing import List, Union, Dict
-from .scraper import NewsScraper
+from .scraper import NewsScraper, ThreadLocalSession
 
 class BBCNewsScraper(NewsScraper):
     
     def __init__(self, base_url="https://www.bbc.com"):
         self.base_url = base_url
+        self._session = ThreadLocalSession()
     
     def ScrapeHome(self) -> Union[List[Dict[str, str]], str]:
         """
         Scrapes the home page of BBC and returns the headlines with their links.
         Returns a list of dictionaries with 'title' and 'link' keys.
         """
-        response = requests.get(self.base_url)
+        content = self.FetchHome()
+        return content if isinstance(content, str) else self.ParseHome(content)
+
+    def FetchHome(self) -> Union[bytes, str]:
+        response = self._session.get(self.base_url)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            headlines = []
-            
-            # Find all anchor tags with data-testid="internal-link"
-            internal_links = soup.find_all('a', attrs={'data-testid': 'internal-link'})
-            
-            for link in internal_links:
-                # Ensure link is a Tag object
-                if isinstance(link, Tag):
-                    # Look for h2 with data-testid="card-headline" within this link
-                    headline_element = link.find('h2', attrs={'data-testid': 'card-headline'})
+            return response.content
+        return f"Error: Unable to fetch the home page. Status code {response.status_code}"
+
+    def ParseHome(self, content: bytes) -> List[Dict[str, str]]:
+        soup = BeautifulSoup(content, 'html.parser')
+        headlines = []
+        
+        # Find all anchor tags with data-testid="internal-link"
+        internal_links = soup.find_all('a', attrs={'data-testid': 'internal-link'})
+        
+        for link in internal_links:
+            # Ensure link is a Tag object
+            if isinstance(link, Tag):
+                # Look for h2 with data-testid="card-headline" within this link
+                headline_element = link.find('h2', attrs={'data-testid': 'card-headline'})
+                
+                if headline_element and isinstance(headline_element, Tag):
+                    title = headline_element.get_text(strip=True)
+                    href_attr = link.get('href')
                     
-                    if headline_element and isinstance(headline_element, Tag):
-                        title = headline_element.get_text(strip=True)
-                        href_attr = link.get('href')
+                    # Make sure we have both title and link
+                    if title and href_attr:
+                        href = str(href_attr)  # Convert to string
                         
-                        # Make sure we have both title and link
-                        if title and href_attr:
-                            href = str(href_attr)  # Convert to string
-                            
-                            # Convert relative URLs to absolute URLs
-                            if href.startswith('/'):
-                                href = self.base_url + href
-                            elif not href.startswith('http'):
-                                href = self.base_url + '/' + href
-                            
-                            headlines.append({
-                                'title': title,
-                                'link': href
-                            })
-            
-            return headlines
-        else:
-            return f"Error: Unable to fetch the home page. Status code {response.status_code}"
+                        # Convert relative URLs to absolute URLs
+                        if href.startswith('/'):
+                            href = self.base_url + href
+                        elif not href.startswith('http'):
+                            href = self.base_url + '/' + href
+                        
+                        headlines.append({
+                            'title': title,
+                            'link': href
+                        })
+        
+        return headlines
     
     def ScrapeFullText(self, url: str) -> str:
         """
         Scrapes a full article's text from the given URL.
         Looks for div elements with data-component="text-block" and extracts all p tags within them.
         """
-        response = requests.get(url)
+        response = self._session.get(url)
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -89,7 +95,7 @@ class BBCNewsScraper(NewsScraper):
         """
         Scrapes special content from a specific BBC URL.
         """
-        response = requests.get(url)
+        response = self._session.get(url)
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'html.parser')
             special_content = soup.find_all('p')  # Example for scraping paragraphs
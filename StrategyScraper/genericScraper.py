@@ -0,0 +1,243 @@
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urljoin
+from .scraper import NewsScraper, ThreadLocalSession
+from .textExtractor import ArticleTextExtractor, JSONLD
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+}
+
+
+class GenericScraper(NewsScraper):
+    """
+    Config-driven scraper. A spec dict describes where headlines and article
+    bodies live on a site, so a new source is a few lines of config instead of
+    a new class.
+
+    Spec keys (only "base_url" is required):
+      - home_url: page or feed to scrape headlines from (defaults to base_url)
+      - feed: "html" (default) or "rss"
+      - link_selectors: CSS selectors for headline anchors, first match wins
+      - title_selectors: CSS selectors for the title inside an anchor
+      - title_fallback: fall back to anchor text / title attribute when no
+        title selector matches (default True)
+      - min_title_length: titles must be longer than this
+      - rss_description_link: prefer the <a> inside an RSS <description>
+      - body_selectors: ordered CSS containers for the article body, the
+        <p> tags of the first matching container are joined (as in the
+        per-site scrapers); JSONLD marks where JSON-LD articleBody is tried
+      - all_matches: join the <p> tags of every container matching a body
+        selector instead of only the first one (default False)
+      - min_jsonld_length / min_paragraph_length: a JSON-LD body or a
+        last-resort <p> must be longer than this to count
+      - max_items, timeout, headers
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self.base_url = spec["base_url"]
+        self.home_url = spec.get("home_url", self.base_url)
+        self.feed = spec.get("feed", "html")
+        self.min_title_length = spec.get("min_title_length", 5)
+        self.min_jsonld_length = spec.get("min_jsonld_length", 100)
+        self.min_paragraph_length = spec.get("min_paragraph_length", 40)
+        self.rss_description_link = spec.get("rss_description_link", False)
+        self.title_fallback = spec.get("title_fallback", True)
+        self.max_items = spec.get("max_items")
+        self.timeout = spec.get("timeout", 20)
+
+        # Selectors are compiled once here instead of on every page
+        self._link_patterns = [soupsieve.compile(s) for s in spec.get("link_selectors", [])]
+        self._title_patterns = [soupsieve.compile(s) for s in spec.get("title_selectors", [])]
+        self._extractor = ArticleTextExtractor(
+            spec.get("body_selectors", [JSONLD]),
+            min_jsonld_length=self.min_jsonld_length,
+            min_paragraph_length=self.min_paragraph_length,
+            all_matches=spec.get("all_matches", False),
+        )
+
+        self.headers = dict(spec.get("headers", DEFAULT_HEADERS))
+        self._session = ThreadLocalSession()
+        self._session.headers.update(self.headers)
+
+    # ---------- helpers
+
+    def _fetch(self, url: str) -> Optional[bytes]:
+        resp = self._session.get(url, timeout=self.timeout)
+        if resp.status_code != 200:
+            return None
+        return resp.content
+
+    def _absolute(self, href: str) -> str:
+        return urljoin(self.base_url + "/", href.strip())
+
+    def _title_for(self, link: Tag) -> str:
+        for pattern in self._title_patterns:
+            el = pattern.select_one(link)
+            if isinstance(el, Tag):
+                title = el.get_text(" ", strip=True)
+                if len(title) > self.min_title_length:
+                    return title
+
+        if not self.title_fallback:
+            return ""
+
+        title = link.get_text(" ", strip=True)
+        if len(title) > self.min_title_length:
+            return title
+
+        title_attr = link.get("title")
+        if isinstance(title_attr, str) and len(title_attr.strip()) > self.min_title_length:
+            return title_attr.strip()
+        return ""
+
+    def _collect(self, items: List[Dict[str, str]], seen: set, title: str, link: str) -> bool:
+        """Adds an item unless its link was seen; returns False once max_items is reached."""
+        if link not in seen:
+            seen.add(link)
+            items.append({"title": title, "link": link})
+        return self.max_items is None or len(items) < self.max_items
+
+    def _parse_html_home(self, content: bytes) -> Union[List[Dict[str, str]], str]:
+        soup = BeautifulSoup(content, "html.parser")
+
+        links: List[Tag] = []
+        for pattern in self._link_patterns:
+            links = pattern.select(soup)
+            if links:
+                break
+        if not links:
+            return "No articles found with any of the selectors"
+
+        items: List[Dict[str, str]] = []
+        seen = set()
+        for link in links:
+            href = link.get("href")
+            title = self._title_for(link)
+            if not href or not title:
+                continue
+            if not self._collect(items, seen, title, self._absolute(str(href))):
+                break
+
+        return items if items else "No valid articles found"
+
+    def _parse_rss_home(self, content: bytes) -> Union[List[Dict[str, str]], str]:
+        soup = BeautifulSoup(content, "xml")
+
+        items: List[Dict[str, str]] = []
+        seen = set()
+        for item in soup.find_all("item"):
+            title = item.title.get_text(strip=True) if item.title else ""
+
+            link = ""
+            if self.rss_description_link:
+                desc = item.find("description")
+                if desc and desc.string:
+                    a = BeautifulSoup(desc.string, "html.parser").find("a")
+                    if isinstance(a, Tag) and a.get("href"):
+                        link = str(a.get("href")).strip()
+            if not link and item.link:
+                link = item.link.get_text(strip=True)
+
+            if title and link:
+                if not self._collect(items, seen, title, link):
+                    break
+
+        return items
+
+    def _texts(self, paragraphs: List[Tag]) -> List[str]:
+        parts: List[str] = []
+        for p in paragraphs:
+            txt = p.get_text(" ", strip=True)
+            if txt:
+                parts.append(txt)
+        return parts
+
+    def _parse_full_text(self, content: bytes) -> str:
+        text = self._extractor.extract(BeautifulSoup(content, "html.parser"))
+        return text if text else "Error: No text content found in the article"
+
+    # ---------- API
+
+    def ScrapeHome(self) -> Union[List[Dict[str, str]], str]:
+        """
+        Scrapes the configured home page or RSS feed.
+        Returns a list of dicts with 'title' and 'link', or an error string.
+        """
+        content = self.FetchHome()
+        return content if isinstance(content, str) else self.ParseHome(content)
+
+    def FetchHome(self) -> Union[bytes, str]:
+        try:
+            content = self._fetch(self.home_url)
+            if content is None:
+                return f"Error: Unable to fetch the home page {self.home_url}"
+            return content
+        except Exception as e:
+            return f"Error: {e}"
+
+    def ParseHome(self, content: bytes) -> Union[List[Dict[str, str]], str]:
+        try:
+            if self.feed == "rss":
+                return self._parse_rss_home(content)
+            return self._parse_html_home(content)
+        except Exception as e:
+            return f"Error: {e}"
+
+    def ScrapeFullText(self, url: str) -> str:
+        """
+        Extracts article text using the spec's body selectors, then the
+        length-filtered <p> fallback.
+        """
+        try:
+            content = self._fetch(url)
+            if content is None:
+                return f"Error: Unable to fetch the article {url}"
+            return self._parse_full_text(content)
+        except Exception as e:
+            return f"Error: {e}"
+
+    async def ScrapeHomeAsync(self, http=None) -> Union[List[Dict[str, str]], str]:
+        """
+        Native async ScrapeHome: fetches through the shared AsyncHttpService
+        pool and parses in its worker pool. Without one it falls back to the
+        blocking adapter.
+        """
+        if http is None:
+            return await super().ScrapeHomeAsync()
+        try:
+            status, content = await http.get(self.home_url, headers=self.headers, timeout=self.timeout)
+            if status != 200:
+                return f"Error: Unable to fetch the home page {self.home_url}"
+            return await http.parse(self.ParseHome, content)
+        except Exception as e:
+            return f"Error: {e}"
+
+    async def ScrapeFullTextAsync(self, url: str, http=None) -> str:
+        """
+        Native async ScrapeFullText, see ScrapeHomeAsync.
+        """
+        if http is None:
+            return await super().ScrapeFullTextAsync(url)
+        try:
+            status, content = await http.get(url, headers=self.headers, timeout=self.timeout)
+            if status != 200:
+                return f"Error: Unable to fetch the article {url}"
+            return await http.parse(self._parse_full_text, content)
+        except Exception as e:
+            return f"Error: {e}"
+
+    def ScrapeSpecial(self, url: str) -> Union[List[str], str]:
+        """
+        Returns all non-empty paragraph texts from the URL.
+        """
+        try:
+            content = self._fetch(url)
+            if content is None:
+                return f"Error: Unable to fetch the page {url}"
+            paras = self._texts(BeautifulSoup(content, "html.parser").find_all("p"))
+            return paras if paras else "Error: No paragraphs found"
+        except Exception as e:
+            return f"Error: {e}"
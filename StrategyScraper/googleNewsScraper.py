@@ -1,29 +1,42 @@
-import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
 from typing import List, Dict, Union
-from urllib.parse import urlparse
-import json
-from .scraper import NewsScraper
+from .scraper import NewsScraper, ThreadLocalSession
+from .textExtractor import ArticleTextExtractor, JSONLD
 
 class GoogleNewsScraper(NewsScraper):
     def __init__(self, rss_url: str = "https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en"):
         self.rss_url = rss_url
-        self._session = requests.Session()
+        self._session = ThreadLocalSession()
         self._session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
         })
+        self._extractor = ArticleTextExtractor(
+            ["article", '[itemprop="articleBody"]', JSONLD],
+            min_jsonld_length=100,
+            min_paragraph_length=40,
+            all_matches=False,
+        )
 
     def ScrapeHome(self) -> Union[List[Dict[str, str]], str]:
         """
         Scrapes Google News RSS and returns [{'title','link'}].
         Prefers the original article link from <description>, else uses <link>.
         """
+        content = self.FetchHome()
+        return content if isinstance(content, str) else self.ParseHome(content)
+
+    def FetchHome(self) -> Union[bytes, str]:
         try:
             resp = self._session.get(self.rss_url, timeout=20)
             if resp.status_code != 200:
                 return f"Error: Unable to fetch RSS. Status code {resp.status_code}"
+            return resp.content
+        except Exception as e:
+            return f"Error: {e}"
 
-            soup = BeautifulSoup(resp.content, "xml")
+    def ParseHome(self, content: bytes) -> Union[List[Dict[str, str]], str]:
+        try:
+            soup = BeautifulSoup(content, "xml")
             results: List[Dict[str, str]] = []
 
             for item in soup.find_all("item"):
@@ -68,51 +81,10 @@ class GoogleNewsScraper(NewsScraper):
             if resp.status_code != 200:
                 return f"Error: Unable to fetch the article. Status code {resp.status_code}"
 
-            soup = BeautifulSoup(resp.content, "html.parser")
-
-            def collect_paragraphs(container: Tag) -> List[str]:
-                parts: List[str] = []
-                for p in container.find_all("p"):
-                    txt = p.get_text(" ", strip=True)
-                    if txt:
-                        parts.append(txt)
-                return parts
-
-            # 1) Standard <article> body
-            article = soup.find("article")
-            if isinstance(article, Tag):
-                parts = collect_paragraphs(article)
-                if parts:
-                    return "\n\n".join(parts)
-
-            # 2) Common schema markup container
-            article_body = soup.find(attrs={"itemprop": "articleBody"})
-            if isinstance(article_body, Tag):
-                parts = collect_paragraphs(article_body)
-                if parts:
-                    return "\n\n".join(parts)
-
-            # 3) JSON-LD articleBody
-            for script in soup.find_all("script", type="application/ld+json"):
-                try:
-                    data = json.loads(script.string or "")
-                    objs = data if isinstance(data, list) else [data]
-                    for obj in objs:
-                        if isinstance(obj, dict) and obj.get("@type") in ("NewsArticle", "Article"):
-                            body = obj.get("articleBody")
-                            if isinstance(body, str) and len(body.strip()) > 100:
-                                return body.strip()
-                except Exception:
-                    continue
-
-            # 4) Fallback: all <p> tags with length filter
-            parts = []
-            for p in soup.find_all("p"):
-                txt = p.get_text(" ", strip=True)
-                if txt and len(txt) > 40:
-                    parts.append(txt)
-            if parts:
-                return "\n\n".join(parts)
+            # One walk over the DOM covers every heuristic below
+            text = self._extractor.extract(BeautifulSoup(resp.content, "html.parser"))
+            if text:
+                return text
 
             return "Error: No text content found in the article"
 
@@ -1,9 +1,8 @@
-import requests
 from bs4 import BeautifulSoup, Tag
 from typing import List, Dict, Union, Optional
 from urllib.parse import urljoin
-import json
-from .scraper import NewsScraper
+from .scraper import NewsScraper, ThreadLocalSession
+from .textExtractor import ArticleTextExtractor, JSONLD
 
 
 class NewYorkTimesScraper(NewsScraper):
@@ -18,7 +17,7 @@ class NewYorkTimesScraper(NewsScraper):
 
     def __init__(self, home_url: str = BASE):
         self.home_url = home_url
-        self._session = requests.Session()
+        self._session = ThreadLocalSession()
         self._session.headers.update({
             # NYTimes can be picky about UA + Accept-Language
             "User-Agent": (
@@ -28,6 +27,12 @@ class NewYorkTimesScraper(NewsScraper):
             ),
             "Accept-Language": "en-US,en;q=0.9",
         })
+        self._extractor = ArticleTextExtractor(
+            ['section[name="articleBody"]', "article", JSONLD],
+            min_jsonld_length=120,
+            min_paragraph_length=50,
+            all_matches=False,
+        )
 
     # ---------- helpers
 
@@ -45,12 +50,21 @@ class NewYorkTimesScraper(NewsScraper):
             - summary: a sibling <p> with class containing 'summary' (best-effort)
         Falls back to common NYT headline patterns (h3 > a, etc.).
         """
+        content = self.FetchHome()
+        return content if isinstance(content, str) else self.ParseHome(content)
+
+    def FetchHome(self) -> Union[bytes, str]:
         try:
             r = self._session.get(self.home_url, timeout=25)
             if r.status_code != 200:
                 return f"Error: Unable to fetch NYT home. Status code {r.status_code}"
+            return r.content
+        except Exception as e:
+            return f"Error: {e}"
 
-            soup = BeautifulSoup(r.content, "html.parser")
+    def ParseHome(self, content: bytes) -> Union[List[Dict[str, str]], str]:
+        try:
+            soup = BeautifulSoup(content, "html.parser")
             out: List[Dict[str, str]] = []
 
             # --- 1) Primary: your provided structure (a.tpl-lbl ... p headline)
@@ -131,51 +145,10 @@ class NewYorkTimesScraper(NewsScraper):
             if r.status_code != 200:
                 return f"Error: Unable to fetch article. Status code {r.status_code}"
 
-            soup = BeautifulSoup(r.content, "html.parser")
-
-            def collect_paras(container: Tag) -> List[str]:
-                parts: List[str] = []
-                for p in container.find_all("p"):
-                    t = self._text(p)
-                    if t:
-                        parts.append(t)
-                return parts
-
-            # 1) Preferred NYT body container
-            body = soup.select_one('section[name="articleBody"]')
-            if isinstance(body, Tag):
-                parts = collect_paras(body)
-                if parts:
-                    return "\n\n".join(parts)
-
-            # 2) Generic <article> container
-            article = soup.find("article")
-            if isinstance(article, Tag):
-                parts = collect_paras(article)
-                if parts:
-                    return "\n\n".join(parts)
-
-            # 3) JSON-LD attempt
-            for s in soup.find_all("script", type="application/ld+json"):
-                try:
-                    data = json.loads(s.string or "")
-                    nodes = data if isinstance(data, list) else [data]
-                    for node in nodes:
-                        if isinstance(node, dict) and node.get("@type") in ("NewsArticle", "Article"):
-                            body_text = node.get("articleBody")
-                            if isinstance(body_text, str) and len(body_text.strip()) > 120:
-                                return body_text.strip()
-                except Exception:
-                    continue
-
-            # 4) Fallback: all <p> with a length filter (avoids nav, captions)
-            parts = []
-            for p in soup.find_all("p"):
-                t = self._text(p)
-                if len(t) > 50:
-                    parts.append(t)
-            if parts:
-                return "\n\n".join(parts)
+            # One walk over the DOM covers every heuristic below
+            text = self._extractor.extract(BeautifulSoup(r.content, "html.parser"))
+            if text:
+                return text
 
             return "Error: No text content found in the article."
         except Exception as e:
@@ -1,5 +1,36 @@
+import asyncio
+import threading
+import requests
 from abc import ABC, abstractmethod
 from typing import List, Union, Dict
+from requests.structures import CaseInsensitiveDict
+
+
+class ThreadLocalSession:
+    """
+    requests.Session stand-in that gives every thread its own Session.
+
+    A requests.Session is not thread-safe, and the async adapters run a
+    scraper's blocking methods on many worker threads at once. Each thread
+    gets a Session (and so a connection pool) of its own; all of them send
+    the shared headers.
+    """
+
+    def __init__(self, headers: Dict[str, str] = None):
+        self.headers = CaseInsensitiveDict(headers or {})
+        self._local = threading.local()
+
+    def _thread_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers = self.headers
+            self._local.session = session
+        return session
+
+    def get(self, url, **kwargs) -> requests.Response:
+        return self._thread_session().get(url, **kwargs)
+
 
 class NewsScraper(ABC):
     
@@ -11,6 +42,23 @@ class NewsScraper(ABC):
         """
         pass
     
+    def FetchHome(self) -> Union[bytes, str, None]:
+        """
+        Fetch half of ScrapeHome: the raw home page (or feed) as bytes, or an
+        error string. Scrapers that implement FetchHome and ParseHome get
+        fetch and parse time profiled as separate stages. The default None
+        means the scraper only offers ScrapeHome as a whole.
+        """
+        return None
+
+    def ParseHome(self, content: bytes) -> Union[List[Dict[str, str]], str]:
+        """
+        Parse half of ScrapeHome: the headlines in content returned by FetchHome.
+
+        :param content: The raw home page.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not split ScrapeHome")
+
     @abstractmethod
     def ScrapeFullText(self, url: str) -> str:
         """
@@ -28,3 +76,36 @@ class NewsScraper(ABC):
         :param url: The URL of the page to scrape.
         """
         pass
+
+    def use_session(self, session):
+        """
+        Replaces the requests.Session the scraper fetches through, e.g. with a
+        session that archives responses or replays them from a page archive.
+        Anything with get(url, **kwargs) and headers will do.
+        """
+        self._session = session
+
+    async def ScrapeHomeAsync(self, http=None) -> Union[List[Dict[str, str]], str]:
+        """
+        Async counterpart of ScrapeHome.
+        The default adapter runs the blocking ScrapeHome in the blocking pool
+        of the shared AsyncHttpService (or a default worker thread without
+        one), so every sync scraper can be driven from the event loop unchanged.
+        Native implementations fetch through the shared AsyncHttpService.
+
+        :param http: Shared AsyncHttpService.
+        """
+        if http is None:
+            return await asyncio.to_thread(self.ScrapeHome)
+        return await http.run_blocking(self.ScrapeHome)
+
+    async def ScrapeFullTextAsync(self, url: str, http=None) -> str:
+        """
+        Async counterpart of ScrapeFullText, see ScrapeHomeAsync.
+
+        :param url: The URL of the article to scrape.
+        :param http: Shared AsyncHttpService.
+        """
+        if http is None:
+            return await asyncio.to_thread(self.ScrapeFullText, url)
+        return await http.run_blocking(self.ScrapeFullText, url)
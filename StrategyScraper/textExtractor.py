@@ -0,0 +1,159 @@
+import json
+import re
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Marker usable in a step list to say where JSON-LD articleBody should be
+# tried relative to the CSS containers.
+JSONLD = "@jsonld"
+
+# tag, .class chain and at most one [attr], [attr=v] or [attr*=v]
+_SIMPLE_SELECTOR = re.compile(
+    r'^(?P<tag>[a-zA-Z][\w-]*)?(?P<classes>(?:\.[\w-]+)*)'
+    r'(?:\[(?P<attr>[\w:-]+)(?:(?P<op>\*?=)["\']?(?P<value>[^"\'\]]*)["\']?)?\])?$'
+)
+
+
+def _compile_simple(selector: str) -> Optional[Callable[[Tag], bool]]:
+    """
+    Compiles a selector made only of simple compound parts into a plain
+    predicate. soupsieve's match() builds a matcher per call, which is far
+    too slow to run on every element of a page. Returns None when the
+    selector needs soupsieve (combinators, pseudo-classes, ...).
+    """
+    checks = []
+    for part in selector.split(","):
+        m = _SIMPLE_SELECTOR.match(part.strip())
+        if not m or not (m.group("tag") or m.group("classes") or m.group("attr")):
+            return None
+        checks.append((
+            m.group("tag"),
+            [c for c in m.group("classes").split(".") if c],
+            m.group("attr"),
+            m.group("op"),
+            m.group("value"),
+        ))
+
+    def predicate(el: Tag) -> bool:
+        for tag, classes, attr, op, value in checks:
+            if tag and el.name != tag:
+                continue
+            if classes:
+                el_classes = el.get("class") or ()
+                if not all(c in el_classes for c in classes):
+                    continue
+            if attr:
+                actual = el.get(attr)
+                if actual is None:
+                    continue
+                if isinstance(actual, list):
+                    actual = " ".join(actual)
+                if op == "=" and actual != value:
+                    continue
+                if op == "*=" and value not in actual:
+                    continue
+            return True
+        return False
+
+    return predicate
+
+
+class ArticleTextExtractor:
+    """
+    Single-pass article body extraction shared by the scrapers.
+
+    The ScrapeFullText heuristics (preferred containers, <article>, JSON-LD
+    articleBody, length-filtered <p>) used to walk the soup once per step.
+    This engine visits every element exactly once, collecting in that walk:
+      - the containers matched by each CSS step
+      - the raw JSON-LD script payloads
+      - the text of every <p>, attributed to the steps whose containers hold it
+    and only then picks the first step (in priority order) that produced text.
+    """
+
+    def __init__(self, steps: Sequence[str], min_jsonld_length: int = 100,
+                 min_paragraph_length: int = 40, all_matches: bool = True):
+        """
+        :param steps: Ordered CSS container selectors, JSONLD marks the JSON-LD step.
+        :param min_jsonld_length: A JSON-LD articleBody must be longer than this.
+        :param min_paragraph_length: A <p> in the last-resort pass must be longer than this.
+        :param all_matches: Join paragraphs of every matching container (True) or
+                            only of the first one in document order (False).
+        """
+        self.steps = list(steps)
+        self.min_jsonld_length = min_jsonld_length
+        self.min_paragraph_length = min_paragraph_length
+        self.all_matches = all_matches
+        # Compiled once per extractor, indexed by step position
+        self._patterns = {
+            i: _compile_simple(step) or soupsieve.compile(step).match
+            for i, step in enumerate(self.steps) if step != JSONLD
+        }
+
+    def _walk(self, soup: BeautifulSoup):
+        """
+        One traversal of the tree. Returns (paragraphs per step, JSON-LD
+        payloads, all paragraph texts).
+        """
+        containers: Dict[int, List[int]] = {}
+        step_parts: Dict[int, List[str]] = {i: [] for i in self._patterns}
+        matched_steps = set()
+        jsonld: List[str] = []
+        paragraphs: List[str] = []
+
+        for el in soup.find_all(True):
+            for i, matches in self._patterns.items():
+                if (self.all_matches or i not in matched_steps) and matches(el):
+                    containers.setdefault(id(el), []).append(i)
+                    matched_steps.add(i)
+
+            if el.name == "script":
+                if el.get("type") == "application/ld+json" and el.string:
+                    jsonld.append(el.string)
+            elif el.name == "p":
+                txt = el.get_text(" ", strip=True)
+                if not txt:
+                    continue
+                paragraphs.append(txt)
+                # Containers are matched before their descendants, so the
+                # parent chain tells which steps own this paragraph.
+                owners = set()
+                for parent in el.parents:
+                    owners.update(containers.get(id(parent), ()))
+                for i in owners:
+                    step_parts[i].append(txt)
+
+        return step_parts, jsonld, paragraphs
+
+    def _jsonld_body(self, payloads: List[str]) -> str:
+        for payload in payloads:
+            try:
+                data = json.loads(payload)
+            except ValueError:
+                continue
+            for node in data if isinstance(data, list) else [data]:
+                if isinstance(node, dict) and node.get("@type") in ("NewsArticle", "Article"):
+                    body = node.get("articleBody")
+                    if isinstance(body, str) and len(body.strip()) > self.min_jsonld_length:
+                        return body.strip()
+        return ""
+
+    def extract(self, soup: BeautifulSoup) -> str:
+        """
+        Returns the article text chosen by the step priority, or "" when
+        nothing qualifies.
+        """
+        step_parts, jsonld, paragraphs = self._walk(soup)
+
+        for i, step in enumerate(self.steps):
+            if step == JSONLD:
+                body = self._jsonld_body(jsonld)
+                if body:
+                    return body
+            elif step_parts[i]:
+                return "\n\n".join(step_parts[i])
+
+        # Last resort: every <p> with a length filter (avoids nav, captions)
+        parts = [p for p in paragraphs if len(p) > self.min_paragraph_length]
+        return "\n\n".join(parts)
@@ -1,28 +1,42 @@
-import json
-import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
 from typing import List, Union, Dict
-from .scraper import NewsScraper
+from .scraper import NewsScraper, ThreadLocalSession
+from .textExtractor import ArticleTextExtractor, JSONLD
 
 class YahooNewsScraper(NewsScraper):
     def __init__(self, rss_url: str = "https://news.yahoo.com/rss/"):
         self.rss_url = rss_url
-        self._session = requests.Session()
+        self._session = ThreadLocalSession()
         self._session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
         })
+        self._extractor = ArticleTextExtractor(
+            ["div.caas-body", JSONLD, "article"],
+            min_jsonld_length=100,
+            min_paragraph_length=40,
+            all_matches=False,
+        )
 
     def ScrapeHome(self) -> Union[List[Dict[str, str]], str]:
         """
         Scrapes Yahoo News RSS and returns headlines with their links.
         Returns a list of dicts with 'title' and 'link'.
         """
+        content = self.FetchHome()
+        return content if isinstance(content, str) else self.ParseHome(content)
+
+    def FetchHome(self) -> Union[bytes, str]:
         try:
             resp = self._session.get(self.rss_url, timeout=20)
             if resp.status_code != 200:
                 return f"Error: Unable to fetch RSS. Status code {resp.status_code}"
+            return resp.content
+        except Exception as e:
+            return f"Error: {e}"
 
-            soup = BeautifulSoup(resp.content, "xml")
+    def ParseHome(self, content: bytes) -> Union[List[Dict[str, str]], str]:
+        try:
+            soup = BeautifulSoup(content, "xml")
 
             results: List[Dict[str, str]] = []
             for item in soup.find_all("item"):
@@ -55,53 +69,10 @@ class YahooNewsScraper(NewsScraper):
             if resp.status_code != 200:
                 return f"Error: Unable to fetch the article. Status code {resp.status_code}"
 
-            soup = BeautifulSoup(resp.content, "html.parser")
-
-            def collect_paragraphs(container: Tag) -> List[str]:
-                parts: List[str] = []
-                for p in container.find_all("p"):
-                    txt = p.get_text(" ", strip=True)
-                    if txt:
-                        parts.append(txt)
-                return parts
-
-            # 1) Yahoo CAAS body
-            caas = soup.select_one("div.caas-body") or soup.select_one('article div.caas-body')
-            if isinstance(caas, Tag):
-                parts = collect_paragraphs(caas)
-                if parts:
-                    return "\n\n".join(parts)
-
-            # 2) JSON-LD Article with articleBody
-            # Yahoo often includes structured data; try to extract a long articleBody if present.
-            for script in soup.find_all("script", type="application/ld+json"):
-                try:
-                    data = json.loads(script.string or "")
-                    # Could be a list or a single dict
-                    objs = data if isinstance(data, list) else [data]
-                    for obj in objs:
-                        if isinstance(obj, dict) and obj.get("@type") in ("NewsArticle", "Article"):
-                            body = obj.get("articleBody")
-                            if isinstance(body, str) and len(body.strip()) > 100:
-                                return body.strip()
-                except Exception:
-                    continue
-
-            # 3) Generic <article> p
-            article = soup.find("article")
-            if isinstance(article, Tag):
-                parts = collect_paragraphs(article)
-                if parts:
-                    return "\n\n".join(parts)
-
-            # 4) Last-resort: all <p>, filter very short/junk
-            parts: List[str] = []
-            for p in soup.find_all("p"):
-                txt = p.get_text(" ", strip=True)
-                if txt and len(txt) > 40:
-                    parts.append(txt)
-            if parts:
-                return "\n\n".join(parts)
+            # One walk over the DOM covers every heuristic below
+            text = self._extractor.extract(BeautifulSoup(resp.content, "html.parser"))
+            if text:
+                return text
 
             return "Error: No text content found in the article"
 
@@ -0,0 +1,22 @@
+import argparse
+from service.apiService import ApiService
+from service.sqliteService import SQLiteService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CRIMENET - read API over the crime archive")
+    parser.add_argument('--db', default='data/crimenet.db', help="SQLite database written by main.py")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    args = parser.parse_args()
+
+    print("CRIMENET - Global Crime Intelligence Engine API")
+    print("=" * 50)
+    print(f"Serving {args.db} on http://{args.host}:{args.port}")
+
+    api_service = ApiService(SQLiteService(args.db, pool_size=16, pool_timeout=5), host=args.host, port=args.port)
+    api_service.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Concurrent load test for the read API (service.apiService).
+
+Seeds a throwaway SQLite database with synthetic headlines, starts the API on
+a free port and fires mixed filtered queries from many threads, then reports
+throughput and p50/p95/p99 latency. Pass --url to hit an already running API
+instead.
+
+Usage: python -m benchmarks.apiLoadTest [--rows N] [--clients C] [--requests R] [--url URL]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+import urllib.request
+from service.apiService import ApiService
+from service.sqliteService import SQLiteService
+
+SOURCES = ['bbc', 'aljazeera', 'yahoonews', 'googlenews', 'newyorktimes']
+WORDS = ['police', 'shooting', 'fraud', 'court', 'robbery', 'arrest', 'murder', 'trial', 'gang', 'drugs']
+
+
+def seed(db: SQLiteService, rows: int):
+    rnd = random.Random(7)
+    batch = []
+    for i in range(rows):
+        day = 1 + i % 28
+        batch.append({
+            'source': SOURCES[i % len(SOURCES)],
+            'title': f"{rnd.choice(WORDS).title()} {rnd.choice(WORDS)} report {i}",
+            'url': f"https://example.com/{i}",
+            'confidence_score': round(0.75 + rnd.random() / 4, 3),
+            'scraped_at': f"2025-{1 + i % 12:02d}-{day:02d} {i % 24:02d}:00:00",
+        })
+        if len(batch) == 5000:
+            db.append_headlines(batch)
+            batch = []
+    db.append_headlines(batch)
+
+
+def random_query(rnd: random.Random) -> str:
+    params = [f"page={rnd.randint(1, 5)}", "page_size=50"]
+    if rnd.random() < 0.6:
+        params.append(f"source={rnd.choice(SOURCES)}")
+    if rnd.random() < 0.4:
+        month = rnd.randint(1, 11)
+        params.append(f"from=2025-{month:02d}-01&to=2025-{month + 1:02d}-01")
+    if rnd.random() < 0.3:
+        params.append(f"min_confidence={rnd.choice(['0.8', '0.9'])}")
+    if rnd.random() < 0.3:
+        params.append(f"q={rnd.choice(WORDS)}")
+    return "/headlines?" + "&".join(params)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(base_url: str, clients: int, requests_per_client: int):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def client(seed_value):
+        rnd = random.Random(seed_value)
+        local = []
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(base_url + random_query(rnd), timeout=30) as resp:
+                    resp.read()
+                local.append(time.perf_counter() - start)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"requests: {len(latencies)} ok, {errors[0]} failed in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} req/s)")
+    if latencies:
+        for pct in (50, 95, 99):
+            print(f"p{pct}: {percentile(latencies, pct) * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=100, help="requests per client")
+    parser.add_argument('--url', help="base URL of a running API, e.g. http://127.0.0.1:8080")
+    args = parser.parse_args()
+
+    if args.url:
+        run(args.url.rstrip('/'), args.clients, args.requests)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SQLiteService(os.path.join(tmp, 'load.db'), pool_size=16)
+        seed(db, args.rows)
+        api = ApiService(db, port=0).start()
+        try:
+            run(f"http://{api.host}:{api.port}", args.clients, args.requests)
+        finally:
+            api.stop()
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
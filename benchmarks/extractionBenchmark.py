@@ -0,0 +1,74 @@
+"""
+Benchmark for StrategyScraper.textExtractor.ArticleTextExtractor.
+
+Builds synthetic article pages where the early heuristics miss (so every
+fallback runs) and compares the single-pass engine with the old step-by-step
+extraction that re-traversed the soup per heuristic.
+
+Usage: python -m benchmarks.extractionBenchmark [pages]
+"""
+import json
+import sys
+import time
+from bs4 import BeautifulSoup
+from StrategyScraper.textExtractor import ArticleTextExtractor, JSONLD
+
+
+def build_fixture(index: int) -> str:
+    nav = "".join(f'<li><a href="/s/{i}">Section {i}</a></li>' for i in range(40))
+    body = "".join(
+        f"<div class='c'><p>Paragraph {index}-{i} " + "lorem ipsum dolor sit amet " * 4 + "</p></div>"
+        for i in range(60)
+    )
+    meta = json.dumps({"@type": "WebPage", "name": f"page {index}"})
+    return (
+        f"<html><head><script type='application/ld+json'>{meta}</script></head>"
+        f"<body><nav><ul>{nav}</ul></nav><main>{body}</main><footer><p>(c)</p></footer></body></html>"
+    )
+
+
+def multi_pass_extract(soup: BeautifulSoup) -> str:
+    """The pre-engine NYT heuristics: one traversal per step."""
+    for selector in ('section[name="articleBody"]', "article"):
+        container = soup.select_one(selector)
+        if container:
+            parts = [t for t in (p.get_text(" ", strip=True) for p in container.find_all("p")) if t]
+            if parts:
+                return "\n\n".join(parts)
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+        for node in data if isinstance(data, list) else [data]:
+            if isinstance(node, dict) and node.get("@type") in ("NewsArticle", "Article"):
+                body = node.get("articleBody")
+                if isinstance(body, str) and len(body.strip()) > 120:
+                    return body.strip()
+    parts = [t for t in (p.get_text(" ", strip=True) for p in soup.find_all("p")) if len(t) > 50]
+    return "\n\n".join(parts)
+
+
+def run(pages: int = 200):
+    soups = [BeautifulSoup(build_fixture(i), "html.parser") for i in range(pages)]
+    extractor = ArticleTextExtractor(
+        ['section[name="articleBody"]', "article", JSONLD],
+        min_jsonld_length=120, min_paragraph_length=50, all_matches=False,
+    )
+
+    start = time.perf_counter()
+    legacy = [multi_pass_extract(s) for s in soups]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [extractor.extract(s) for s in soups]
+    single_time = time.perf_counter() - start
+
+    assert legacy == single, "single-pass output differs from the multi-pass reference"
+    print(f"pages: {pages}")
+    print(f"multi-pass : {legacy_time * 1000 / pages:.3f} ms/article")
+    print(f"single-pass: {single_time * 1000 / pages:.3f} ms/article")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
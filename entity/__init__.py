@@ -0,0 +1,6 @@
+# Entity Package
+# Crime Intelligence Engine - Pipeline Records
+
+from .headlineRecord import HeadlineRecord
+
+__all__ = ['HeadlineRecord']
@@ -0,0 +1,65 @@
+import sys
+
+
+class HeadlineRecord:
+    """
+    One headline as it moves through the pipeline (scrape -> classify ->
+    full text -> store).
+
+    Uses __slots__ instead of a per-item dict and is updated in place by each
+    stage rather than copied into a new dict with renamed keys. Source names
+    are interned, so hundreds of thousands of records share one string per
+    source.
+    """
+
+    __slots__ = ('source', 'title', 'url', 'confidence_score', 'model_version',
+                 'scraped_at', 'full_text', 'content_hash')
+
+    def __init__(self, source: str, title: str, url: str, confidence_score: float = None,
+                 model_version: str = None, scraped_at: str = None, full_text: str = None,
+                 content_hash: str = None):
+        self.source = sys.intern(source) if source else 'Unknown'
+        self.title = title
+        self.url = url
+        self.confidence_score = confidence_score
+        self.model_version = model_version
+        self.scraped_at = scraped_at
+        self.full_text = full_text
+        self.content_hash = content_hash
+
+    @classmethod
+    def from_scraped(cls, item: dict, source: str, scraped_at: str = None) -> 'HeadlineRecord':
+        """
+        Builds a record from a ScrapeHome dict ({'title', 'link', ...}).
+        """
+        return cls(source, item.get('title'), item.get('link'), scraped_at=scraped_at)
+
+    @classmethod
+    def coerce(cls, item) -> 'HeadlineRecord':
+        """
+        Returns item unchanged if it is already a record, otherwise converts a
+        dict using either the scraped ('link') or stored ('url') key names.
+        """
+        if isinstance(item, cls):
+            return item
+        return cls(
+            item.get('source', 'Unknown'),
+            item.get('title'),
+            item.get('url') or item.get('link'),
+            confidence_score=item.get('confidence_score'),
+            model_version=item.get('model_version'),
+            scraped_at=item.get('scraped_at'),
+            full_text=item.get('full_text'),
+            content_hash=item.get('content_hash'),
+        )
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"HeadlineRecord(source={self.source!r}, title={self.title!r}, url={self.url!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, HeadlineRecord) and self.to_dict() == other.to_dict()
+
+    __hash__ = None
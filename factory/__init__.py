@@ -1,6 +1,7 @@
 # Factory Package
 # Crime Intelligence Engine - Factory Modules
 
-from .websiteFactory import websites
+from .websiteFactory import websites, generic_websites
+from .scraperSpecs import scraper_specs
 
-__all__ = ['websites']
+__all__ = ['websites', 'generic_websites', 'scraper_specs']
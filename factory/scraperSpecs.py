@@ -0,0 +1,59 @@
+from StrategyScraper.genericScraper import JSONLD
+
+# Per-site specs for GenericScraper. Adding a source is a new entry here;
+# see GenericScraper for the meaning of each key.
+scraper_specs = {
+    "bbc": {
+        "base_url": "https://www.bbc.com",
+        "link_selectors": ['a[data-testid="internal-link"]'],
+        "title_selectors": ['h2[data-testid="card-headline"]'],
+        "title_fallback": False,
+        # Every paragraph sits in its own text-block container
+        "body_selectors": ['div[data-component="text-block"]'],
+        "all_matches": True,
+    },
+    "aljazeera": {
+        "base_url": "https://www.aljazeera.com",
+        "link_selectors": [
+            'a.u-clickable-card__link',
+            'a[href*="/news/"]',
+            'h3 a, h2 a, h1 a',
+            'article a',
+        ],
+        "title_selectors": ['span', 'h3, h2, h1', '.gc__title, .article-title'],
+        "body_selectors": ['div.wysiwyg', 'div.article-body', 'div.post-content', '.gc__content', 'article'],
+    },
+    "yahoonews": {
+        "base_url": "https://news.yahoo.com",
+        "home_url": "https://news.yahoo.com/rss/",
+        "feed": "rss",
+        "body_selectors": ['div.caas-body', JSONLD, 'article'],
+    },
+    "googlenews": {
+        "base_url": "https://news.google.com",
+        "home_url": "https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en",
+        "feed": "rss",
+        "rss_description_link": True,
+        "body_selectors": ['article', '[itemprop="articleBody"]', JSONLD],
+        "timeout": 25,
+    },
+    "newyorktimes": {
+        "base_url": "https://www.nytimes.com",
+        "link_selectors": ['a.tpl-lbl[href]', 'h3 a[href]'],
+        "title_selectors": ['p', 'h3'],
+        "title_fallback": False,
+        "body_selectors": ['section[name="articleBody"]', 'article', JSONLD],
+        "min_jsonld_length": 120,
+        "min_paragraph_length": 50,
+        "max_items": 60,
+        "headers": {
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/124.0 Safari/537.36"
+            ),
+            "Accept-Language": "en-US,en;q=0.9",
+        },
+        "timeout": 30,
+    },
+}
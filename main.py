@@ -1,32 +1,191 @@
+import argparse
+import asyncio
+import os
+from contextlib import nullcontext
+from datetime import datetime
 from service.scrapingService import ScrapingService
 from service.logService import LogService
-from service.crimeIdentifierService import CrimeIdentifierService
+from service.languageRouterService import LanguageRouterService
+from service.modelRegistryService import ModelRegistryService
 from service.csvService import CSVService
-from factory.websiteFactory import websites
+from service.archiveService import ArchiveService
+from service.extractionService import ExtractionService
+from service.sqliteService import SQLiteService
+from service.trendService import TrendService
+from service.storyClusterService import StoryClusterService
+from service.pageArchiveService import PageArchiveService
+from service.profilingService import ProfilingService
+from service.workQueueService import WorkQueueService, SOURCE_JOB, ARTICLE_JOB
+from StrategyExtractor.ruleBasedExtractor import RuleBasedExtractor
+from StrategyExtractor.llmExtractor import LLMExtractor
+from StrategyExtractor.extractor import EXTRACTION_FIELDS
+from factory.websiteFactory import websites, generic_websites
+
+
+def build_queue(args):
+    if args.queue == 'redis':
+        import redis
+        from StrategyQueue.redisWorkQueue import RedisWorkQueue
+        return RedisWorkQueue(redis.Redis.from_url(args.redis_url))
+    from StrategyQueue.sqliteWorkQueue import SQLiteWorkQueue
+    return SQLiteWorkQueue(args.queue_path)
+
+
+def no_stage(name):
+    return nullcontext()
+
+
+def classify_and_store(data, stage=no_stage, csv_path='data/crime_news.csv', sites=websites):
+    crimeIdentifierModelPath = 'model/NBCrime.pkl'
+
+    # The registry starts out pointing at the bundled model; retrained models are registered on top
+    model_registry = ModelRegistryService('model/registry')
+    if not model_registry.versions():
+        model_registry.register(crimeIdentifierModelPath, activate=True, copy=False, notes="bundled NBCrime model")
+    with stage("classify"):
+        # Per-language models from the registry take their languages; everything else uses the active model
+        source_languages = {w["name"]: w["language"] for w in sites if w.get("language")}
+        crime_identifier = LanguageRouterService(model_registry, source_languages=source_languages)
+        crime_news = crime_identifier.filter_crime_headlines(data)
+
+    print(f"Filtered {len(crime_news)} crime-related headlines.")
+
+    sqlite_service = SQLiteService('data/crimenet.db')
+    TrendService(sqlite_service)  # keeps trend rollups current on every append
+    # The binary archive sits next to the CSV (data/crime_news.archive) for id and time-range reads, see rescore.py
+    archive = ArchiveService(os.path.splitext(csv_path)[0] + '.archive')
+    store_headlines(crime_news, sqlite_service, CSVService(csv_path), stage, archive)
+    return crime_news, sqlite_service
+
+
+def store_headlines(crime_news, sqlite_service, csv_service, stage=no_stage, archive=None):
+    # SQLite skips URLs it already holds; the CSV and archive get exactly the rows SQLite took, so all stay in sync
+    with stage("store.sqlite"):
+        new_headlines = sqlite_service.insert_new_headlines(crime_news)
+
+    with stage("store.csv"):
+        csv_service.append_headlines(new_headlines)
+
+    if archive is not None:
+        with stage("store.archive"):
+            archive.append_headlines(new_headlines)
+
+    print(f"Saved {len(new_headlines)} new crime-related headlines to SQLite and {csv_service.file_path} "
+          f"({len(crime_news) - len(new_headlines)} already stored)")
+    return new_headlines
+
+
+def build_extractor(args):
+    if args.extractor == 'llm':
+        return LLMExtractor(args.llm_endpoint, model=args.llm_model)
+    return RuleBasedExtractor()
+
+
+def extract_and_store(crime_news, sqlite_service, stage=no_stage, extractor=None):
+    # Extract who/what/where/when/how from the fetched full text
+    with stage("extract"):
+        extraction_service = ExtractionService(extractor or RuleBasedExtractor())
+        records = extraction_service.extract(crime_news)
+
+    with stage("store.articles"):
+        sqlite_service.insert_articles(crime_news)
+        sqlite_service.insert_extractions(records, EXTRACTION_FIELDS)
+
+    # Link new articles to ongoing stories across sources
+    with stage("cluster"):
+        StoryClusterService(sqlite_service).assign_pending()
+
+    print(f"Extracted structured details for {len(records)} crime articles.")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="CRIMENET pipeline")
+    parser.add_argument('--role', choices=['local', 'coordinator', 'worker'], default='local',
+                        help="local: run everything in this process; coordinator/worker: share the work through a queue")
+    parser.add_argument('--scrapers', choices=['site', 'generic'], default='site',
+                        help="site: the per-site scraper classes; generic: config-driven scrapers from factory/scraperSpecs.py")
+    parser.add_argument('--queue', choices=['sqlite', 'redis'], default='sqlite', help="work queue backend")
+    parser.add_argument('--queue-path', default='data/work_queue.db', help="SQLite work queue file")
+    parser.add_argument('--redis-url', default='redis://localhost:6379/0', help="Redis work queue URL")
+    parser.add_argument('--extractor', choices=['rules', 'llm'], default='rules',
+                        help="structured extraction backend; llm posts batches of articles to --llm-endpoint")
+    parser.add_argument('--llm-endpoint', default='http://127.0.0.1:8765/extract', help="LLM extraction endpoint")
+    parser.add_argument('--llm-model', default='local', help="model name sent to the LLM endpoint")
+    parser.add_argument('--wait-timeout', type=float, default=3600, help="coordinator: seconds to wait per stage")
+    parser.add_argument('--idle-exit', type=float, default=None, help="worker: exit after this many idle seconds")
+    parser.add_argument('--profile', choices=['cprofile', 'sample'], default=None,
+                        help="profile each stage with cProfile or the sampling profiler (folded stacks); "
+                             "sample also covers threads that were running before a stage started")
+    parser.add_argument('--profile-dir', default=None, help="profiling output directory (default profiles/<timestamp>)")
+    parser.add_argument('--profile-top', type=int, default=25, help="entries kept in the profiling text reports")
+    parser.add_argument('--no-tracemalloc', action='store_true', help="skip allocation snapshots when profiling")
+    parser.add_argument('--archive-pages', default=None, metavar='DIR',
+                        help="store every fetched page in a raw page archive")
+    parser.add_argument('--replay', default=None, metavar='DIR',
+                        help="parse pages from a raw page archive instead of the network")
+    parser.add_argument('--as-of', default=None,
+                        help="replay: use captures fetched at or before this time ('YYYY-MM-DD[ HH:MM:SS]')")
+    parser.add_argument('--replay-csv', default='data/crime_news.replay.csv',
+                        help="replay: CSV the replayed headlines are written to, instead of data/crime_news.csv")
+    args = parser.parse_args()
+
+    profiler = None
+    stage = no_stage
+    if args.profile:
+        profiler = ProfilingService(
+            args.profile_dir or f"profiles/{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+            mode=args.profile, top_n=args.profile_top, trace_malloc=not args.no_tracemalloc,
+        )
+        stage = profiler.stage
+
     print("CRIMENET - Global Crime Intelligence Engine")
     print("=" * 50)
-    
-    crimeIdentifierModelPath = 'model/NBCrime.pkl'
-    
-    scraping_service = ScrapingService(websites)
-    data = scraping_service.scrape()
-    
+
+    sites = generic_websites if args.scrapers == 'generic' else websites
+    scraping_service = ScrapingService(sites)
+    if args.replay:
+        scraping_service.use_archive(PageArchiveService(args.replay), replay=True, as_of=args.as_of)
+    elif args.archive_pages:
+        scraping_service.use_archive(PageArchiveService(args.archive_pages))
+
+    if args.role == 'worker':
+        with stage("worker"):
+            WorkQueueService(build_queue(args), sites).run_worker(idle_exit=args.idle_exit)
+        if profiler:
+            profiler.write_summary()
+        return
+
+    if args.role == 'coordinator':
+        work_queue = WorkQueueService(build_queue(args), sites)
+        with stage("scrape.queue"):
+            work_queue.enqueue_sources()
+            work_queue.wait(SOURCE_JOB, timeout=args.wait_timeout)
+            data = work_queue.collect_headlines()
+    else:
+        data = scraping_service.scrape(profiler)
+
     print(f"Scraped {len(data)} headlines from various sources.")
-    
-    crime_identifier = CrimeIdentifierService(crimeIdentifierModelPath)
-    crime_news = crime_identifier.filter_crime_headlines(data)
-    
-    print(f"Filtered {len(crime_news)} crime-related headlines.")
 
-    csv_service = CSVService('data/crime_news.csv')
-    csv_service.append_headlines(crime_news)
-    
-    print("Crime-related headlines saved to data.crime_news.csv")
-    
+    # Replayed headlines are past captures: keep them out of the live CSV (SQLite skips known URLs)
+    csv_path = args.replay_csv if args.replay else 'data/crime_news.csv'
+    crime_news, sqlite_service = classify_and_store(data, stage, csv_path, sites)
+
+    # Pull full text for crime articles
+    with stage("full_text"):
+        if args.role == 'coordinator':
+            work_queue.enqueue_articles(crime_news)
+            work_queue.wait(ARTICLE_JOB, timeout=args.wait_timeout)
+            work_queue.collect_full_text(crime_news)
+        elif args.replay:
+            scraping_service.reparse_full_text(crime_news)
+        else:
+            asyncio.run(scraping_service.scrape_full_text_async(crime_news))
+
+    extract_and_store(crime_news, sqlite_service, stage, build_extractor(args))
+
+    if profiler:
+        print(f"Profiling outputs written to {profiler.write_summary()}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,24 @@
+import argparse
+from service.csvService import CSVService, CURRENT_VERSION
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CRIMENET - migrate a headline CSV to the current schema")
+    parser.add_argument('path', nargs='?', default='data/crime_news.csv')
+    parser.add_argument('--check', action='store_true', help="only report the schema version")
+    args = parser.parse_args()
+
+    csv_service = CSVService(args.path)
+    version = csv_service.schema_version()
+    print(f"{args.path}: schema v{version} (current v{CURRENT_VERSION})")
+    if args.check:
+        return
+
+    if csv_service.migrate():
+        print(f"Migrated {args.path} to schema v{CURRENT_VERSION}")
+    else:
+        print("Nothing to migrate")
+
+
+if __name__ == "__main__":
+    main()
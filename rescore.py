@@ -0,0 +1,41 @@
+import argparse
+from service.archiveService import ArchiveService
+from service.crimeIdentifierService import CrimeIdentifierService
+from service.modelRegistryService import ModelRegistryService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CRIMENET - re-score archived headlines with a registry model")
+    parser.add_argument('start', help="first scrape time, 'YYYY-MM-DD[ HH:MM:SS]'")
+    parser.add_argument('end', help="end of the window (exclusive), 'YYYY-MM-DD[ HH:MM:SS]'")
+    parser.add_argument('--archive', default='data/crime_news.archive')
+    parser.add_argument('--registry', default='model/registry')
+    parser.add_argument('--version', help="registry version to score with (default: active)")
+    parser.add_argument('--threshold', type=float, default=0.75, help="crime confidence threshold")
+    args = parser.parse_args()
+
+    print("CRIMENET - Global Crime Intelligence Engine Re-scoring")
+    print("=" * 50)
+
+    # Only the records in the window are decoded, through the archive's time index
+    archive = ArchiveService(args.archive)
+    try:
+        headlines = list(archive.iter_time(args.start, args.end))
+    except ValueError as e:
+        print(f"Re-scoring failed: {e}")
+        return
+    print(f"{len(headlines)} archived headlines scraped in [{args.start}, {args.end})")
+    if not headlines:
+        return
+
+    crime_identifier = CrimeIdentifierService(registry=ModelRegistryService(args.registry), version=args.version)
+    previous = {record.url: record.model_version for record in headlines}
+    crime_news = crime_identifier.filter_crime_headlines(headlines, confidence_threshold=args.threshold)
+    print(f"{len(crime_news)} still crime-related under {crime_identifier.model_version} "
+          f"({len(headlines) - len(crime_news)} dropped)")
+    changed = sum(1 for record in crime_news if previous.get(record.url) != record.model_version)
+    print(f"{changed} were scored by another model version when archived")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,5 +5,18 @@ from .scrapingService import ScrapingService
 from .logService import LogService
 from .crimeIdentifierService import CrimeIdentifierService
 from .csvService import CSVService
+from .asyncHttpService import AsyncHttpService
+from .extractionService import ExtractionService
+from .sqliteService import SQLiteService
+from .apiService import ApiService
+from .trendService import TrendService
+from .modelRegistryService import ModelRegistryService
+from .trainingService import TrainingService
+from .archiveService import ArchiveService
+from .workQueueService import WorkQueueService
+from .profilingService import ProfilingService
+from .storyClusterService import StoryClusterService
+from .pageArchiveService import PageArchiveService
+from .languageRouterService import LanguageRouterService
 
-__all__ = ['ScrapingService', 'LogService', 'CrimeIdentifierService', 'CSVService']
+__all__ = ['ScrapingService', 'LogService', 'CrimeIdentifierService', 'CSVService', 'AsyncHttpService', 'ExtractionService', 'SQLiteService', 'ApiService', 'TrendService', 'ModelRegistryService', 'TrainingService', 'ArchiveService', 'WorkQueueService', 'ProfilingService', 'StoryClusterService', 'PageArchiveService', 'LanguageRouterService']
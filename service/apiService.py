@@ -0,0 +1,224 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from .logService import LogService
+from .sqliteService import SQLiteService
+
+
+class _ApiHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections under concurrent load and
+    # shows up as 1s SYN-retry spikes in tail latency.
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class ApiService:
+    def __init__(self, sqlite_service: SQLiteService, host: str = '127.0.0.1', port: int = 8080,
+                 cache_size: int = 1024, cache_ttl: float = 60, max_page_size: int = 500):
+        """
+        Read-only HTTP API for filtered search over stored headlines.
+
+        Endpoints:
+          GET /headlines         paginated JSON page
+          GET /headlines/stream  every matching row as NDJSON, chunked
+          GET /health
+        Filters (query string): source, from, to, min_confidence, q,
+        plus page and page_size for /headlines.
+
+        Recent pages are kept in an in-memory LRU cache. Entries are keyed on
+        the store's data_version as well as the query, so any insert or update
+        of headlines (a new scrape, rescoring, clustering) makes them miss
+        instead of serving stale rows.
+
+        Requests that find the connection pool exhausted (give the store a
+        pool_timeout) are answered 503 instead of queueing indefinitely.
+
+        :param sqlite_service: Store to read from.
+        :param cache_size: Maximum number of cached pages.
+        :param cache_ttl: Seconds a cached page stays valid.
+        :param max_page_size: Upper bound on page_size.
+        """
+        self.db = sqlite_service
+        self.host = host
+        self.port = port
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.max_page_size = max_page_size
+        self.logger = LogService()
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._httpd = None
+
+    # ---------- query handling
+
+    @staticmethod
+    def _first(params: dict, name: str, default=None):
+        values = params.get(name)
+        return values[0] if values else default
+
+    def _timestamp(self, params: dict, name: str):
+        """
+        A 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS' bound, the forms scraped_at compares against.
+        """
+        value = self._first(params, name)
+        if value is None:
+            return None
+        for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d'):
+            try:
+                datetime.strptime(value, fmt)
+                return value
+            except ValueError:
+                continue
+        raise ValueError(f"{name} must be 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS', got {value!r}")
+
+    def parse_filters(self, params: dict) -> dict:
+        """
+        Converts query-string params into SQLiteService filter kwargs.
+        Raises ValueError on malformed numbers or dates.
+        """
+        min_confidence = self._first(params, 'min_confidence')
+        return {
+            'source': self._first(params, 'source'),
+            'start': self._timestamp(params, 'from'),
+            'end': self._timestamp(params, 'to'),
+            'min_confidence': float(min_confidence) if min_confidence is not None else None,
+            'keyword': self._first(params, 'q'),
+        }
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key, value):
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def search(self, params: dict) -> bytes:
+        """
+        Serves one page of results as encoded JSON, from the hot cache when possible.
+        """
+        filters = self.parse_filters(params)
+        page = max(int(self._first(params, 'page', 1)), 1)
+        page_size = min(max(int(self._first(params, 'page_size', 50)), 1), self.max_page_size)
+
+        # One pooled connection and one snapshot for both the version check and the query
+        with self.db.read_snapshot() as conn:
+            key = (self.db.data_version(conn), page, page_size, tuple(sorted(filters.items())))
+            body = self._cache_get(key)
+            if body is None:
+                rows = self.db.query_headlines(**filters, limit=page_size, offset=(page - 1) * page_size, conn=conn)
+                body = json.dumps({'page': page, 'page_size': page_size, 'results': rows}).encode('utf-8')
+                self._cache_put(key, body)
+        return body
+
+    # ---------- server
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _send(self, status: int, body: bytes, content_type: str = 'application/json'):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _stream(self, params: dict):
+                rows = api.db.iter_headlines(**api.parse_filters(params))
+                try:
+                    # Run the query before committing to a 200, so its errors still get a proper status
+                    first = next(rows, None)
+                except Exception:
+                    rows.close()
+                    raise
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/x-ndjson')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                try:
+                    batch = [] if first is None else [json.dumps(first)]
+                    for row in rows:
+                        batch.append(json.dumps(row))
+                        if len(batch) == 200:
+                            self._chunk(('\n'.join(batch) + '\n').encode('utf-8'))
+                            batch = []
+                    if batch:
+                        self._chunk(('\n'.join(batch) + '\n').encode('utf-8'))
+                    self.wfile.write(b'0\r\n\r\n')
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+                except Exception as e:
+                    # The status line is already out: end the response by dropping
+                    # the connection, leaving the chunked body visibly incomplete
+                    api.logger.log(f"API error while streaming {self.path}: {str(e)}")
+                    self.close_connection = True
+                finally:
+                    rows.close()
+
+            def _chunk(self, data: bytes):
+                self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b'\r\n')
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                try:
+                    if url.path == '/headlines':
+                        self._send(200, api.search(params))
+                    elif url.path == '/headlines/stream':
+                        self._stream(params)
+                    elif url.path == '/health':
+                        self._send(200, b'{"status": "ok"}')
+                    else:
+                        self._send(404, b'{"error": "not found"}')
+                except ValueError as e:
+                    self._send(400, json.dumps({'error': str(e)}).encode('utf-8'))
+                except TimeoutError:
+                    self._send(503, b'{"error": "server busy, retry later"}')
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                except Exception as e:
+                    api.logger.log(f"API error on {self.path}: {str(e)}")
+                    self._send(500, b'{"error": "internal error"}')
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """
+        Starts serving in a background thread and returns self.
+        """
+        self._httpd = _ApiHTTPServer((self.host, self.port), self._handler())
+        self.port = self._httpd.server_address[1]
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        self.logger.log(f"API listening on http://{self.host}:{self.port}")
+        return self
+
+    def serve_forever(self):
+        self._httpd = _ApiHTTPServer((self.host, self.port), self._handler())
+        self.logger.log(f"API listening on http://{self.host}:{self.port}")
+        self._httpd.serve_forever()
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
@@ -0,0 +1,314 @@
+import heapq
+import json
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime
+from .logService import LogService
+from entity.headlineRecord import HeadlineRecord
+
+# Data file: records of [u32 payload length][UTF-8 JSON payload]
+LENGTH = struct.Struct('<I')
+# Index file: one fixed-width entry per record id: [u64 offset][u32 length][f64 timestamp]
+INDEX_ENTRY = struct.Struct('<QId')
+# Time index file: [f64 timestamp][u64 id] per record, sorted by (timestamp, id)
+TIME_ENTRY = struct.Struct('<dQ')
+
+
+class ArchiveService:
+    def __init__(self, file_path: str = 'data/crime_news.archive'):
+        """
+        Append-only binary headline archive with an offset/timestamp index.
+
+        Records are length-prefixed JSON in file_path; the sidecar
+        file_path + '.idx' holds a fixed-width entry per record, so record id
+        N lives at index offset N * INDEX_ENTRY.size. A second sidecar,
+        file_path + '.tidx', lists (scraped_at, id) sorted by time. All files
+        are read through mmap: lookups by id are O(1), time ranges are a
+        binary search over the time index, and slices return memoryviews into
+        the mapping without copying or parsing anything outside the range.
+
+        Records appended in scraped_at order only append to the time index.
+        A batch reaching back before the latest archived time is merged into
+        it instead (one rewrite of the time index, logged), so time ranges
+        stay exact whatever order headlines arrive in. Readers remap when the
+        indexes change, so they see records appended by other instances or
+        processes.
+
+        Offers the same create_with_headers / append_headlines interface as CSVService.
+
+        :param file_path: Path of the data file.
+        """
+        self.file_path = file_path
+        self.index_path = file_path + '.idx'
+        self.time_index_path = file_path + '.tidx'
+        self.logger = LogService()
+        self._lock = threading.Lock()
+        self._maps = None
+        self._signature = None
+
+    # ---------- writing
+
+    def create_with_headers(self):
+        """
+        Creates empty data and index files if they don't exist.
+        """
+        for path in (self.file_path, self.index_path):
+            if not os.path.exists(path):
+                open(path, 'wb').close()
+        if not os.path.exists(self.time_index_path):
+            # Archives written before the time index: build it from the id index
+            with open(self.index_path, 'rb') as index:
+                entries = sorted(
+                    (timestamp, record_id)
+                    for record_id, (_, _, timestamp) in enumerate(INDEX_ENTRY.iter_unpack(index.read()))
+                )
+            self._write_time_index(entries)
+
+    def _write_time_index(self, entries):
+        # Write aside and rename, so readers only ever map a complete, sorted file
+        tmp_path = self.time_index_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(TIME_ENTRY.pack(timestamp, record_id) for timestamp, record_id in entries))
+        os.replace(tmp_path, self.time_index_path)
+
+    @staticmethod
+    def _timestamp(scraped_at: str) -> float:
+        """
+        Index time of a record; records without a parseable scraped_at are stamped with the append time.
+        """
+        if scraped_at:
+            try:
+                return datetime.strptime(scraped_at, '%Y-%m-%d %H:%M:%S').timestamp()
+            except ValueError:
+                pass
+        return datetime.now().timestamp()
+
+    @staticmethod
+    def _bound(value: str) -> float:
+        """
+        Timestamp of a query bound, 'YYYY-MM-DD HH:MM:SS' or 'YYYY-MM-DD'
+        (midnight). Raises ValueError on anything else.
+        """
+        for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d'):
+            try:
+                return datetime.strptime(value.strip(), fmt).timestamp()
+            except ValueError:
+                continue
+        raise ValueError(f"Unrecognised archive time bound: {value!r}")
+
+    def append_headlines(self, headlines: list) -> range:
+        """
+        Appends headlines to the archive.
+
+        :param headlines: List of HeadlineRecords (or dictionaries with 'source', 'title', 'url', and 'confidence_score').
+        :return: The ids assigned to the new records.
+        """
+        self.create_with_headers()
+        with self._lock:
+            with open(self.file_path, 'ab') as data, open(self.index_path, 'ab') as index:
+                offset = data.tell()
+                first_id = index.tell() // INDEX_ENTRY.size
+                data_parts, index_parts, times = [], [], []
+                for record_id, record in enumerate(map(HeadlineRecord.coerce, headlines), first_id):
+                    row = record.to_dict()
+                    row.pop('full_text', None)
+                    payload = json.dumps(row, separators=(',', ':')).encode('utf-8')
+                    timestamp = self._timestamp(record.scraped_at)
+                    data_parts.append(LENGTH.pack(len(payload)) + payload)
+                    index_parts.append(INDEX_ENTRY.pack(offset + LENGTH.size, len(payload), timestamp))
+                    times.append((timestamp, record_id))
+                    offset += LENGTH.size + len(payload)
+                # Data first, index second: a reader never sees an index entry before its bytes
+                data.write(b''.join(data_parts))
+                data.flush()
+                index.write(b''.join(index_parts))
+            if times:
+                self._index_times(sorted(times))
+            self._close_maps()
+        return range(first_id, first_id + len(index_parts))
+
+    def _index_times(self, times: list):
+        """
+        Adds sorted (timestamp, id) pairs to the time index: appended when they
+        all follow the latest indexed time, merged in otherwise.
+        """
+        with open(self.time_index_path, 'a+b') as f:
+            size = f.tell()
+            latest = None
+            if size:
+                latest = TIME_ENTRY.unpack(os.pread(f.fileno(), TIME_ENTRY.size, size - TIME_ENTRY.size))[0]
+            if latest is None or times[0][0] >= latest:
+                f.write(b''.join(TIME_ENTRY.pack(timestamp, record_id) for timestamp, record_id in times))
+                return
+        with open(self.time_index_path, 'rb') as f:
+            existing = f.read()
+        late = sum(1 for timestamp, _ in times if timestamp < latest)
+        self._write_time_index(heapq.merge(TIME_ENTRY.iter_unpack(existing), times))
+        self.logger.log(f"Merged {late} out-of-order headlines into the archive time index")
+
+    # ---------- reading
+
+    def _close_maps(self):
+        self._signature = None
+        if self._maps is not None:
+            for m in self._maps:
+                try:
+                    if m is not None:
+                        m.close()
+                except BufferError:
+                    # A caller still holds a slice; the old mapping lives until it is released
+                    pass
+            self._maps = None
+
+    def _stat_signature(self):
+        # The id index grows on every append; the time index grows or is replaced
+        signature = []
+        for path in (self.index_path, self.time_index_path):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_size, stat.st_ino))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _mapped(self):
+        """
+        Returns (data map, index map, time index map), remapping whenever an
+        index changed (appends from this or any other writer). None maps for
+        an empty archive.
+        """
+        signature = self._stat_signature()
+        if self._maps is None or signature != self._signature:
+            self._close_maps()
+            self.create_with_headers()
+            signature = self._stat_signature()
+            maps = {}
+            # Index first: its writer flushes the data before the entries, so a
+            # data map taken after the index map covers every entry it holds
+            for path in (self.index_path, self.file_path, self.time_index_path):
+                with open(path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    maps[path] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            self._maps = (maps[self.file_path], maps[self.index_path], maps[self.time_index_path])
+            self._signature = signature
+        return self._maps
+
+    def __len__(self) -> int:
+        _, index, _ = self._mapped()
+        return len(index) // INDEX_ENTRY.size if index is not None else 0
+
+    def _entry(self, record_id: int):
+        # Callers check the id against len(self), which refreshes the mapping
+        return INDEX_ENTRY.unpack_from(self._maps[1], record_id * INDEX_ENTRY.size)
+
+    def raw(self, record_id: int) -> memoryview:
+        """
+        Zero-copy view of one record's JSON payload.
+        """
+        if not 0 <= record_id < len(self):
+            raise IndexError(f"Archive record {record_id} out of range")
+        data, _, _ = self._mapped()
+        offset, length, _ = self._entry(record_id)
+        return memoryview(data)[offset:offset + length]
+
+    def get(self, record_id: int) -> HeadlineRecord:
+        """
+        Decodes one record by id.
+        """
+        return HeadlineRecord.coerce(json.loads(bytes(self.raw(record_id))))
+
+    def slice_ids(self, start: int, stop: int) -> memoryview:
+        """
+        Zero-copy view over the data of records [start, stop): consecutive
+        length-prefixed payloads, decodable with iter_payloads().
+        """
+        start, stop = max(start, 0), min(stop, len(self))
+        if start >= stop:
+            return memoryview(b'')
+        data, _, _ = self._mapped()
+        first_offset = self._entry(start)[0] - LENGTH.size
+        last_offset, last_length, _ = self._entry(stop - 1)
+        return memoryview(data)[first_offset:last_offset + last_length]
+
+    @staticmethod
+    def _bisect_time(times, count: int, timestamp: float) -> int:
+        """
+        Position of the first time index entry whose timestamp is >= timestamp.
+        """
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if TIME_ENTRY.unpack_from(times, mid * TIME_ENTRY.size)[0] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def ids_for_time(self, start: str, end: str) -> list:
+        """
+        Ids, ascending, of the records scraped in [start, end) ('YYYY-MM-DD
+        HH:MM:SS' or 'YYYY-MM-DD'), by binary search over the time index.
+        Raises ValueError on an unparseable bound.
+        """
+        start, end = self._bound(start), self._bound(end)
+        count = len(self)
+        _, _, times = self._mapped()
+        if times is None:
+            return []
+        entries = len(times) // TIME_ENTRY.size
+        lo, hi = self._bisect_time(times, entries, start), self._bisect_time(times, entries, end)
+        window = memoryview(times)[lo * TIME_ENTRY.size:hi * TIME_ENTRY.size]
+        try:
+            # The time index may be mapped a little ahead of the id index
+            return sorted(record_id for _, record_id in TIME_ENTRY.iter_unpack(window) if record_id < count)
+        finally:
+            window.release()
+
+    def slice_time(self, start: str, end: str) -> list:
+        """
+        Zero-copy views over the records scraped in [start, end), one per run
+        of consecutive ids: a single view unless records were appended out of
+        time order. Each view decodes with iter_payloads()/iter_records().
+        """
+        views = []
+        run_start = previous = None
+        for record_id in self.ids_for_time(start, end):
+            if previous is None or record_id != previous + 1:
+                if previous is not None:
+                    views.append(self.slice_ids(run_start, previous + 1))
+                run_start = record_id
+            previous = record_id
+        if previous is not None:
+            views.append(self.slice_ids(run_start, previous + 1))
+        return views
+
+    def iter_time(self, start: str, end: str):
+        """
+        Decodes the records scraped in [start, end), in id order, one at a time.
+        """
+        for view in self.slice_time(start, end):
+            yield from self.iter_records(view)
+
+    @staticmethod
+    def iter_payloads(view: memoryview):
+        """
+        Yields each record payload (memoryview) of a slice_ids/slice_time view.
+        """
+        position = 0
+        while position < len(view):
+            (length,) = LENGTH.unpack_from(view, position)
+            position += LENGTH.size
+            yield view[position:position + length]
+            position += length
+
+    def iter_records(self, view: memoryview):
+        """
+        Decodes a slice into HeadlineRecords, one at a time.
+        """
+        for payload in self.iter_payloads(view):
+            yield HeadlineRecord.coerce(json.loads(bytes(payload)))
+
+    def close(self):
+        self._close_maps()
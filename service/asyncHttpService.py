@@ -0,0 +1,108 @@
+import asyncio
+import aiohttp
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+
+class AsyncHttpService:
+    def __init__(self, max_connections: int = 200, max_per_host: int = 20,
+                 timeout: float = 30, parse_executor: Optional[Executor] = None,
+                 parse_workers: int = 4, blocking_workers: Optional[int] = None, archive=None):
+        """
+        Shared async HTTP client plus worker pools for parsing and blocking calls.
+
+        One instance is handed to every async scraper so all fetches go through
+        a single aiohttp connection pool, and BeautifulSoup parsing runs in
+        parse_executor instead of on the event loop. Sync scrapers driven
+        through the async adapters run in a dedicated blocking pool sized to
+        the concurrency wanted, rather than asyncio's default executor, which
+        is capped at min(32, cpu + 4) threads.
+
+        Owned pools are created on open() and shut down on close(), so an
+        instance can be reopened.
+
+        :param max_connections: Total open connections across all hosts.
+        :param max_per_host: Open connections per host, keeps us polite to each site.
+        :param timeout: Total timeout per request in seconds.
+        :param parse_executor: Executor for parse work; defaults to a thread pool.
+                               Pass a ProcessPoolExecutor when the parse callables
+                               are picklable and parsing dominates.
+        :param parse_workers: Size of the default thread pool.
+        :param blocking_workers: Threads for blocking scraper calls; defaults to max_connections.
+        :param archive: Optional PageArchiveService every fetched response is stored in.
+        """
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._owns_executor = parse_executor is None
+        self.parse_workers = parse_workers
+        self.parse_executor = parse_executor
+        self.blocking_workers = blocking_workers or max_connections
+        self.blocking_executor: Optional[ThreadPoolExecutor] = None
+        self.archive = archive
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _open_executors(self):
+        if self.parse_executor is None:
+            self.parse_executor = ThreadPoolExecutor(max_workers=self.parse_workers)
+        if self.blocking_executor is None:
+            self.blocking_executor = ThreadPoolExecutor(max_workers=self.blocking_workers,
+                                                        thread_name_prefix='scrape-blocking')
+
+    async def open(self):
+        self._open_executors()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_per_host)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._owns_executor and self.parse_executor is not None:
+            self.parse_executor.shutdown(wait=False)
+            self.parse_executor = None
+        if self.blocking_executor is not None:
+            self.blocking_executor.shutdown(wait=False)
+            self.blocking_executor = None
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        """
+        Fetches a URL through the shared pool.
+
+        :param headers: Request headers, e.g. the scraper's own User-Agent.
+        :param timeout: Total timeout in seconds for this request; defaults to the pool's.
+        :return: tuple (status_code, body bytes)
+        """
+        await self.open()
+        kwargs = {'timeout': aiohttp.ClientTimeout(total=timeout)} if timeout is not None else {}
+        async with self._session.get(url, headers=headers, **kwargs) as resp:
+            body = await resp.read()
+        if self.archive is not None:
+            await self.run_blocking(self.archive.store, url, resp.status,
+                                    resp.headers.get('Content-Type', ''), body, str(resp.url))
+        return resp.status, body
+
+    async def parse(self, fn, *args):
+        """
+        Runs a blocking parse function in the worker pool.
+        """
+        self._open_executors()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_executor, fn, *args)
+
+    async def run_blocking(self, fn, *args):
+        """
+        Runs a blocking call (e.g. a sync scraper's ScrapeHome) in the blocking pool.
+        """
+        self._open_executors()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.blocking_executor, fn, *args)
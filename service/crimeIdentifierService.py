@@ -1,21 +1,158 @@
+import json
+import os
+import threading
+import time
 import joblib
 import pandas as pd
 from .logService import LogService
+from .modelRegistryService import ModelRegistryService
+from entity.headlineRecord import HeadlineRecord
 
 class CrimeIdentifierService:
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str = None, registry: ModelRegistryService = None, version: str = None,
+                 shadow_versions: list = None):
         """
         Initializes the CrimeIdentifierService class.
 
         :param model_path: The path to the saved Naive Bayes model (.pkl file).
+        :param registry: Model registry to load from instead of model_path.
+        :param version: Registry version to load; defaults to the active one.
+        :param shadow_versions: Registry versions scored alongside the primary model for comparison.
         """
         # Initialize logging service
         self.logger = LogService()
-        
-        # Load the pre-trained Naive Bayes model (pipeline)
-        self.logger.log(f"Loading crime identification model from: {model_path}")
-        self.model = joblib.load(model_path)
-        self.logger.log("Crime identification model loaded successfully")
+        self.registry = registry
+        self._swap_lock = threading.Lock()
+        self._registry_mtime = None
+        self._shadows = []
+        self._stats_lock = threading.Lock()
+        self.model_stats = {}
+
+        if registry is not None:
+            self._registry_mtime = registry.manifest_mtime()
+            self.swap_model(version=version)
+        else:
+            # Load the pre-trained Naive Bayes model (pipeline)
+            self.logger.log(f"Loading crime identification model from: {model_path}")
+            model = joblib.load(model_path)
+            checksum = ModelRegistryService.checksum(model_path)[:12]
+            self._active = (model, f"{os.path.basename(model_path)}@{checksum}")
+            self.logger.log("Crime identification model loaded successfully")
+
+        for shadow_version in shadow_versions or []:
+            self.add_shadow_model(version=shadow_version)
+
+    @property
+    def model(self):
+        return self._active[0]
+
+    @property
+    def model_version(self) -> str:
+        return self._active[1]
+
+    def swap_model(self, version: str = None):
+        """
+        Loads a registry version (default: active) and swaps it in atomically.
+        The (model, version) pair is replaced with a single assignment, so a
+        batch that already took its snapshot finishes on the old model while
+        new batches pick up the new one; nothing is dropped.
+
+        :param version: Registry version to load.
+        """
+        if self.registry is None:
+            raise ValueError("swap_model needs a model registry")
+        with self._swap_lock:
+            model, loaded_version = self.registry.load(version)
+            self._active = (model, loaded_version)
+        self.logger.log(f"Crime identification model {loaded_version} is now active")
+
+    def refresh_from_registry(self) -> bool:
+        """
+        Cheap poll for long-running processes: swaps to the registry's active
+        version if the manifest changed since the last check.
+
+        :return: True if a new model was swapped in.
+        """
+        if self.registry is None:
+            return False
+        mtime = self.registry.manifest_mtime()
+        if mtime == self._registry_mtime:
+            return False
+        self._registry_mtime = mtime
+        active = self.registry.active_version()
+        if active is None or active == self.model_version:
+            return False
+        self.swap_model(active)
+        return True
+
+    def add_shadow_model(self, version: str = None, model_path: str = None):
+        """
+        Adds a shadow model. Shadows score every batch the primary model scores,
+        but only feed the comparison report; they never change the output.
+
+        :param version: Registry version of the shadow model.
+        :param model_path: Path to a .pkl model, instead of a registry version.
+        """
+        if model_path is not None:
+            model = joblib.load(model_path)
+            version = f"{os.path.basename(model_path)}@{ModelRegistryService.checksum(model_path)[:12]}"
+        elif self.registry is not None:
+            model, version = self.registry.load(version)
+        else:
+            raise ValueError("add_shadow_model needs a registry version or a model_path")
+        self._shadows.append((model, version))
+        self.logger.log(f"Added shadow crime identification model {version}")
+
+    def _record_stats(self, version: str, role: str, seconds: float, is_crime: list, primary: list = None):
+        with self._stats_lock:
+            stats = self.model_stats.setdefault(version, {
+                'role': role, 'batches': 0, 'headlines': 0, 'seconds': 0.0, 'crime': 0, 'agreements': 0,
+            })
+            stats['batches'] += 1
+            stats['headlines'] += len(is_crime)
+            stats['seconds'] += seconds
+            stats['crime'] += sum(is_crime)
+            reference = primary if primary is not None else is_crime
+            stats['agreements'] += sum(a == b for a, b in zip(is_crime, reference))
+
+    def _score_shadows(self, titles: list, primary: list, confidence_threshold: float):
+        """
+        Scores the batch with every shadow model and records latency and agreement with the primary.
+        """
+        for model, version in self._shadows:
+            start = time.perf_counter()
+            probabilities = self._crime_probabilities(model, titles)
+            elapsed = time.perf_counter() - start
+            is_crime = [p > confidence_threshold for p in probabilities]
+            self._record_stats(version, 'shadow', elapsed, is_crime, primary)
+
+    def comparison_report(self) -> dict:
+        """
+        Per-model comparison of everything scored so far: throughput, latency,
+        crime rate and agreement with the primary model.
+        """
+        report = {}
+        with self._stats_lock:
+            for version, stats in self.model_stats.items():
+                headlines = stats['headlines'] or 1
+                report[version] = {
+                    'role': stats['role'],
+                    'batches': stats['batches'],
+                    'headlines': stats['headlines'],
+                    'headlines_per_second': round(stats['headlines'] / stats['seconds'], 1) if stats['seconds'] else None,
+                    'mean_batch_latency_ms': round(stats['seconds'] * 1000 / max(stats['batches'], 1), 3),
+                    'crime_rate': round(stats['crime'] / headlines, 4),
+                    'agreement_with_primary': round(stats['agreements'] / headlines, 4),
+                }
+        return report
+
+    def write_comparison_report(self, path: str):
+        """
+        Writes comparison_report() as JSON.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.comparison_report(), f, indent=2)
+        self.logger.log(f"Model comparison report written to {path}")
 
     def preprocess(self, text):
         """
@@ -34,24 +171,45 @@ class CrimeIdentifierService:
         :param confidence_threshold: Minimum confidence score required for crime classification.
         :return: tuple (is_crime: bool, confidence_score: float)
         """
-        # Preprocess the title
-        processed_title = self.preprocess(title)
-        
+        model, _ = self._active
+        return self._classify_batch(model, [title], confidence_threshold)[0]
+
+    def _crime_probabilities(self, model, titles: list) -> list:
+        """
+        Crime-class probability for each title, from one predict_proba call.
+        """
         # Since the model is a pipeline that includes the vectorizer,
         # we pass the raw text directly to the model
-        prediction_proba = self.model.predict_proba([processed_title])
-        
+        prediction_proba = model.predict_proba([self.preprocess(title) for title in titles])
+
         # Get the probability for crime class (class 1)
-        crime_probability = prediction_proba[0][1] if len(prediction_proba[0]) > 1 else 0.0
-        
-        # Only classify as crime if confidence is above threshold
-        is_crime = crime_probability > confidence_threshold
-        
-        classification = "crime-related" if is_crime else "non-crime"
-        confidence_str = f"(confidence: {crime_probability:.3f})"
-        self.logger.log(f"Classified headline as {classification} {confidence_str}: '{title}'")
-        
-        return is_crime, crime_probability
+        return [float(proba[1]) if len(proba) > 1 else 0.0 for proba in prediction_proba]
+
+    def _label(self, titles: list, probabilities: list, confidence_threshold: float):
+        """
+        Applies the confidence threshold and logs each decision.
+
+        :return: List of tuples (is_crime, confidence_score), in input order.
+        """
+        results = []
+        for title, crime_probability in zip(titles, probabilities):
+            # Only classify as crime if confidence is above threshold
+            is_crime = crime_probability > confidence_threshold
+
+            classification = "crime-related" if is_crime else "non-crime"
+            confidence_str = f"(confidence: {crime_probability:.3f})"
+            self.logger.log(f"Classified headline as {classification} {confidence_str}: '{title}'")
+            results.append((is_crime, crime_probability))
+
+        return results
+
+    def _classify_batch(self, model, titles: list, confidence_threshold: float):
+        """
+        Scores a batch of titles with one predict_proba call on the given model.
+
+        :return: List of tuples (is_crime, confidence_score), in input order.
+        """
+        return self._label(titles, self._crime_probabilities(model, titles), confidence_threshold)
 
     def classify(self, title: str, confidence_threshold: float = 0.75):
         """
@@ -68,38 +226,40 @@ class CrimeIdentifierService:
         """
         Filters the headlines to return only crime-related news with high confidence.
         
-        :param headlines_dict: List of dictionaries with {'title': <headline>, 'link': <URL>, 'source': <source>}
+        :param headlines_dict: List of HeadlineRecords (dicts with {'title', 'link', 'source'} are converted)
         :param confidence_threshold: Minimum confidence score required for crime classification.
-        :return: List of dictionaries with only high-confidence crime-related headlines including confidence scores.
+        :return: The high-confidence crime-related records, updated in place with their confidence
+                 score and the version of the model that scored them.
         """
         self.logger.log(f"Starting crime headline filtering process for {len(headlines_dict)} headlines with confidence threshold {confidence_threshold}")
         
         crime_news = []
-        skipped_count = 0
-        
-        # Loop through each headline and classify it
-        for data in headlines_dict:
-            title = data.get('title')
-            link = data.get('link')
-            source = data.get('source', 'Unknown')
-            
-            # Skip if title or link is missing
-            if not title or not link:
-                skipped_count += 1
-                continue
-            
-            # Classify the headline with confidence threshold
-            is_crime, confidence_score = self.classify_with_confidence(title, confidence_threshold)
-            
-            if is_crime:  # Only include high-confidence crime headlines
-                crime_news.append({
-                    'source': source,
-                    'title': title,
-                    'url': link,
-                    'confidence_score': round(confidence_score, 3)
-                })
-        
-        self.logger.log(f"Crime filtering completed: {len(crime_news)} high-confidence crime headlines found, {skipped_count} headlines skipped due to missing data")
+
+        # Skip if title or link is missing
+        records = [HeadlineRecord.coerce(data) for data in headlines_dict]
+        valid = [record for record in records if record.title and record.url]
+        skipped_count = len(records) - len(valid)
+
+        # One snapshot per batch: a concurrent swap_model() never splits a batch across models
+        model, model_version = self._active
+
+        if valid:
+            titles = [record.title for record in valid]
+            start = time.perf_counter()
+            probabilities = self._crime_probabilities(model, titles)
+            elapsed = time.perf_counter() - start
+            scores = self._label(titles, probabilities, confidence_threshold)
+            if self._shadows:
+                primary = [is_crime for is_crime, _ in scores]
+                self._record_stats(model_version, 'primary', elapsed, primary)
+                self._score_shadows(titles, primary, confidence_threshold)
+            for record, (is_crime, confidence_score) in zip(valid, scores):
+                if is_crime:  # Only include high-confidence crime headlines
+                    record.confidence_score = round(confidence_score, 3)
+                    record.model_version = model_version
+                    crime_news.append(record)
+
+        self.logger.log(f"Crime filtering completed with model {model_version}: {len(crime_news)} high-confidence crime headlines found, {skipped_count} headlines skipped due to missing data")
         
         return crime_news
 
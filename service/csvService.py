@@ -1,26 +1,176 @@
-import pandas as pd
+import csv
 import os
+import pandas as pd
+from .logService import LogService
+from entity.headlineRecord import HeadlineRecord
+
+# Header of every schema version the headline CSV has had
+SCHEMAS = {
+    1: ['source', 'title', 'url', 'Confidence'],
+    2: ['source', 'title', 'url', 'confidence_score'],
+    3: ['source', 'title', 'url', 'confidence_score', 'model_version', 'scraped_at'],
+}
+CURRENT_VERSION = max(SCHEMAS)
+
+# Older column names and what they became
+RENAMES = {'Confidence': 'confidence_score'}
+
+DTYPES = {
+    'source': 'category',
+    'title': 'string',
+    'url': 'string',
+    'confidence_score': 'float32',
+    'model_version': 'string',
+    'scraped_at': 'string',
+}
+
 
 class CSVService:
     def __init__(self, file_path: str):
+        """
+        Headline CSV with a versioned column schema.
+
+        The version is recognised from the header row (see SCHEMAS). Files in
+        an older layout are migrated to CURRENT_VERSION before anything is
+        appended, so rows never end up under the wrong header. Reads go
+        through iter_chunks, which streams typed DataFrames of fixed size.
+
+        :param file_path: Path of the CSV file.
+        """
         self.file_path = file_path
+        self.logger = LogService()
+
+    def schema_version(self):
+        """
+        Schema version of the file, None if it doesn't exist or is empty.
+        Raises ValueError on a header matching no known version.
+        """
+        if not os.path.exists(self.file_path):
+            return None
+        with open(self.file_path, 'r', newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), None)
+        if not header:
+            return None
+        for version, columns in SCHEMAS.items():
+            if header == columns:
+                return version
+        raise ValueError(f"Unrecognised CSV header in {self.file_path}: {header}")
 
     def create_with_headers(self):
         """
         Creates a new CSV file with headers if it doesn't exist.
         """
-        if not os.path.exists(self.file_path):
-            df = pd.DataFrame(columns=['source', 'title', 'url', 'confidence_score'])
-            df.to_csv(self.file_path, index=False)
+        if self.schema_version() is None:
+            with open(self.file_path, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerow(SCHEMAS[CURRENT_VERSION])
+
+    def migrate(self) -> bool:
+        """
+        Rewrites the file in the current schema, streaming row by row into a
+        temporary file that then replaces the original, so memory use does not
+        depend on the file size and an interrupted run leaves the original intact.
+
+        :return: True if the file was migrated, False if it was already current.
+        """
+        version = self.schema_version()
+        if version is None or version == CURRENT_VERSION:
+            return False
+
+        target = SCHEMAS[CURRENT_VERSION]
+        source_columns = [RENAMES.get(column, column) for column in SCHEMAS[version]]
+        positions = [source_columns.index(column) if column in source_columns else None for column in target]
 
-    def append_headlines(self, headlines: list[dict]):
+        tmp_path = self.file_path + '.migrating'
+        rows = 0
+        with open(self.file_path, 'r', newline='', encoding='utf-8') as src, \
+                open(tmp_path, 'w', newline='', encoding='utf-8') as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            next(reader)
+            writer.writerow(target)
+            for row in reader:
+                writer.writerow(['' if i is None or i >= len(row) else row[i] for i in positions])
+                rows += 1
+        os.replace(tmp_path, self.file_path)
+        self.logger.log(f"Migrated {self.file_path} from schema v{version} to v{CURRENT_VERSION} ({rows} rows)")
+        return True
+
+    def append_headlines(self, headlines: list):
         """
         Appends a list of headlines to the CSV file.
 
-        :param headlines: List of dictionaries with 'source', 'title', 'url', and 'confidence_score'.
+        :param headlines: List of HeadlineRecords (or dictionaries with 'source', 'title', 'url', and 'confidence_score').
+        """
+        # Bring the file to the current schema (or create it) before appending
+        self.migrate()
+        self.create_with_headers()
+
+        records = [HeadlineRecord.coerce(h) for h in headlines]
+        # Build columns straight from the records, no intermediate dict per row
+        df = pd.DataFrame({
+            'source': [r.source for r in records],
+            'title': [r.title for r in records],
+            'url': [r.url for r in records],
+            'confidence_score': [r.confidence_score for r in records],
+            'model_version': [r.model_version for r in records],
+            'scraped_at': [r.scraped_at for r in records],
+        }, columns=SCHEMAS[CURRENT_VERSION])
+        df.to_csv(self.file_path, mode='a', header=False, index=False)
+
+    def sources(self, chunk_size: int = 50000) -> list:
         """
-        # Create file with headers if it doesn't exist
-        file_exists = os.path.exists(self.file_path)
-        
-        df = pd.DataFrame(headlines, columns=['source', 'title', 'url', 'confidence_score'])
-        df.to_csv(self.file_path, mode='a', header=not file_exists, index=False)
\ No newline at end of file
+        Sorted distinct source names in the file, from one streaming pass over
+        the source column.
+
+        :param chunk_size: Rows per chunk.
+        """
+        if self.schema_version() is None:
+            return []
+        names = set()
+        with pd.read_csv(self.file_path, usecols=['source'], dtype={'source': 'string'},
+                         chunksize=chunk_size) as reader:
+            for chunk in reader:
+                names.update(chunk['source'].dropna().unique())
+        return sorted(names)
+
+    def iter_chunks(self, chunk_size: int = 50000, columns: list = None, sources: list = None):
+        """
+        Streams the file as typed DataFrames of at most chunk_size rows, in the
+        current schema whatever version the file is in, so analytics over
+        archives larger than memory run in constant memory.
+
+        source is read with one fixed CategoricalDtype, so every chunk shares
+        the same categories and pd.concat of the chunks stays categorical.
+
+        :param chunk_size: Rows per chunk.
+        :param columns: Subset of current-schema columns to load.
+        :param sources: Categories of the source column; other names read as NA.
+                        Defaults to every source in the file (an extra pass over that column).
+        """
+        version = self.schema_version()
+        if version is None:
+            return
+        file_columns = SCHEMAS[version]
+        wanted = columns or SCHEMAS[CURRENT_VERSION]
+        unknown = set(wanted) - set(SCHEMAS[CURRENT_VERSION])
+        if unknown:
+            raise ValueError(f"Unknown columns {sorted(unknown)}")
+
+        renamed = {column: RENAMES.get(column, column) for column in file_columns}
+        usecols = [column for column in file_columns if renamed[column] in wanted]
+        dtypes = dict(DTYPES)
+        if 'source' in wanted:
+            dtypes['source'] = pd.CategoricalDtype(sorted(sources) if sources is not None else self.sources(chunk_size))
+        # source is read as text and cast per chunk, once names outside the categories are masked
+        dtype = {column: 'string' if renamed[column] == 'source' else dtypes[renamed[column]] for column in usecols}
+        with pd.read_csv(self.file_path, usecols=usecols, dtype=dtype, chunksize=chunk_size) as reader:
+            for chunk in reader:
+                chunk = chunk.rename(columns=renamed)
+                if 'source' in chunk.columns:
+                    source = chunk['source']
+                    chunk['source'] = source.where(source.isin(dtypes['source'].categories)).astype(dtypes['source'])
+                # Columns the file's schema predates come back empty
+                for column in wanted:
+                    if column not in chunk.columns:
+                        chunk[column] = pd.Series(pd.NA, index=chunk.index, dtype=dtypes[column])
+                yield chunk[wanted]
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .logService import LogService
+from StrategyExtractor.extractor import CrimeExtractor, EXTRACTION_FIELDS
+from entity.headlineRecord import HeadlineRecord
+
+
+class ExtractionService:
+    def __init__(self, extractor: CrimeExtractor, cache_path: str = 'data/extraction_cache.jsonl',
+                 output_path: str = 'data/crime_extractions.jsonl', batch_size: int = 16,
+                 max_concurrency: int = 4):
+        """
+        Turns full article text into structured who/what/where/when/how records.
+
+        Extraction is the most expensive per-article step, so articles are
+        deduplicated and looked up in a cache keyed by extractor and content
+        hash first; only misses are sent to the extractor, in batches of
+        batch_size with at most max_concurrency batches in flight.
+
+        :param extractor: Backend implementing CrimeExtractor.ExtractBatch.
+        :param cache_path: Append-only JSONL cache of previous extractions.
+        :param output_path: JSONL file the structured records are appended to.
+        :param batch_size: Number of texts per ExtractBatch call.
+        :param max_concurrency: Maximum number of batches in flight.
+        """
+        self.logger = LogService()
+        self.extractor = extractor
+        self.cache_path = cache_path
+        self.output_path = output_path
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self.cache = self._load_cache()
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _cache_key(self, digest: str) -> str:
+        return f"{self.extractor.name}:{digest}"
+
+    def _load_cache(self) -> dict:
+        cache = {}
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        cache[entry['key']] = entry['result']
+                    except (ValueError, KeyError):
+                        continue
+        return cache
+
+    def _store_in_cache(self, entries: list):
+        with self._lock:
+            with open(self.cache_path, 'a', encoding='utf-8') as f:
+                for key, result in entries:
+                    self.cache[key] = result
+                    f.write(json.dumps({'key': key, 'result': result}) + '\n')
+
+    def _run_batch(self, batch: list):
+        """
+        Extracts one batch of (key, text) pairs and caches the results.
+        """
+        results = self.extractor.ExtractBatch([text for _, text in batch])
+        self._store_in_cache([(key, result) for (key, _), result in zip(batch, results)])
+
+    def extract(self, articles: list) -> list:
+        """
+        Extracts structured records for articles that carry full text.
+
+        :param articles: List of HeadlineRecords (or dictionaries) carrying full_text.
+        :return: List of structured records, one per article with usable text.
+        """
+        usable = [
+            a for a in map(HeadlineRecord.coerce, articles)
+            if isinstance(a.full_text, str) and a.full_text.strip() and not a.full_text.startswith("Error")
+        ]
+        self.logger.log(f"Starting extraction for {len(usable)} articles ({len(articles) - len(usable)} without usable text)")
+
+        keyed = []
+        for article in usable:
+            article.content_hash = article.content_hash or self.content_hash(article.full_text)
+            keyed.append((article, article.content_hash))
+
+        # Deduplicate by content and skip anything already cached
+        pending = {}
+        for article, digest in keyed:
+            key = self._cache_key(digest)
+            if key not in self.cache and key not in pending:
+                pending[key] = article.full_text
+
+        items = list(pending.items())
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        self.logger.log(f"Extraction cache: {len(usable) - len(items)} hits, {len(items)} misses in {len(batches)} batches")
+
+        failed = 0
+        if batches:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                for future in [pool.submit(self._run_batch, batch) for batch in batches]:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed += 1
+                        self.logger.log(f"Extraction batch failed: {str(e)}")
+
+        records = []
+        for article, digest in keyed:
+            result = self.cache.get(self._cache_key(digest))
+            if result is None:
+                continue
+            record = {
+                'source': article.source,
+                'title': article.title,
+                'url': article.url,
+                'content_hash': digest,
+                'extractor': self.extractor.name,
+            }
+            record.update({field: result.get(field, []) for field in EXTRACTION_FIELDS})
+            records.append(record)
+
+        self.write_records(records)
+        self.logger.log(f"Extraction completed: {len(records)} records written, {failed} batches failed")
+        return records
+
+    def write_records(self, records: list):
+        """
+        Appends structured records to the output JSONL file.
+        """
+        if not records:
+            return
+        with open(self.output_path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
@@ -0,0 +1,249 @@
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from .crimeIdentifierService import CrimeIdentifierService
+from .modelRegistryService import ModelRegistryService
+from entity.headlineRecord import HeadlineRecord
+
+# Non-Latin scripts identify the language (or a close default) on their own
+SCRIPTS = [
+    ('ar', re.compile(r'[\u0600-\u06FF]')),
+    ('ru', re.compile(r'[\u0400-\u04FF]')),
+    ('el', re.compile(r'[\u0370-\u03FF]')),
+    ('he', re.compile(r'[\u0590-\u05FF]')),
+    ('hi', re.compile(r'[\u0900-\u097F]')),
+    ('ja', re.compile(r'[\u3040-\u30FF]')),
+    ('ko', re.compile(r'[\uAC00-\uD7AF]')),
+    ('zh', re.compile(r'[\u4E00-\u9FFF]')),
+]
+NON_LATIN = re.compile('|'.join(pattern.pattern for _, pattern in SCRIPTS))
+
+# Latin-script languages are told apart by their most frequent function words
+STOPWORDS = {
+    'en': "the of and to in a is for on with as by at from after over says his her was are be",
+    'es': "el la los las de del y en un una por para con que se su al es tras sobre",
+    'pt': "o a os as de do da dos das e em um uma por para com que se no na ao após",
+    'fr': "le la les de des du et en un une pour par avec que qui dans sur au aux est après",
+    'de': "der die das den dem des und in ein eine zu mit von für auf ist im nach bei nicht",
+    'it': "il lo la i gli le di del della e in un una per con che su al dopo è",
+    'nl': "de het een en van in op voor met is niet dat bij na door naar",
+}
+STOPWORDS = {language: frozenset(words.split()) for language, words in STOPWORDS.items()}
+WORD = re.compile(r"[^\W\d_]+")
+
+
+class LanguageRouterService(CrimeIdentifierService):
+    def __init__(self, registry: ModelRegistryService, version: str = None, default_language: str = 'en',
+                 language_versions: dict = None, source_languages: dict = None,
+                 memory_budget_mb: float = 512, shadow_versions: list = None):
+        """
+        Routes headlines to per-language crime classifiers.
+
+        Each batch is language-identified first (script ranges, then
+        stopword counts for Latin-script titles), grouped by language and
+        scored with one predict_proba call per group. Languages without a
+        model of their own fall back to the primary model, so they cost
+        neither memory nor an extra model call.
+
+        Per-language models are registry versions tagged with a 'language'
+        in their metadata (see TrainingService.update_from_csv). They are
+        loaded on first use and kept in an LRU cache. Artifact sizes count
+        against memory_budget_mb, and the least recently used models are
+        evicted once the budget is exceeded. The primary model stays resident.
+
+        The primary model and the language -> version routes are swapped
+        together as one snapshot: swap_model() and refresh_from_registry()
+        re-resolve the routes from the registry (unless pinned with
+        language_versions), so a newly registered language model is picked up
+        without a restart, and every batch is scored against a single snapshot.
+        Shadow models score the whole batch against the routed decisions.
+
+        :param registry: Model registry holding the primary and per-language models.
+        :param version: Primary model version; defaults to the active one.
+        :param default_language: Language of the primary model and of undetectable titles.
+        :param language_versions: Language -> registry version, pinned; defaults to
+                                  the latest version per language in the registry.
+                                  Raises ValueError if it routes default_language
+                                  to another model than the primary.
+        :param source_languages: Source name -> language for single-language
+                                 sources, which then skip detection.
+        :param memory_budget_mb: Budget for cached per-language models.
+        :param shadow_versions: Registry versions scored alongside for comparison.
+        """
+        self.default_language = default_language
+        self.pinned_versions = dict(language_versions) if language_versions is not None else None
+        self.source_languages = source_languages or {}
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self._models = OrderedDict()  # version -> (model, size in bytes)
+        self._models_lock = threading.Lock()
+        self.language_counts = defaultdict(int)
+        super().__init__(registry=registry, version=version, shadow_versions=shadow_versions)
+
+    @property
+    def language_versions(self) -> dict:
+        return dict(self._snapshot[1])
+
+    def _routes(self, primary_version: str) -> dict:
+        """
+        Language -> version routes for a primary model, from the pinned
+        mapping or the registry's latest version per language.
+        """
+        pinned = self.pinned_versions is not None
+        routes = dict(self.pinned_versions if pinned else self.registry.language_versions())
+        default = routes.pop(self.default_language, None)
+        if default is not None and default != primary_version:
+            message = (f"{self.default_language} is routed to {default} but the primary model is "
+                       f"{primary_version}; {self.default_language} headlines use the primary model")
+            if pinned:
+                raise ValueError(message)
+            self.logger.log(f"Warning: {message}")
+        return routes
+
+    def swap_model(self, version: str = None):
+        """
+        Loads a registry version (default: active) as the primary model and
+        re-resolves the per-language routes, publishing both as one snapshot.
+        """
+        with self._swap_lock:
+            model, loaded_version = self.registry.load(version)
+            routes = self._routes(loaded_version)
+            self._active = (model, loaded_version)
+            self._snapshot = (self._active, routes)
+        self.logger.log(f"Crime identification model {loaded_version} is now active, "
+                        f"language models: {routes or 'none'}")
+
+    def refresh_from_registry(self) -> bool:
+        """
+        Cheap poll for long-running processes: on a manifest change, swaps to
+        the active version and picks up newly registered language models.
+
+        :return: True if the primary model or any route changed.
+        """
+        mtime = self.registry.manifest_mtime()
+        if mtime == self._registry_mtime:
+            return False
+        self._registry_mtime = mtime
+        active = self.registry.active_version() or self.model_version
+        (_, current), routes = self._snapshot
+        if active == current and self._routes(current) == routes:
+            return False
+        self.swap_model(active)
+        return True
+
+    # ---------- language identification
+
+    def detect_language(self, title: str) -> str:
+        if NON_LATIN.search(title):
+            for language, pattern in SCRIPTS:
+                if pattern.search(title):
+                    return language
+        words = WORD.findall(title.lower())
+        best, best_hits = self.default_language, 0
+        for language, stopwords in STOPWORDS.items():
+            hits = sum(word in stopwords for word in words)
+            if hits > best_hits:
+                best, best_hits = language, hits
+        return best
+
+    def detect_languages(self, records: list) -> list:
+        """
+        Language of each record, from its source when known, else from its title.
+        """
+        return [
+            self.source_languages.get(record.source) or self.detect_language(record.title)
+            for record in records
+        ]
+
+    # ---------- per-language models
+
+    def _model_size(self, version: str) -> int:
+        try:
+            return os.path.getsize(self.registry.versions()[version]['path'])
+        except (KeyError, OSError):
+            return 0
+
+    def _language_model(self, language: str, snapshot):
+        """
+        Model and version scoring a language in a routing snapshot: its own
+        (loaded lazily, LRU cached) or the snapshot's primary model.
+        """
+        active, routes = snapshot
+        version = routes.get(language)
+        if version is None:
+            return active
+        with self._models_lock:
+            cached = self._models.get(version)
+            if cached is not None:
+                self._models.move_to_end(version)
+                return cached[0], version
+
+        model, version = self.registry.load(version)
+        size = self._model_size(version)
+        with self._models_lock:
+            self._models[version] = (model, size)
+            self._models.move_to_end(version)
+            # Callers keep their own reference, so evicting never breaks a batch in flight
+            while len(self._models) > 1 and sum(s for _, s in self._models.values()) > self.memory_budget:
+                evicted, _ = self._models.popitem(last=False)
+                self.logger.log(f"Evicted {evicted} from the language model cache")
+        self.logger.log(f"Loaded {language} crime identification model {version}")
+        return model, version
+
+    def cached_models(self) -> list:
+        with self._models_lock:
+            return list(self._models)
+
+    # ---------- classification
+
+    def filter_crime_headlines(self, headlines_dict: list, confidence_threshold: float = 0.75):
+        """
+        Filters the headlines to return only crime-related news with high
+        confidence, scoring each language group with its own model.
+
+        :param headlines_dict: List of HeadlineRecords (dicts with {'title', 'link', 'source'} are converted)
+        :param confidence_threshold: Minimum confidence score required for crime classification.
+        :return: The high-confidence crime-related records, in input order, updated in place
+                 with their confidence score and the version of the model that scored them.
+        """
+        self.logger.log(f"Starting routed crime headline filtering for {len(headlines_dict)} headlines with confidence threshold {confidence_threshold}")
+
+        records = [HeadlineRecord.coerce(data) for data in headlines_dict]
+        valid = [record for record in records if record.title and record.url]
+        skipped_count = len(records) - len(valid)
+
+        groups = defaultdict(list)
+        for index, language in enumerate(self.detect_languages(valid)):
+            groups[language].append(index)
+
+        # One snapshot per batch: a concurrent swap never splits a batch across model versions
+        snapshot = self._snapshot
+
+        # Languages sharing a model (e.g. all falling back to the primary) are scored together
+        by_model = {}
+        for language, indices in groups.items():
+            self.language_counts[language] += len(indices)
+            model, version = self._language_model(language, snapshot)
+            by_model.setdefault(version, (model, []))[1].extend(indices)
+
+        decisions = [False] * len(valid)
+        for version, (model, indices) in by_model.items():
+            indices.sort()
+            titles = [valid[i].title for i in indices]
+            start = time.perf_counter()
+            probabilities = self._crime_probabilities(model, titles)
+            self._record_stats(version, 'routed', time.perf_counter() - start,
+                               [p > confidence_threshold for p in probabilities])
+            for index, (is_crime, confidence_score) in zip(indices, self._label(titles, probabilities, confidence_threshold)):
+                if is_crime:
+                    valid[index].confidence_score = round(confidence_score, 3)
+                    valid[index].model_version = version
+                    decisions[index] = True
+
+        if self._shadows and valid:
+            self._score_shadows([record.title for record in valid], decisions, confidence_threshold)
+
+        crime_news = [record for record, is_crime in zip(valid, decisions) if is_crime]
+        self.logger.log(f"Routed crime filtering completed across {len(groups)} languages and {len(by_model)} models: {len(crime_news)} high-confidence crime headlines found, {skipped_count} headlines skipped due to missing data")
+        return crime_news
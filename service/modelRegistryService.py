@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+import joblib
+from .logService import LogService
+
+
+class ModelRegistryService:
+    def __init__(self, registry_dir: str = 'model/registry'):
+        """
+        Versioned registry of crime classifier artifacts.
+
+        The manifest (registry.json) records every version with its artifact
+        path, SHA-256 checksum and creation time, plus which version is active.
+        It is always rewritten atomically, so a resident process polling it
+        sees either the old or the new state, never a partial one.
+
+        :param registry_dir: Directory holding registry.json and copied artifacts.
+        """
+        self.registry_dir = registry_dir
+        self.manifest_path = os.path.join(registry_dir, 'registry.json')
+        self.logger = LogService()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def checksum(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _read(self) -> dict:
+        if not os.path.exists(self.manifest_path):
+            return {'active': None, 'versions': {}}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write(self, manifest: dict):
+        os.makedirs(self.registry_dir, exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def manifest_mtime(self) -> float:
+        """
+        Modification time of the manifest, a cheap change marker for pollers.
+        """
+        try:
+            return os.path.getmtime(self.manifest_path)
+        except OSError:
+            return 0.0
+
+    def versions(self) -> dict:
+        return self._read()['versions']
+
+    def active_version(self):
+        return self._read()['active']
+
+    def language_versions(self) -> dict:
+        """
+        Latest registered version per language, for versions whose metadata
+        names a 'language' (per-language models used by LanguageRouterService).
+        """
+        latest = {}
+        for version, entry in self.versions().items():
+            language = entry.get('metadata', {}).get('language')
+            if language and (language not in latest or entry['created_at'] >= latest[language][0]):
+                latest[language] = (entry['created_at'], version)
+        return {language: version for language, (_, version) in latest.items()}
+
+    def register(self, artifact_path: str, version: str = None, activate: bool = False,
+                 copy: bool = True, notes: str = '', metadata: dict = None) -> str:
+        """
+        Adds an artifact to the registry.
+
+        :param artifact_path: Path to a joblib-pickled model (pipeline).
+        :param version: Version name; defaults to the next 'vN'.
+        :param activate: Make this the active version.
+        :param copy: Copy the artifact into the registry (True) or reference it in place.
+        :param notes: Free-form description stored in the manifest.
+        :param metadata: Extra JSON-serialisable details, e.g. training provenance.
+        :return: The registered version name.
+        """
+        with self._lock:
+            manifest = self._read()
+            version = version or f"v{len(manifest['versions']) + 1}"
+            if version in manifest['versions']:
+                raise ValueError(f"Model version {version} is already registered")
+
+            path = artifact_path
+            if copy:
+                os.makedirs(self.registry_dir, exist_ok=True)
+                path = os.path.join(self.registry_dir, f"{version}.pkl")
+                shutil.copyfile(artifact_path, path)
+
+            manifest['versions'][version] = {
+                'path': path,
+                'sha256': self.checksum(path),
+                'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'notes': notes,
+                'metadata': metadata or {},
+            }
+            if activate or manifest['active'] is None:
+                manifest['active'] = version
+            self._write(manifest)
+
+        self.logger.log(f"Registered model {version} from {artifact_path}")
+        return version
+
+    def register_model(self, model, version: str = None, activate: bool = False, notes: str = '',
+                       metadata: dict = None) -> str:
+        """
+        Dumps an in-memory model into the registry and registers it.
+        """
+        os.makedirs(self.registry_dir, exist_ok=True)
+        tmp_path = os.path.join(self.registry_dir, f".pending-{os.getpid()}-{threading.get_ident()}.pkl")
+        joblib.dump(model, tmp_path)
+        try:
+            return self.register(tmp_path, version=version, activate=activate, notes=notes, metadata=metadata)
+        finally:
+            os.remove(tmp_path)
+
+    def activate(self, version: str):
+        """
+        Marks a registered version as active.
+        """
+        with self._lock:
+            manifest = self._read()
+            if version not in manifest['versions']:
+                raise ValueError(f"Unknown model version {version}")
+            manifest['active'] = version
+            self._write(manifest)
+        self.logger.log(f"Activated model {version}")
+
+    def load(self, version: str = None):
+        """
+        Loads a model after verifying its checksum.
+
+        :param version: Version to load; defaults to the active one.
+        :return: tuple (model, version)
+        """
+        manifest = self._read()
+        version = version or manifest['active']
+        if version is None or version not in manifest['versions']:
+            raise ValueError(f"Unknown model version {version}")
+
+        entry = manifest['versions'][version]
+        actual = self.checksum(entry['path'])
+        if actual != entry['sha256']:
+            raise ValueError(f"Checksum mismatch for model {version}: expected {entry['sha256']}, got {actual}")
+        return joblib.load(entry['path']), version
@@ -0,0 +1,299 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from .logService import LogService
+
+
+class PageArchiveService:
+    def __init__(self, archive_dir: str = 'data/pages', segment_size: int = 256 * 1024 * 1024):
+        """
+        Append-only archive of raw fetched pages, in the spirit of WARC.
+
+        Each distinct body is stored once, keyed by its SHA-256, as one gzip
+        member (a JSON header line, then the raw bytes) appended to a segment
+        file. Members can be read on their own from (segment, offset, length),
+        and a segment can still be read in full with any gzip reader.
+        Every fetch appends one line to index.jsonl: url, fetch time, status,
+        content type, hash and location. A capture whose body is already
+        stored only adds an index line.
+
+        Each process writes its own segment files and appends index lines
+        with single O_APPEND writes, so scraping workers can share one archive
+        directory.
+
+        :param archive_dir: Directory holding the segments and index.jsonl.
+        :param segment_size: Bytes after which a new segment is started.
+        """
+        self.archive_dir = archive_dir
+        self.index_path = os.path.join(archive_dir, 'index.jsonl')
+        self.segment_size = segment_size
+        self.logger = LogService()
+        self._lock = threading.Lock()
+        self._captures = {}   # url -> list of index entries, oldest first
+        self._blobs = {}      # sha256 -> (segment, offset, length)
+        self._index_offset = 0
+        self._segment = None
+        os.makedirs(archive_dir, exist_ok=True)
+        self.refresh()
+
+    def __getstate__(self):
+        # Locks and open segments stay with the process that created them
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        state['_segment'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # ---------- index
+
+    def _add(self, entry: dict):
+        self._captures.setdefault(entry['url'], []).append(entry)
+        self._blobs.setdefault(entry['sha256'], (entry['segment'], entry['offset'], entry['length']))
+
+    def refresh(self):
+        """
+        Loads index lines appended since the last call (e.g. by other workers).
+        """
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'rb') as f:
+            f.seek(self._index_offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # a line still being written
+                self._index_offset += len(line)
+                try:
+                    self._add(json.loads(line))
+                except ValueError:
+                    continue
+
+    def urls(self) -> list:
+        return list(self._captures)
+
+    @staticmethod
+    def normalise_as_of(as_of: str = None) -> Optional[str]:
+        """
+        as_of as a comparable 'YYYY-MM-DD HH:MM:SS'; a date alone means the end
+        of that day. Raises ValueError on anything else.
+        """
+        if as_of is None:
+            return None
+        as_of = as_of.strip()
+        for fmt, suffix in (('%Y-%m-%d %H:%M:%S', ''), ('%Y-%m-%d', ' 23:59:59')):
+            try:
+                datetime.strptime(as_of, fmt)
+                return as_of + suffix
+            except ValueError:
+                continue
+        raise ValueError(f"Unrecognised as_of time: {as_of!r}")
+
+    def lookup(self, url: str, as_of: str = None) -> Optional[dict]:
+        """
+        Latest capture of a URL, or the latest one fetched at or before as_of
+        ('YYYY-MM-DD HH:MM:SS', or 'YYYY-MM-DD' for the end of that day).
+        """
+        if as_of is not None and len(as_of) != 19:
+            as_of = self.normalise_as_of(as_of)
+        for entry in reversed(self._captures.get(url, ())):
+            if as_of is None or entry['fetched_at'] <= as_of:
+                return entry
+        return None
+
+    # ---------- writing
+
+    def _open_segment(self):
+        if self._segment is None or self._segment.tell() >= self.segment_size:
+            if self._segment is not None:
+                self._segment.close()
+            name = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{socket.gethostname()}-{os.getpid()}.warc.gz"
+            self._segment = open(os.path.join(self.archive_dir, name), 'ab')
+        return self._segment
+
+    def store(self, url: str, status: int, content_type: str, body: bytes, final_url: str = None) -> str:
+        """
+        Archives one fetched response.
+
+        :return: SHA-256 of the body.
+        """
+        body = body or b''
+        digest = hashlib.sha256(body).hexdigest()
+        fetched_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            location = self._blobs.get(digest)
+            if location is None:
+                header = json.dumps({'sha256': digest, 'url': url, 'fetched_at': fetched_at,
+                                     'content_type': content_type, 'length': len(body)})
+                member = gzip.compress(header.encode('utf-8') + b'\n' + body)
+                segment = self._open_segment()
+                offset = segment.tell()
+                segment.write(member)
+                segment.flush()
+                location = (os.path.basename(segment.name), offset, len(member))
+
+            entry = {'url': url, 'final_url': final_url or url, 'fetched_at': fetched_at, 'status': status,
+                     'content_type': content_type, 'sha256': digest,
+                     'segment': location[0], 'offset': location[1], 'length': location[2]}
+            fd = os.open(self.index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, (json.dumps(entry) + '\n').encode('utf-8'))
+            finally:
+                os.close(fd)
+            self._add(entry)
+        return digest
+
+    def close(self):
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+    # ---------- reading
+
+    def read(self, entry: dict) -> bytes:
+        """
+        Body bytes of an index entry, verified against its hash.
+        """
+        with open(os.path.join(self.archive_dir, entry['segment']), 'rb') as f:
+            member = os.pread(f.fileno(), entry['length'], entry['offset'])
+        _, body = gzip.decompress(member).split(b'\n', 1)
+        if hashlib.sha256(body).hexdigest() != entry['sha256']:
+            raise ValueError(f"Archived body for {entry['url']} does not match its hash")
+        return body
+
+    def response(self, url: str, as_of: str = None) -> requests.Response:
+        """
+        Rebuilds a requests.Response for url from the archive; a 404 if it was never captured.
+        """
+        return self.entry_response(url, self.lookup(url, as_of))
+
+    def entry_response(self, url: str, entry: Optional[dict]) -> requests.Response:
+        """
+        requests.Response for an index entry (a 404 for None).
+        """
+        resp = requests.Response()
+        resp.url = url
+        if entry is None:
+            resp.status_code = 404
+            resp.reason = 'Not in page archive'
+            resp._content = b''
+            return resp
+        resp.status_code = entry['status']
+        resp.reason = 'OK' if entry['status'] == 200 else 'Archived'
+        resp.headers = CaseInsensitiveDict({'Content-Type': entry['content_type'] or ''})
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp._content = self.read(entry)
+        return resp
+
+    # ---------- session adapters
+
+    def recording_session(self, session: requests.Session) -> 'ArchivingSession':
+        return ArchivingSession(self, session)
+
+    def replay_session(self, as_of: str = None) -> 'ReplaySession':
+        return ReplaySession(self, as_of)
+
+    def replay_http(self, as_of: str = None, parse_workers: int = 4,
+                    blocking_workers: int = 32) -> 'ReplayHttpService':
+        return ReplayHttpService(self, as_of, parse_workers, blocking_workers)
+
+
+class ArchivingSession:
+    """
+    Wraps a scraper's requests.Session and archives every response it fetches.
+    """
+
+    def __init__(self, archive: PageArchiveService, session: requests.Session):
+        self.archive = archive
+        self.session = session
+
+    @property
+    def headers(self):
+        return self.session.headers
+
+    def get(self, url, **kwargs) -> requests.Response:
+        resp = self.session.get(url, **kwargs)
+        self.archive.store(url, resp.status_code, resp.headers.get('Content-Type', ''), resp.content, resp.url)
+        return resp
+
+
+class ReplaySession:
+    """
+    Stand-in for a scraper's requests.Session that answers from the archive, without network.
+    fetched_at is the capture time of the last archived page it served.
+    """
+
+    def __init__(self, archive: PageArchiveService, as_of: str = None):
+        self.archive = archive
+        self.as_of = archive.normalise_as_of(as_of)
+        self.headers = CaseInsensitiveDict()
+        self.fetched_at = None
+
+    def get(self, url, **kwargs) -> requests.Response:
+        entry = self.archive.lookup(url, self.as_of)
+        if entry is not None:
+            self.fetched_at = entry['fetched_at']
+        return self.archive.entry_response(url, entry)
+
+
+class ReplayHttpService:
+    """
+    AsyncHttpService counterpart serving get() from the archive, for the async scraping paths.
+    """
+
+    def __init__(self, archive: PageArchiveService, as_of: str = None, parse_workers: int = 4,
+                 blocking_workers: int = 32):
+        self.archive = archive
+        self.as_of = archive.normalise_as_of(as_of)
+        self.parse_workers = parse_workers
+        self.blocking_workers = blocking_workers
+        self.parse_executor = None
+        self.blocking_executor = None
+
+    async def __aenter__(self):
+        self._open_executors()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _open_executors(self):
+        if self.parse_executor is None:
+            self.parse_executor = ThreadPoolExecutor(max_workers=self.parse_workers)
+        if self.blocking_executor is None:
+            self.blocking_executor = ThreadPoolExecutor(max_workers=self.blocking_workers)
+
+    async def close(self):
+        for executor in (self.parse_executor, self.blocking_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self.parse_executor = self.blocking_executor = None
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        entry = self.archive.lookup(url, self.as_of)
+        if entry is None:
+            return 404, b''
+        return entry['status'], await self.run_blocking(self.archive.read, entry)
+
+    async def parse(self, fn, *args):
+        self._open_executors()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_executor, fn, *args)
+
+    async def run_blocking(self, fn, *args):
+        self._open_executors()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.blocking_executor, fn, *args)
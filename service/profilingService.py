@@ -0,0 +1,237 @@
+import cProfile
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from .logService import LogService
+
+MODES = ('cprofile', 'sample')
+
+
+class _Sampler:
+    """
+    Wall-clock sampling profiler: a background thread records the Python
+    stack of every other thread each interval seconds and counts identical
+    stacks. Unlike cProfile it adds no per-call overhead and sees time spent
+    blocked in I/O, which is where scrapers spend most of theirs.
+    """
+
+    def __init__(self, label, interval: float = 0.005):
+        self.label = label
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self.label(frame.f_code.co_filename, frame.f_code.co_name))
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+class ProfilingService:
+    def __init__(self, output_dir: str, mode: str = 'cprofile', top_n: int = 25,
+                 sample_interval: float = 0.005, trace_malloc: bool = True):
+        """
+        Per-stage profiling of a pipeline run.
+
+        Each stage(name) section gets its own profile: cProfile stats (.pstats
+        plus a text top-N by cumulative time) or, in 'sample' mode, folded
+        stacks ready for flamegraph.pl / speedscope. With trace_malloc every
+        stage also records the top-N allocation sites it added and its peak
+        traced memory.
+
+        cProfile only sees the thread that enables it, so in 'cprofile' mode
+        every thread started during a stage (executor and asyncio.to_thread
+        workers, the scraper blocking pool) gets a profiler of its own through
+        threading.setprofile, merged into the stage's stats. Threads that were
+        already running when the stage began are not covered; 'sample' mode
+        sees every thread and is the better fit for I/O-bound async stages
+        such as full_text.
+
+        Outputs are written to be diffed between runs (diff -r run1 run2):
+        one file per stage with a stable name, source paths relative to the
+        repo or site-packages, no addresses, and sorted lines where the
+        order carries no information.
+
+        :param output_dir: Directory for this run's outputs.
+        :param mode: 'cprofile' or 'sample'.
+        :param top_n: Entries kept in the text reports.
+        :param sample_interval: Seconds between samples in 'sample' mode.
+        :param trace_malloc: Record tracemalloc snapshots per stage.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode {mode}, expected one of {MODES}")
+        self.output_dir = output_dir
+        self.mode = mode
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+        self.trace_malloc = trace_malloc
+        self.logger = LogService()
+        self.summary = {}
+        self._active = None
+        self._thread_profilers = []
+        self._thread_profilers_lock = threading.Lock()
+        self._roots = sorted({os.path.abspath(os.getcwd())} | {
+            os.path.abspath(p) for p in sys.path if p and os.path.isdir(p)
+        }, key=len, reverse=True)
+        os.makedirs(output_dir, exist_ok=True)
+        if trace_malloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    # ---------- normalisation
+
+    def _path(self, filename: str) -> str:
+        """
+        Machine-independent path: relative to the longest matching sys.path
+        entry (repo, stdlib or site-packages).
+        """
+        if filename.startswith('<'):
+            return filename
+        filename = os.path.abspath(filename)
+        for root in self._roots:
+            if filename.startswith(root + os.sep):
+                return os.path.relpath(filename, root)
+        return os.path.basename(filename)
+
+    def _label(self, filename: str, function: str) -> str:
+        return f"{self._path(filename)}:{function}"
+
+    @staticmethod
+    def _file_name(stage: str) -> str:
+        return re.sub(r'[^A-Za-z0-9_.-]+', '_', stage)
+
+    # ---------- stages
+
+    def _profile_new_thread(self, frame, event, arg):
+        """
+        threading.setprofile hook: runs once in each thread started during a
+        stage and hands the thread over to its own cProfile profiler.
+        """
+        profiler = cProfile.Profile()
+        with self._thread_profilers_lock:
+            self._thread_profilers.append(profiler)
+        profiler.enable()  # replaces this hook for the rest of the thread
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Profiles the enclosed block as one stage. Stages do not nest: an inner
+        stage only records wall time, its samples belong to the outer one.
+        """
+        if self._active is not None:
+            started = time.perf_counter()
+            try:
+                yield
+            finally:
+                self._record(name, {'wall_seconds': time.perf_counter() - started, 'nested_in': self._active})
+            return
+
+        self._active = name
+        profiler = sampler = snapshot = None
+        if self.trace_malloc:
+            tracemalloc.reset_peak()
+            snapshot = tracemalloc.take_snapshot()
+        if self.mode == 'cprofile':
+            self._thread_profilers = []
+            threading.setprofile(self._profile_new_thread)
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            sampler = _Sampler(self._label, self.sample_interval)
+            sampler.start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - started
+            if profiler is not None:
+                profiler.disable()
+                threading.setprofile(None)
+            if sampler is not None:
+                sampler.stop()
+            self._active = None
+            entry = {'wall_seconds': wall}
+            base = os.path.join(self.output_dir, self._file_name(name))
+            if profiler is not None:
+                with self._thread_profilers_lock:
+                    thread_profilers, self._thread_profilers = self._thread_profilers, []
+                entry['threads_profiled'] = len(thread_profilers)
+                self._write_cprofile(profiler, thread_profilers, base)
+            if sampler is not None:
+                entry['samples'] = sum(sampler.stacks.values())
+                self._write_folded(sampler.stacks, base)
+            if snapshot is not None:
+                entry['peak_traced_bytes'] = tracemalloc.get_traced_memory()[1]
+                self._write_allocations(snapshot, tracemalloc.take_snapshot(), base)
+            self._record(name, entry)
+
+    def _record(self, name: str, entry: dict):
+        self.summary[name] = entry
+        self.logger.log(f"Profiled stage {name}: {entry['wall_seconds']:.3f}s")
+
+    # ---------- writers
+
+    def _write_cprofile(self, profiler: cProfile.Profile, thread_profilers: list, base: str):
+        stats = pstats.Stats(profiler)
+        for thread_profiler in thread_profilers:
+            # Stops collecting (the thread may outlive the stage) and merges what it saw
+            thread_profiler.create_stats()
+            if thread_profiler.stats:
+                stats.add(thread_profiler)
+        stats.dump_stats(base + '.pstats')
+        rows = []
+        for (filename, _, function), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append((cumtime, tottime, ncalls, self._label(filename, function)))
+        rows.sort(key=lambda row: (-row[0], row[3]))
+        with open(base + '.top.txt', 'w', encoding='utf-8') as f:
+            f.write(f"{'cumtime':>10} {'tottime':>10} {'ncalls':>10}  function\n")
+            for cumtime, tottime, ncalls, label in rows[:self.top_n]:
+                f.write(f"{cumtime:10.4f} {tottime:10.4f} {ncalls:10d}  {label}\n")
+
+    @staticmethod
+    def _write_folded(stacks: Counter, base: str):
+        with open(base + '.folded', 'w', encoding='utf-8') as f:
+            for stack in sorted(stacks):
+                f.write(f"{stack} {stacks[stack]}\n")
+
+    def _write_allocations(self, before, after, base: str):
+        # Leave out the profiler's own bookkeeping
+        filters = [tracemalloc.Filter(False, module.__file__) for module in (tracemalloc, cProfile, pstats)]
+        filters.append(tracemalloc.Filter(False, __file__))
+        diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+        with open(base + '.alloc.txt', 'w', encoding='utf-8') as f:
+            f.write(f"{'size_diff':>12} {'count_diff':>10}  location\n")
+            for stat in diff[:self.top_n]:
+                frame = stat.traceback[0]
+                f.write(f"{stat.size_diff:12d} {stat.count_diff:10d}  {self._path(frame.filename)}:{frame.lineno}\n")
+
+    def write_summary(self) -> str:
+        """
+        Writes summary.json with wall time (and memory/sample counts) per stage.
+        """
+        path = os.path.join(self.output_dir, 'summary.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'mode': self.mode, 'stages': self.summary}, f, indent=2, sort_keys=True)
+        self.logger.log(f"Profiling outputs written to {self.output_dir}")
+        return path
@@ -1,4 +1,26 @@
+import asyncio
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
 from .logService import LogService
+from .asyncHttpService import AsyncHttpService
+from entity.headlineRecord import HeadlineRecord
+
+# Scrapers used by forked re-parse workers; set just before the pool forks so
+# the workers inherit them instead of unpickling them
+_REPARSE_SCRAPERS = {}
+
+
+def _reparse_one(source: str, url: str) -> str:
+    scraper = _REPARSE_SCRAPERS.get(source)
+    if scraper is None:
+        return f"Error: No scraper found for {source}"
+    try:
+        return scraper.ScrapeFullText(url)
+    except Exception as e:
+        return f"Error: {e}"
 
 
 class ScrapingService:
@@ -6,8 +28,95 @@ class ScrapingService:
         self.websites = websites
         self.log_service = LogService()
         self.data = []
+        self.archive = None
+        self.replay = False
+        self.as_of = None
+
+    def use_archive(self, archive, replay: bool = False, as_of: str = None):
+        """
+        Routes every scraper's fetches through a PageArchiveService.
+
+        :param archive: The page archive.
+        :param replay: False records live responses into the archive; True
+                       answers every fetch from the archive, without network.
+        :param as_of: In replay, use the latest capture fetched at or before this time
+                      ('YYYY-MM-DD HH:MM:SS', or 'YYYY-MM-DD' for the end of that day).
+                      Replayed headlines keep the capture time of their home page as scraped_at.
+        """
+        self.archive = archive
+        self.replay = replay
+        self.as_of = archive.normalise_as_of(as_of)
+        for website in self.websites:
+            scraper = website.get("scraper")
+            if scraper is None:
+                continue
+            if replay:
+                scraper.use_session(archive.replay_session(as_of))
+            elif getattr(scraper, "_session", None) is not None:
+                scraper.use_session(archive.recording_session(scraper._session))
+        self.log_service.log(f"Page archive {archive.archive_dir} in {'replay' if replay else 'record'} mode")
+
+    def _http(self, concurrency: int):
+        # Sync scrapers hold a blocking thread per item in flight, so size that pool to the concurrency
+        if self.replay:
+            return self.archive.replay_http(self.as_of, blocking_workers=concurrency)
+        return AsyncHttpService(blocking_workers=concurrency, archive=self.archive)
+
+    def _scraped_at(self, scraper) -> str:
+        """
+        Scrape time of a home page: now, or in replay the capture time of the archived page.
+        """
+        if self.replay:
+            fetched_at = getattr(getattr(scraper, "_session", None), "fetched_at", None)
+            if fetched_at:
+                return fetched_at
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    def _collect(self, website_name, data, scraped_at: str = None):
+        """
+        Records one ScrapeHome result, handling both success (list) and error (string) cases.
+        Headlines are stored as HeadlineRecords sharing one interned source name and timestamp.
+        """
+        if isinstance(data, list):
+            source = sys.intern(website_name)
+            scraped_at = scraped_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            records = [
+                HeadlineRecord.from_scraped(item, source, scraped_at)
+                for item in data if isinstance(item, dict)
+            ]
 
-    def scrape(self):
+            self.data.extend(records)
+            self.log_service.log(f"Successfully scraped {len(records)} headlines from {website_name}")
+        elif isinstance(data, str):
+            # Error case
+            self.log_service.log(f"Error scraping {website_name}: {data}")
+        else:
+            self.log_service.log(f"Unexpected response type from {website_name}: {type(data)}")
+
+    @staticmethod
+    def _scrape_profiled(website_name: str, scraper, profiler):
+        """
+        ScrapeHome as two profiled stages, fetch then parse, so network and
+        parsing time are reported apart. Scrapers that don't split ScrapeHome
+        into FetchHome/ParseHome are profiled whole under 'scrape.<name>'.
+        """
+        with profiler.stage(f"scrape.{website_name}"):
+            content = scraper.FetchHome()
+            if content is None:
+                return scraper.ScrapeHome()
+        if isinstance(content, str):
+            # Fetch error
+            return content
+        with profiler.stage(f"parse.{website_name}"):
+            return scraper.ParseHome(content)
+
+    def scrape(self, profiler=None):
+        """
+        Scrapes every home page in turn.
+
+        :param profiler: Optional ProfilingService; each source's fetch is profiled as stage
+                         'scrape.<name>' and its HTML parsing as stage 'parse.<name>'.
+        """
         self.log_service.log("Starting scraping process")
         
         for website in self.websites:
@@ -17,23 +126,11 @@ class ScrapingService:
             if scraper:
                 self.log_service.log(f"Starting to scrape {website_name}")
                 try:
-                    data = scraper.ScrapeHome()
-                    
-                    # Handle both success (list) and error (string) cases
-                    if isinstance(data, list):
-                        # Add source information to each headline
-                        for item in data:
-                            if isinstance(item, dict):
-                                item['source'] = website_name
-                        
-                        self.data.extend(data)
-                        self.log_service.log(f"Successfully scraped {len(data)} headlines from {website_name}")
-                    elif isinstance(data, str):
-                        # Error case
-                        self.log_service.log(f"Error scraping {website_name}: {data}")
+                    if profiler:
+                        data = self._scrape_profiled(website_name, scraper, profiler)
                     else:
-                        self.log_service.log(f"Unexpected response type from {website_name}: {type(data)}")
-                        
+                        data = scraper.ScrapeHome()
+                    self._collect(website_name, data, self._scraped_at(scraper))
                 except Exception as e:
                     self.log_service.log(f"Exception occurred while scraping {website_name}: {str(e)}")
             else:
@@ -41,3 +138,107 @@ class ScrapingService:
 
         self.log_service.log(f"Scraping completed. Total headlines collected: {len(self.data)}")
         return self.data
+
+    async def scrape_async(self, http: AsyncHttpService = None, concurrency: int = 100):
+        """
+        Scrapes every home page concurrently from one event loop.
+
+        :param http: Shared AsyncHttpService; one is created (and closed) if not given.
+        :param concurrency: Maximum number of home pages in flight.
+        :return: The collected headlines, as with scrape().
+        """
+        if http is None:
+            async with self._http(concurrency) as owned:
+                return await self.scrape_async(owned, concurrency)
+
+        self.log_service.log(f"Starting async scraping process for {len(self.websites)} sources")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scrape_one(website):
+            website_name = website.get("name", "Unknown")
+            scraper = website.get("scraper")
+            if not scraper:
+                self.log_service.log(f"No scraper found for {website_name}")
+                return
+            async with semaphore:
+                try:
+                    data = await scraper.ScrapeHomeAsync(http)
+                    self._collect(website_name, data, self._scraped_at(scraper))
+                except Exception as e:
+                    self.log_service.log(f"Exception occurred while scraping {website_name}: {str(e)}")
+
+        await asyncio.gather(*(scrape_one(website) for website in self.websites))
+
+        self.log_service.log(f"Async scraping completed. Total headlines collected: {len(self.data)}")
+        return self.data
+
+    async def scrape_full_text_async(self, headlines: list, http: AsyncHttpService = None, concurrency: int = 200):
+        """
+        Fetches full article text for many headlines concurrently.
+        Each headline is routed to the scraper of its source and gets its
+        full_text set (the scraper's error string on failure).
+
+        :param headlines: HeadlineRecords.
+        :param http: Shared AsyncHttpService; one is created (and closed) if not given.
+        :param concurrency: Maximum number of articles in flight.
+        :return: The same records.
+        """
+        if http is None:
+            async with self._http(concurrency) as owned:
+                return await self.scrape_full_text_async(headlines, owned, concurrency)
+
+        scrapers = {website.get("name"): website.get("scraper") for website in self.websites}
+        semaphore = asyncio.Semaphore(concurrency)
+        self.log_service.log(f"Fetching full text for {len(headlines)} articles (concurrency {concurrency})")
+
+        async def fetch_one(record):
+            scraper = scrapers.get(record.source)
+            if not scraper:
+                record.full_text = f"Error: No scraper found for {record.source}"
+                return
+            async with semaphore:
+                try:
+                    record.full_text = await scraper.ScrapeFullTextAsync(record.url, http)
+                except Exception as e:
+                    record.full_text = f"Error: {e}"
+
+        await asyncio.gather(*(fetch_one(record) for record in headlines))
+
+        failed = sum(1 for record in headlines if str(record.full_text or '').startswith("Error"))
+        self.log_service.log(f"Full text fetched for {len(headlines) - failed} articles, {failed} failed")
+        return headlines
+
+    def reparse_full_text(self, headlines: list, workers: int = None) -> list:
+        """
+        Re-extracts full text for many headlines from the page archive, in
+        parallel processes and without network. Use after use_archive(...,
+        replay=True), e.g. to re-run fixed selectors over past pages.
+
+        :param headlines: HeadlineRecords; full_text is set on each.
+        :param workers: Worker processes; defaults to the CPU count.
+        :return: The same records.
+        """
+        global _REPARSE_SCRAPERS
+        if not self.replay:
+            raise ValueError("reparse_full_text needs use_archive(archive, replay=True)")
+
+        workers = workers or os.cpu_count() or 1
+        _REPARSE_SCRAPERS = {website.get("name"): website.get("scraper") for website in self.websites}
+        # Forked workers inherit the scrapers; elsewhere fall back to threads
+        if "fork" in multiprocessing.get_all_start_methods():
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+        self.log_service.log(f"Re-parsing {len(headlines)} archived articles with {workers} workers")
+        try:
+            with pool:
+                texts = pool.map(_reparse_one, [r.source for r in headlines], [r.url for r in headlines],
+                                 chunksize=max(1, len(headlines) // (workers * 4)))
+                for record, text in zip(headlines, texts):
+                    record.full_text = text
+        finally:
+            _REPARSE_SCRAPERS = {}
+
+        failed = sum(1 for record in headlines if str(record.full_text or '').startswith("Error"))
+        self.log_service.log(f"Re-parsed {len(headlines) - failed} archived articles, {failed} failed")
+        return headlines
@@ -0,0 +1,392 @@
+import hashlib
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from .logService import LogService
+from entity.headlineRecord import HeadlineRecord
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS headlines (
+    id INTEGER PRIMARY KEY,
+    source_id INTEGER NOT NULL REFERENCES sources(id),
+    title TEXT NOT NULL,
+    url TEXT NOT NULL UNIQUE,
+    confidence_score REAL,
+    scraped_at TEXT NOT NULL,
+    model_version TEXT
+);
+
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    headline_id INTEGER NOT NULL UNIQUE REFERENCES headlines(id),
+    full_text TEXT NOT NULL,
+    content_hash TEXT,
+    fetched_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS entities (
+    id INTEGER PRIMARY KEY,
+    headline_id INTEGER NOT NULL REFERENCES headlines(id),
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    UNIQUE(headline_id, field, value, extractor)
+);
+
+CREATE INDEX IF NOT EXISTS idx_headlines_source_date ON headlines(source_id, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_headlines_date ON headlines(scraped_at);
+CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(content_hash);
+CREATE INDEX IF NOT EXISTS idx_entities_field_value ON entities(field, value);
+CREATE INDEX IF NOT EXISTS idx_entities_headline ON entities(headline_id);
+
+-- Bumped by every write to headlines, whoever the writer is, so readers can
+-- tell cached results apart from current ones
+CREATE TABLE IF NOT EXISTS data_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO data_version(id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS headlines_version_insert AFTER INSERT ON headlines
+BEGIN UPDATE data_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS headlines_version_update AFTER UPDATE ON headlines
+BEGIN UPDATE data_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS headlines_version_delete AFTER DELETE ON headlines
+BEGIN UPDATE data_version SET version = version + 1 WHERE id = 1; END;
+"""
+
+# Columns added after the first schema; create_schema adds them to older databases
+ADDED_COLUMNS = {
+    'headlines': [('model_version', 'TEXT'), ('cluster_id', 'INTEGER')],
+}
+
+
+class SQLiteService:
+    def __init__(self, db_path: str = 'data/crimenet.db', pool_size: int = 4, pool_timeout: float = None):
+        """
+        Embedded relational store for headlines, articles and extracted entities.
+
+        The database runs in WAL mode so readers (e.g. the API) never block the
+        scraper's writes. Connections come from a fixed pool; writes are
+        serialised through one lock since SQLite allows a single writer, and
+        each batch is one executemany transaction.
+
+        :param db_path: Path of the SQLite database file.
+        :param pool_size: Number of pooled connections.
+        :param pool_timeout: Seconds to wait for a free pooled connection before
+                             raising TimeoutError; None waits indefinitely.
+        """
+        self.db_path = db_path
+        self.pool_timeout = pool_timeout
+        self.logger = LogService()
+        self._write_lock = threading.Lock()
+        self._pool = queue.Queue(maxsize=pool_size)
+        self._append_hooks = []
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        self.create_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrows a pooled connection for the duration of the block.
+        Raises TimeoutError if none frees up within pool_timeout.
+        """
+        try:
+            conn = self._pool.get(timeout=self.pool_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No free SQLite connection after {self.pool_timeout}s") from None
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def read_snapshot(self):
+        """
+        Borrows a connection and runs the block as one read transaction, so
+        every query in it sees the same committed state.
+        """
+        with self.connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.execute("COMMIT")
+
+    @contextmanager
+    def _reading(self, conn: sqlite3.Connection = None):
+        # Reuse the caller's connection (e.g. a read_snapshot) or borrow one
+        if conn is not None:
+            yield conn
+        else:
+            with self.connection() as conn:
+                yield conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        Borrows a connection and runs the block as one write transaction.
+        """
+        with self._write_lock, self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def create_schema(self):
+        """
+        Creates tables and indexes if they don't exist.
+        """
+        with self._write_lock, self.connection() as conn:
+            conn.executescript(SCHEMA)
+            for table, columns in ADDED_COLUMNS.items():
+                existing = {row['name'] for row in conn.execute(f"PRAGMA table_info({table})")}
+                for name, column_type in columns:
+                    if name not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+
+    def add_append_hook(self, hook):
+        """
+        Registers hook(conn, new_rows) to run inside the append_headlines
+        transaction with the rows that were actually inserted, so derived
+        tables stay consistent with headlines.
+        """
+        self._append_hooks.append(hook)
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    def _source_ids(self, conn: sqlite3.Connection, names: set) -> dict:
+        conn.executemany("INSERT OR IGNORE INTO sources(name) VALUES (?)", [(n,) for n in names])
+        placeholders = ",".join("?" * len(names))
+        rows = conn.execute(f"SELECT id, name FROM sources WHERE name IN ({placeholders})", list(names))
+        return {row['name']: row['id'] for row in rows}
+
+    def _headline_ids(self, conn: sqlite3.Connection, urls: list) -> dict:
+        ids = {}
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(f"SELECT id, url FROM headlines WHERE url IN ({placeholders})", chunk):
+                ids[row['url']] = row['id']
+        return ids
+
+    def append_headlines(self, headlines: list) -> int:
+        """
+        Inserts a batch of headlines in one transaction; URLs already stored are skipped.
+
+        :param headlines: List of HeadlineRecords (or dictionaries with 'source', 'title', 'url',
+                          'confidence_score' and optionally 'model_version' and 'scraped_at').
+        :return: Number of new rows.
+        """
+        return len(self.insert_new_headlines(headlines))
+
+    def insert_new_headlines(self, headlines: list) -> list:
+        """
+        Inserts a batch of headlines like append_headlines, returning the
+        records that were actually new (in batch order, first of any repeated URL).
+        """
+        rows = [h for h in map(HeadlineRecord.coerce, headlines) if h.title and h.url]
+        if not rows:
+            return []
+
+        now = self._now()
+        with self.transaction() as conn:
+            source_ids = self._source_ids(conn, {h.source for h in rows})
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM headlines").fetchone()[0]
+            conn.executemany(
+                "INSERT OR IGNORE INTO headlines(source_id, title, url, confidence_score, scraped_at, model_version) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (source_ids[h.source], h.title, h.url, h.confidence_score, h.scraped_at or now, h.model_version)
+                    for h in rows
+                ],
+            )
+            # The write transaction is exclusive, so every id past last_id is one of ours. (total_changes
+            # would also count the rows the data_version triggers update.)
+            new_rows = [dict(row) for row in conn.execute(
+                "SELECT h.id, s.name AS source, h.title, h.url, h.confidence_score, h.scraped_at, h.model_version "
+                "FROM headlines h JOIN sources s ON s.id = h.source_id WHERE h.id > ? ORDER BY h.id",
+                (last_id,),
+            )]
+            if new_rows:
+                for hook in self._append_hooks:
+                    hook(conn, new_rows)
+
+        new_urls = {row['url'] for row in new_rows}
+        inserted = []
+        for h in rows:
+            if h.url in new_urls:
+                new_urls.discard(h.url)
+                inserted.append(h)
+        self.logger.log(f"Stored {len(inserted)} new headlines in SQLite ({len(rows) - len(inserted)} already present)")
+        return inserted
+
+    def insert_articles(self, articles: list) -> int:
+        """
+        Stores full article text for already stored headlines, matched by URL.
+
+        :param articles: List of HeadlineRecords (or dictionaries with 'url', 'full_text' and optionally 'content_hash').
+        :return: Number of rows written.
+        """
+        usable = [
+            a for a in map(HeadlineRecord.coerce, articles)
+            if isinstance(a.full_text, str) and not a.full_text.startswith("Error")
+        ]
+        if not usable:
+            return 0
+
+        now = self._now()
+        with self.transaction() as conn:
+            ids = self._headline_ids(conn, [a.url for a in usable])
+            params = [
+                (ids[a.url], a.full_text,
+                 a.content_hash or hashlib.sha256(a.full_text.encode('utf-8')).hexdigest(), now)
+                for a in usable if a.url in ids
+            ]
+            conn.executemany(
+                "INSERT OR REPLACE INTO articles(headline_id, full_text, content_hash, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                params,
+            )
+        return len(params)
+
+    def insert_extractions(self, records: list[dict], fields: list) -> int:
+        """
+        Stores extracted entities as one row per (headline, field, value).
+
+        :param records: ExtractionService records with 'url', 'extractor' and a list per field.
+        :param fields: Field names to store, e.g. EXTRACTION_FIELDS.
+        :return: Number of entity rows offered for insert.
+        """
+        if not records:
+            return 0
+
+        with self.transaction() as conn:
+            ids = self._headline_ids(conn, [r.get('url') for r in records])
+            params = [
+                (ids[r['url']], field, value, r.get('extractor', 'unknown'))
+                for r in records if r.get('url') in ids
+                for field in fields
+                for value in r.get(field, [])
+            ]
+            conn.executemany(
+                "INSERT OR IGNORE INTO entities(headline_id, field, value, extractor) VALUES (?, ?, ?, ?)",
+                params,
+            )
+        return len(params)
+
+    def query_headlines(self, source: str = None, start: str = None, end: str = None,
+                        min_confidence: float = None, keyword: str = None,
+                        limit: int = 100, offset: int = 0, conn: sqlite3.Connection = None) -> list[dict]:
+        """
+        Indexed filtered query over stored headlines, newest first.
+
+        :param source: Source name, e.g. 'bbc'.
+        :param start: Inclusive lower bound on scraped_at ('YYYY-MM-DD[ HH:MM:SS]').
+        :param end: Exclusive upper bound on scraped_at.
+        :param min_confidence: Minimum confidence score.
+        :param keyword: Case-insensitive substring of the title.
+        :param limit: Page size.
+        :param offset: Rows to skip.
+        :param conn: Connection to read through, e.g. from read_snapshot(); one is borrowed if not given.
+        """
+        sql, params = self._headline_filter_sql(source, start, end, min_confidence, keyword)
+        sql += " ORDER BY h.scraped_at DESC, h.id DESC LIMIT ? OFFSET ?"
+        params += [limit, offset]
+        with self._reading(conn) as conn:
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    def iter_headlines(self, source: str = None, start: str = None, end: str = None,
+                       min_confidence: float = None, keyword: str = None, batch_size: int = 500):
+        """
+        Streams every matching headline, newest first, fetching batch_size rows
+        at a time so large result sets never sit in memory at once.
+        Takes the same filters as query_headlines.
+
+        A stream lasts as long as its consumer (e.g. a slow HTTP client), so it
+        reads through its own short-lived connection instead of holding a
+        pooled one for the whole transfer.
+        """
+        sql, params = self._headline_filter_sql(source, start, end, min_confidence, keyword)
+        sql += " ORDER BY h.scraped_at DESC, h.id DESC"
+        conn = self._connect()
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            conn.close()
+
+    def latest_headline_id(self) -> int:
+        """
+        Highest headline id, a cheap marker of whether new rows were written.
+        """
+        with self.connection() as conn:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM headlines").fetchone()[0]
+
+    def data_version(self, conn: sqlite3.Connection = None) -> int:
+        """
+        Counter bumped by every insert, update or delete on headlines (by
+        triggers, so writes from other processes count too).
+
+        :param conn: Connection to read through; one is borrowed if not given.
+        """
+        with self._reading(conn) as conn:
+            return conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()[0]
+
+    @staticmethod
+    def _headline_filter_sql(source, start, end, min_confidence, keyword):
+        sql = (
+            "SELECT h.id, s.name AS source, h.title, h.url, h.confidence_score, h.scraped_at, h.model_version, "
+            "h.cluster_id FROM headlines h JOIN sources s ON s.id = h.source_id WHERE 1=1"
+        )
+        params = []
+        if source:
+            sql += " AND s.name = ?"
+            params.append(source)
+        if start:
+            sql += " AND h.scraped_at >= ?"
+            params.append(start)
+        if end:
+            sql += " AND h.scraped_at < ?"
+            params.append(end)
+        if min_confidence is not None:
+            sql += " AND h.confidence_score >= ?"
+            params.append(min_confidence)
+        if keyword:
+            # The keyword is matched literally: escape LIKE's own wildcards
+            escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            sql += " AND h.title LIKE ? ESCAPE '\\'"
+            params.append(f"%{escaped}%")
+        return sql, params
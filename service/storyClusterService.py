@@ -0,0 +1,264 @@
+import json
+import math
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from .logService import LogService
+from .sqliteService import SQLiteService
+
+CLUSTER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS story_clusters (
+    id INTEGER PRIMARY KEY,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sources TEXT NOT NULL,
+    terms TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS story_terms (
+    term TEXT NOT NULL,
+    cluster_id INTEGER NOT NULL,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (term, cluster_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_story_terms_last_seen ON story_terms(last_seen);
+CREATE INDEX IF NOT EXISTS idx_headlines_cluster ON headlines(cluster_id);
+"""
+
+STOPWORDS = frozenset("""
+a about after again against all also an and any are as at be been before being but by can could did do does
+during for from had has have he her here hers him his how i if in into is it its just more most new news no
+nor not now of off on once only or other our out over own says said same she should so some such than that
+the their them then there these they this those through to too under until up very was we were what when
+where which while who whom why will with would you your live update updates latest video watch report
+""".split())
+
+TOKEN = re.compile(r"[a-z][a-z0-9'-]{2,}")
+
+
+class StoryClusterService:
+    def __init__(self, sqlite_service: SQLiteService, window_days: float = 7, threshold: float = 0.3,
+                 min_shared_terms: int = 2, max_candidates: int = 50, max_terms: int = 30,
+                 text_chars: int = 400):
+        """
+        Incremental cross-source story clustering of stored headlines.
+
+        Each headline (title plus the lead of its article text, if stored) is
+        reduced to a weighted term vector and compared only against clusters
+        active within the last window_days that share at least one term,
+        found through the story_terms inverted index. The best candidate
+        above threshold (cosine against the cluster's term centroid) takes the
+        item, otherwise it starts a new cluster. Terms of clusters outside the
+        window are pruned from the index, so cost per item is bounded by the
+        window, not the archive. The result is persisted as headlines.cluster_id.
+
+        :param sqlite_service: Store holding the headlines.
+        :param window_days: How long a story stays open to follow-ups.
+        :param threshold: Minimum cosine similarity to join a cluster.
+        :param min_shared_terms: Minimum number of terms an item must share with a cluster.
+        :param max_candidates: Clusters scored per item (most shared terms first).
+        :param max_terms: Terms kept per cluster centroid.
+        :param text_chars: Characters of article text added to the title.
+        """
+        self.db = sqlite_service
+        self.logger = LogService()
+        self.window = timedelta(days=window_days)
+        self.threshold = threshold
+        self.min_shared_terms = min_shared_terms
+        self.max_candidates = max_candidates
+        self.max_terms = max_terms
+        self.text_chars = text_chars
+
+        with self.db.transaction() as conn:
+            for statement in CLUSTER_SCHEMA.split(';'):
+                if statement.strip():
+                    conn.execute(statement)
+
+    # ---------- representation
+
+    @staticmethod
+    def tokens(text: str) -> list:
+        return [t.strip("'-") for t in TOKEN.findall((text or '').lower()) if t not in STOPWORDS]
+
+    def terms(self, title: str, text: str = None) -> Counter:
+        """
+        Weighted terms of one item; title terms count double.
+        """
+        terms = Counter()
+        for token in self.tokens(title):
+            terms[token] += 2
+        if text and not text.startswith("Error"):
+            terms.update(self.tokens(text[:self.text_chars]))
+        return Counter(dict(terms.most_common(self.max_terms)))
+
+    @staticmethod
+    def _cosine(a: dict, b: dict) -> float:
+        dot = sum(weight * b[term] for term, weight in a.items() if term in b)
+        if not dot:
+            return 0.0
+        return dot / (math.sqrt(sum(w * w for w in a.values())) * math.sqrt(sum(w * w for w in b.values())))
+
+    def _window_start(self, scraped_at: str) -> str:
+        try:
+            moment = datetime.strptime(scraped_at[:19], '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            moment = datetime.now()
+        return (moment - self.window).strftime('%Y-%m-%d %H:%M:%S')
+
+    # ---------- assignment
+
+    def _candidates(self, conn, terms: Counter, since: str) -> list:
+        placeholders = ",".join("?" * len(terms))
+        return conn.execute(
+            "SELECT c.id, c.terms, c.size, c.sources, c.first_seen, COUNT(*) AS shared "
+            "FROM story_terms t JOIN story_clusters c ON c.id = t.cluster_id "
+            f"WHERE t.term IN ({placeholders}) AND t.last_seen >= ? "
+            "GROUP BY c.id HAVING shared >= ? ORDER BY shared DESC, c.last_seen DESC LIMIT ?",
+            list(terms) + [since, self.min_shared_terms, self.max_candidates],
+        ).fetchall()
+
+    def _assign(self, conn, row) -> int:
+        """
+        Puts one headline row into its best cluster (or a new one) and returns the cluster id.
+        """
+        scraped_at = row['scraped_at']
+        terms = self.terms(row['title'], row['full_text'])
+        best, best_score = None, self.threshold
+        if terms:
+            for candidate in self._candidates(conn, terms, self._window_start(scraped_at)):
+                score = self._cosine(terms, json.loads(candidate['terms']))
+                if score >= best_score:
+                    best, best_score = candidate, score
+
+        if best is None:
+            cluster_id = conn.execute(
+                "INSERT INTO story_clusters(first_seen, last_seen, size, sources, terms) VALUES (?, ?, 1, ?, ?)",
+                (scraped_at, scraped_at, json.dumps([row['source']]), json.dumps(terms)),
+            ).lastrowid
+        else:
+            cluster_id = best['id']
+            centroid = Counter(json.loads(best['terms']))
+            centroid.update(terms)
+            sources = sorted(set(json.loads(best['sources'])) | {row['source']})
+            conn.execute(
+                "UPDATE story_clusters SET last_seen = MAX(last_seen, ?), first_seen = MIN(first_seen, ?), "
+                "size = size + 1, sources = ?, terms = ? WHERE id = ?",
+                (scraped_at, scraped_at, json.dumps(sources),
+                 json.dumps(dict(centroid.most_common(self.max_terms))), cluster_id),
+            )
+
+        conn.executemany(
+            "INSERT INTO story_terms(term, cluster_id, last_seen) VALUES (?, ?, ?) "
+            "ON CONFLICT(term, cluster_id) DO UPDATE SET last_seen = MAX(last_seen, excluded.last_seen)",
+            [(term, cluster_id, scraped_at) for term in terms],
+        )
+        conn.execute("UPDATE headlines SET cluster_id = ? WHERE id = ?", (cluster_id, row['id']))
+        return cluster_id
+
+    def assign_pending(self, batch_size: int = 500) -> int:
+        """
+        Clusters every stored headline that has no cluster_id yet, in id
+        order; run after new headlines (and their article text) are stored.
+
+        :return: Number of headlines assigned.
+        """
+        assigned, created = 0, 0
+        while True:
+            with self.db.transaction() as conn:
+                rows = conn.execute(
+                    "SELECT h.id, s.name AS source, h.title, h.scraped_at, a.full_text "
+                    "FROM headlines h JOIN sources s ON s.id = h.source_id "
+                    "LEFT JOIN articles a ON a.headline_id = h.id "
+                    "WHERE h.cluster_id IS NULL ORDER BY h.id LIMIT ?",
+                    (batch_size,),
+                ).fetchall()
+                if not rows:
+                    break
+                before = conn.execute("SELECT COUNT(*) FROM story_clusters").fetchone()[0]
+                for row in rows:
+                    self._assign(conn, row)
+                created += conn.execute("SELECT COUNT(*) FROM story_clusters").fetchone()[0] - before
+                assigned += len(rows)
+                # Clusters untouched for a whole window can no longer take items
+                conn.execute("DELETE FROM story_terms WHERE last_seen < ?",
+                             (self._window_start(min(row['scraped_at'] for row in rows)),))
+        self.logger.log(f"Clustered {assigned} headlines, {created} new stories")
+        return assigned
+
+    def rebuild(self, batch_size: int = 500) -> int:
+        """
+        Drops all clusters and re-clusters the archive from scratch.
+        """
+        with self.db.transaction() as conn:
+            conn.execute("UPDATE headlines SET cluster_id = NULL")
+            conn.execute("DELETE FROM story_terms")
+            conn.execute("DELETE FROM story_clusters")
+        return self.assign_pending(batch_size)
+
+    # ---------- queries
+
+    def story(self, cluster_id: int) -> dict:
+        """
+        One cluster with its headlines, oldest first.
+        """
+        with self.db.connection() as conn:
+            cluster = conn.execute("SELECT * FROM story_clusters WHERE id = ?", (cluster_id,)).fetchone()
+            if cluster is None:
+                return None
+            headlines = conn.execute(
+                "SELECT h.id, s.name AS source, h.title, h.url, h.scraped_at "
+                "FROM headlines h JOIN sources s ON s.id = h.source_id "
+                "WHERE h.cluster_id = ? ORDER BY h.scraped_at, h.id",
+                (cluster_id,),
+            )
+            return {
+                'id': cluster['id'], 'first_seen': cluster['first_seen'], 'last_seen': cluster['last_seen'],
+                'size': cluster['size'], 'sources': json.loads(cluster['sources']),
+                'terms': json.loads(cluster['terms']), 'headlines': [dict(h) for h in headlines],
+            }
+
+    def story_count(self, start: str = None, end: str = None, source: str = None) -> int:
+        """
+        Number of distinct stories with a headline in [start, end), instead of
+        the number of articles.
+        """
+        sql = ("SELECT COUNT(DISTINCT h.cluster_id) FROM headlines h JOIN sources s ON s.id = h.source_id "
+               "WHERE h.cluster_id IS NOT NULL")
+        params = []
+        if source:
+            sql += " AND s.name = ?"
+            params.append(source)
+        if start:
+            sql += " AND h.scraped_at >= ?"
+            params.append(start)
+        if end:
+            sql += " AND h.scraped_at < ?"
+            params.append(end)
+        with self.db.connection() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    def cross_source_stories(self, start: str = None, end: str = None, min_sources: int = 2,
+                             limit: int = 100) -> list:
+        """
+        Stories covered by at least min_sources sources, most recently active first.
+        """
+        sql = "SELECT id, first_seen, last_seen, size, sources FROM story_clusters WHERE 1=1"
+        params = []
+        if start:
+            sql += " AND last_seen >= ?"
+            params.append(start)
+        if end:
+            sql += " AND first_seen < ?"
+            params.append(end)
+        sql += " ORDER BY last_seen DESC"
+        stories = []
+        with self.db.connection() as conn:
+            for row in conn.execute(sql, params):
+                sources = json.loads(row['sources'])
+                if len(sources) >= min_sources:
+                    stories.append({**dict(row), 'sources': sources})
+                    if len(stories) >= limit:
+                        break
+        return stories
@@ -0,0 +1,155 @@
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+from .logService import LogService
+from .modelRegistryService import ModelRegistryService
+
+CLASSES = [0, 1]
+
+
+class TrainingService:
+    def __init__(self, registry: ModelRegistryService, n_features: int = 2 ** 20, alpha: float = 0.1):
+        """
+        Incremental trainer for the crime headline classifier.
+
+        The model is a HashingVectorizer + MultinomialNB pipeline. The hashing
+        vectorizer has no vocabulary to refit and the classifier supports
+        partial_fit, so an update only touches the newly labelled headlines,
+        streamed in mini-batches. Results are registered as new versions that
+        CrimeIdentifierService loads like any other artifact.
+
+        :param registry: Registry that base models are loaded from and new versions written to.
+        :param n_features: Hashing space size.
+        :param alpha: Naive Bayes smoothing.
+        """
+        self.registry = registry
+        self.n_features = n_features
+        self.alpha = alpha
+        self.logger = LogService()
+
+    def new_model(self) -> Pipeline:
+        return Pipeline([
+            ('vectorizer', HashingVectorizer(n_features=self.n_features, alternate_sign=False,
+                                             ngram_range=(1, 2), lowercase=True)),
+            ('classifier', MultinomialNB(alpha=self.alpha)),
+        ])
+
+    @staticmethod
+    def is_incremental(model) -> bool:
+        """
+        True if the model is a pipeline this service can keep training.
+        """
+        steps = getattr(model, 'named_steps', {})
+        return isinstance(steps.get('vectorizer'), HashingVectorizer) and \
+            hasattr(steps.get('classifier'), 'partial_fit')
+
+    def load_base(self, version: str = None):
+        """
+        Loads a registry version to continue training from.
+
+        :return: tuple (model, version, metadata); a fresh model with version None
+                 if the version is not an incremental pipeline (e.g. the original TF-IDF NBCrime.pkl).
+        """
+        versions = self.registry.versions()
+        version = version or self.registry.active_version()
+        if version in versions:
+            model, version = self.registry.load(version)
+            if self.is_incremental(model):
+                return model, version, versions[version].get('metadata', {})
+            self.logger.log(f"Model {version} is not incremental, training a new hashing model instead")
+        return self.new_model(), None, {}
+
+    def partial_fit(self, model: Pipeline, titles: list, labels: list):
+        """
+        Updates the model with one mini-batch of labelled headlines.
+        """
+        features = model.named_steps['vectorizer'].transform(titles)
+        model.named_steps['classifier'].partial_fit(features, labels, classes=CLASSES)
+
+    def train_stream(self, model: Pipeline, batches) -> int:
+        """
+        Feeds an iterable of (titles, labels) mini-batches into the model.
+
+        :return: Number of headlines consumed.
+        """
+        consumed = 0
+        for titles, labels in batches:
+            if len(titles):
+                self.partial_fit(model, list(titles), [int(label) for label in labels])
+                consumed += len(titles)
+        return consumed
+
+    def csv_batches(self, data_path: str, skip_rows: int = 0, batch_size: int = 5000,
+                    text_column: str = 'title', label_column: str = 'label'):
+        """
+        Streams (titles, labels, rows_read) mini-batches from a labelled CSV in
+        constant memory, skipping the first skip_rows data rows (already
+        trained on). Rows with a missing title or label are dropped from the
+        batch but still counted in rows_read, the number of file rows the
+        batch covers, which is what a resume offset has to advance by.
+        """
+        reader = pd.read_csv(
+            data_path,
+            usecols=[text_column, label_column],
+            dtype={text_column: 'string', label_column: 'Int8'},
+            skiprows=range(1, skip_rows + 1),
+            chunksize=batch_size,
+        )
+        for chunk in reader:
+            rows_read = len(chunk)
+            chunk = chunk.dropna()
+            yield chunk[text_column].tolist(), chunk[label_column].tolist(), rows_read
+
+    def update_from_csv(self, data_path: str, base_version: str = None, activate: bool = False,
+                        batch_size: int = 5000, text_column: str = 'title', label_column: str = 'label',
+                        language: str = None) -> str:
+        """
+        Continues training from base_version on rows of data_path it has not
+        seen yet and registers the result as a new version.
+
+        Provenance (data file and rows consumed) is stored in the version
+        metadata, so the next update resumes where this one stopped and cost
+        scales with the new rows only.
+
+        :param language: Train a per-language model (e.g. 'es'); it continues
+                         from that language's latest version instead of the
+                         active model and is tagged with the language in its metadata.
+        :return: The new version name (base_version's if there were no new rows).
+                 Raises ValueError if there is neither a base nor a usable row.
+        """
+        if language and base_version is None:
+            base_version = self.registry.language_versions().get(language)
+        if language and base_version is None:
+            model, base, metadata = self.new_model(), None, {}
+        else:
+            model, base, metadata = self.load_base(base_version)
+        rows_seen = metadata.get('rows_consumed', 0) if metadata.get('data_path') == data_path else 0
+
+        self.logger.log(f"Training from {base or 'scratch'} on {data_path}, skipping {rows_seen} rows already consumed")
+        consumed = rows_read = 0
+        for titles, labels, chunk_rows in self.csv_batches(data_path, rows_seen, batch_size,
+                                                           text_column, label_column):
+            consumed += self.train_stream(model, [(titles, labels)])
+            rows_read += chunk_rows
+        if not consumed:
+            # An unfitted model must never reach the registry: serving it raises NotFittedError
+            if base is None:
+                raise ValueError(f"No labelled rows to train on in {data_path}")
+            self.logger.log("No new labelled rows, keeping current model")
+            return base
+
+        version = self.registry.register_model(
+            model,
+            activate=activate,
+            notes=f"incremental update from {base or 'scratch'} with {consumed} headlines",
+            metadata={
+                'base_version': base,
+                'data_path': data_path,
+                'rows_consumed': rows_seen + rows_read,
+                'total_trained': metadata.get('total_trained', 0) + consumed,
+                'language': language or metadata.get('language'),
+            },
+        )
+        self.logger.log(f"Trained model {version} on {consumed} new headlines")
+        return version
@@ -0,0 +1,239 @@
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from .logService import LogService
+from .sqliteService import SQLiteService
+from StrategyExtractor.ruleBasedExtractor import RuleBasedExtractor
+
+ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_rollups (
+    granularity TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    source TEXT NOT NULL,
+    category TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (granularity, source, category, bucket)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS trend_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    last_id INTEGER NOT NULL
+);
+"""
+
+# Bucket key of each granularity is a prefix of scraped_at ('YYYY-MM-DD HH:MM:SS')
+GRANULARITIES = {'year': 4, 'month': 7, 'day': 10, 'hour': 13}
+
+# Wildcard used for the "all sources" / "all categories" marginals
+ALL = '*'
+
+
+class TrendService:
+    def __init__(self, sqlite_service: SQLiteService, categories: dict = None):
+        """
+        Incremental rollups of crime headline counts for temporal trend analysis.
+
+        Every insert through SQLiteService.append_headlines bumps pre-aggregated
+        counters per (granularity, bucket, source, category), including ALL
+        marginals, in the same transaction. Queries only read these cubes, so
+        their cost depends on the number of buckets asked for, not on the size
+        of the archive.
+
+        trend_state records the highest headline id rolled up, so rows written
+        without the append hook (another process, a direct SQLiteService
+        user) are caught up on the next append or on startup. Startup also
+        checks that the rollups count exactly the headlines up to that id and
+        rebuilds them if not (e.g. after deletes), see sync().
+
+        :param sqlite_service: Store whose appends are rolled up.
+        :param categories: Category name -> regex over the title; defaults to
+                           RuleBasedExtractor.CRIME_TYPES. Titles matching none are 'other'.
+        """
+        self.db = sqlite_service
+        self.logger = LogService()
+        categories = categories or RuleBasedExtractor.CRIME_TYPES
+        self._categories = {k: re.compile(rf'\b(?:{v})\b', re.I) for k, v in categories.items()}
+
+        with self.db.transaction() as conn:
+            for statement in ROLLUP_SCHEMA.split(';'):
+                if statement.strip():
+                    conn.execute(statement)
+        self.sync()
+        self.db.add_append_hook(self._on_append)
+
+    def categorize(self, title: str) -> list:
+        matched = [name for name, pattern in self._categories.items() if pattern.search(title or '')]
+        return matched or ['other']
+
+    def _increments(self, rows: list) -> Counter:
+        counts = Counter()
+        for row in rows:
+            scraped_at = row['scraped_at']
+            sources = (row['source'], ALL)
+            categories = self.categorize(row['title']) + [ALL]
+            for granularity, width in GRANULARITIES.items():
+                bucket = scraped_at[:width]
+                for source in sources:
+                    for category in categories:
+                        counts[(granularity, bucket, source, category)] += 1
+        return counts
+
+    @staticmethod
+    def _apply(conn, counts: Counter):
+        conn.executemany(
+            "INSERT INTO trend_rollups(granularity, bucket, source, category, count) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(granularity, source, category, bucket) DO UPDATE SET count = count + excluded.count",
+            [key + (n,) for key, n in counts.items()],
+        )
+
+    def _roll_up(self, conn, after_id: int = 0, batch_size: int = 5000) -> int:
+        """
+        Adds every headline with id > after_id to the rollups and moves the
+        trend_state watermark past them. Returns the number of rows added.
+        """
+        cursor = conn.execute(
+            "SELECT h.id, s.name AS source, h.title, h.scraped_at FROM headlines h "
+            "JOIN sources s ON s.id = h.source_id WHERE h.id > ? ORDER BY h.id",
+            (after_id,),
+        )
+        total, last_id = 0, after_id
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            self._apply(conn, self._increments(rows))
+            total += len(rows)
+            last_id = rows[-1]['id']
+        conn.execute("INSERT INTO trend_state(id, last_id) VALUES (1, ?) "
+                     "ON CONFLICT(id) DO UPDATE SET last_id = excluded.last_id", (last_id,))
+        return total
+
+    @staticmethod
+    def _last_id(conn) -> int:
+        row = conn.execute("SELECT last_id FROM trend_state WHERE id = 1").fetchone()
+        return row[0] if row else 0
+
+    def _on_append(self, conn, new_rows: list):
+        # Rolls up from the watermark rather than just new_rows, so earlier
+        # hookless writes are picked up in the same transaction
+        self._roll_up(conn, self._last_id(conn))
+
+    def sync(self) -> int:
+        """
+        Brings the rollups in line with the headlines table: rows past the
+        watermark are rolled up; if the rollups don't count exactly the
+        headlines up to it (deleted rows, pre-watermark databases, writes
+        skipped below it), everything is rebuilt.
+
+        :return: Number of headlines rolled up.
+        """
+        with self.db.transaction() as conn:
+            last_id = self._last_id(conn)
+            rolled = conn.execute(
+                "SELECT COALESCE(SUM(count), 0) FROM trend_rollups "
+                "WHERE granularity = 'year' AND source = ? AND category = ?",
+                (ALL, ALL),
+            ).fetchone()[0]
+            covered = conn.execute("SELECT COUNT(*) FROM headlines WHERE id <= ?", (last_id,)).fetchone()[0]
+            if rolled == covered:
+                added = self._roll_up(conn, last_id)
+                if added:
+                    self.logger.log(f"Caught up trend rollups with {added} headlines")
+                return added
+            self.logger.log(f"Trend rollups count {rolled} headlines, expected {covered}; rebuilding")
+            conn.execute("DELETE FROM trend_rollups")
+            total = self._roll_up(conn)
+        self.logger.log(f"Rebuilt trend rollups from {total} headlines")
+        return total
+
+    def rebuild(self, batch_size: int = 5000):
+        """
+        Recomputes all rollups from the headlines table. Streams the archive in batches.
+        """
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM trend_rollups")
+            total = self._roll_up(conn, batch_size=batch_size)
+        self.logger.log(f"Rebuilt trend rollups from {total} headlines")
+
+    # ---------- queries
+
+    def series(self, granularity: str, start: str, end: str, source: str = ALL, category: str = ALL) -> list:
+        """
+        Counts per bucket in [start, end), e.g. series('day', '2025-07-01', '2025-08-01').
+
+        :return: List of (bucket, count), empty buckets omitted.
+        """
+        width = GRANULARITIES[granularity]
+        with self.db.connection() as conn:
+            rows = conn.execute(
+                "SELECT bucket, count FROM trend_rollups "
+                "WHERE granularity = ? AND source = ? AND category = ? AND bucket >= ? AND bucket < ? "
+                "ORDER BY bucket",
+                (granularity, source, category, start[:width], end[:width]),
+            )
+            return [(row['bucket'], row['count']) for row in rows]
+
+    @staticmethod
+    def _cover(start: datetime, end: datetime) -> list:
+        """
+        Splits [start, end) into the fewest aligned year/month/day/hour buckets.
+        The number of pieces is bounded by the calendar, not by the data.
+        """
+        pieces = []
+        cursor = start
+        while cursor < end:
+            if cursor.hour == 0 and cursor.day == 1 and cursor.month == 1 \
+                    and cursor.replace(year=cursor.year + 1) <= end:
+                pieces.append(('year', cursor.strftime('%Y')))
+                cursor = cursor.replace(year=cursor.year + 1)
+            elif cursor.hour == 0 and cursor.day == 1 \
+                    and (cursor + timedelta(days=32)).replace(day=1) <= end:
+                pieces.append(('month', cursor.strftime('%Y-%m')))
+                cursor = (cursor + timedelta(days=32)).replace(day=1)
+            elif cursor.hour == 0 and cursor + timedelta(days=1) <= end:
+                pieces.append(('day', cursor.strftime('%Y-%m-%d')))
+                cursor += timedelta(days=1)
+            else:
+                pieces.append(('hour', cursor.strftime('%Y-%m-%d %H')))
+                cursor += timedelta(hours=1)
+        return pieces
+
+    @staticmethod
+    def _parse(value: str) -> datetime:
+        value = value.strip()
+        for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H', '%Y-%m-%d', '%Y-%m', '%Y'):
+            try:
+                return datetime.strptime(value, fmt).replace(minute=0, second=0)
+            except ValueError:
+                continue
+        raise ValueError(f"Unrecognised date: {value}")
+
+    def count(self, start: str, end: str, source: str = ALL, category: str = ALL) -> int:
+        """
+        Total headlines in [start, end) (hour resolution), e.g. count('2020', '2025-07').
+        """
+        pieces = self._cover(self._parse(start), self._parse(end))
+        if not pieces:
+            return 0
+        total = 0
+        with self.db.connection() as conn:
+            for granularity in GRANULARITIES:
+                buckets = [bucket for g, bucket in pieces if g == granularity]
+                if not buckets:
+                    continue
+                placeholders = ",".join("?" * len(buckets))
+                total += conn.execute(
+                    "SELECT COALESCE(SUM(count), 0) FROM trend_rollups "
+                    f"WHERE granularity = ? AND source = ? AND category = ? AND bucket IN ({placeholders})",
+                    [granularity, source, category] + buckets,
+                ).fetchone()[0]
+        return total
+
+    def breakdown(self, start: str, end: str, source: str = ALL) -> dict:
+        """
+        Headline counts per category in [start, end).
+        """
+        return {
+            category: self.count(start, end, source=source, category=category)
+            for category in list(self._categories) + ['other']
+        }
@@ -0,0 +1,174 @@
+import os
+import socket
+import sys
+import time
+from datetime import datetime
+from .logService import LogService
+from entity.headlineRecord import HeadlineRecord
+from StrategyQueue.workQueue import WorkQueue, READY, LEASED, DEAD
+
+SOURCE_JOB = 'source'
+ARTICLE_JOB = 'article'
+
+
+class WorkQueueService:
+    def __init__(self, queue: WorkQueue, websites: list):
+        """
+        Spreads scraping over worker processes/nodes through a WorkQueue.
+
+        The coordinator enqueues one 'source' job per website and, once the
+        headlines are classified, one 'article' job per crime URL. Workers
+        lease jobs, run the matching scraper from their own copy of the
+        website factory, and ack the result; failures are retried by the queue
+        until the job runs out of attempts.
+
+        :param queue: Shared queue backend (SQLiteWorkQueue, RedisWorkQueue, ...).
+        :param websites: Website list as in factory.websiteFactory; workers and
+                         coordinator must use the same names.
+        """
+        self.queue = queue
+        self.websites = websites
+        self.scrapers = {website.get("name"): website.get("scraper") for website in websites}
+        self.logger = LogService()
+
+    # ---------- coordinator
+
+    def enqueue_sources(self, max_attempts: int = 3) -> int:
+        names = [website.get("name") for website in self.websites if website.get("scraper")]
+        added = self.queue.Enqueue(SOURCE_JOB, [{'source': name} for name in names], max_attempts=max_attempts)
+        self.logger.log(f"Enqueued {added} source jobs")
+        return added
+
+    def enqueue_articles(self, headlines: list, max_attempts: int = 3) -> int:
+        """
+        Enqueues one article job per headline URL (duplicates of queued URLs are skipped).
+        """
+        records = [r for r in map(HeadlineRecord.coerce, headlines) if r.url]
+        added = self.queue.Enqueue(
+            ARTICLE_JOB,
+            [{'source': r.source, 'url': r.url} for r in records],
+            keys=[f"{ARTICLE_JOB}:{r.url}" for r in records],
+            max_attempts=max_attempts,
+        )
+        self.logger.log(f"Enqueued {added} article jobs")
+        return added
+
+    def wait(self, kind: str, timeout: float = None, poll_interval: float = 1.0) -> dict:
+        """
+        Blocks until no job of a kind is ready or leased, or timeout seconds pass.
+        Each poll reads all states in one Stats snapshot, so a job moving
+        between states can't make the kind look drained.
+
+        :return: Final queue stats for the kind.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            stats = self.queue.Stats(kind)
+            if stats[READY] + stats[LEASED] == 0:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                self.logger.log(f"Timed out waiting for {kind} jobs: {stats}")
+                break
+            time.sleep(poll_interval)
+        if stats[DEAD]:
+            self.logger.log(f"{stats[DEAD]} {kind} jobs exhausted their retries")
+        return stats
+
+    def collect_headlines(self) -> list:
+        """
+        Drains finished source jobs into HeadlineRecords.
+        """
+        headlines = []
+        while True:
+            jobs = self.queue.Collect(SOURCE_JOB)
+            if not jobs:
+                break
+            for job in jobs:
+                result = job['result']
+                source = sys.intern(job['payload']['source'])
+                records = [
+                    HeadlineRecord.from_scraped(item, source, result['scraped_at'])
+                    for item in result['items'] if isinstance(item, dict)
+                ]
+                headlines.extend(records)
+                self.logger.log(f"Collected {len(records)} headlines from {source}")
+        self.logger.log(f"Collected {len(headlines)} headlines from the queue")
+        return headlines
+
+    def collect_full_text(self, headlines: list) -> list:
+        """
+        Drains finished article jobs and sets full_text on the matching records;
+        records without a finished job get an error string, as with a failed fetch.
+        """
+        texts = {}
+        while True:
+            jobs = self.queue.Collect(ARTICLE_JOB)
+            if not jobs:
+                break
+            texts.update((job['payload']['url'], job['result']) for job in jobs)
+        for record in headlines:
+            record.full_text = texts.get(record.url, f"Error: no result from the work queue for {record.url}")
+        self.logger.log(f"Collected full text for {sum(r.url in texts for r in headlines)} of {len(headlines)} articles")
+        return headlines
+
+    # ---------- worker
+
+    def _run_job(self, job: dict):
+        payload = job['payload']
+        scraper = self.scrapers.get(payload['source'])
+        if scraper is None:
+            raise ValueError(f"No scraper found for {payload['source']}")
+
+        if job['kind'] == SOURCE_JOB:
+            data = scraper.ScrapeHome()
+            if not isinstance(data, list):
+                raise RuntimeError(str(data))
+            return {'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'items': [item for item in data if isinstance(item, dict)]}
+        if job['kind'] == ARTICLE_JOB:
+            text = scraper.ScrapeFullText(payload['url'])
+            if not isinstance(text, str) or text.startswith("Error"):
+                raise RuntimeError(str(text))
+            return text
+        raise ValueError(f"Unknown job kind {job['kind']}")
+
+    def run_worker(self, worker_id: str = None, kinds: list = None, visibility_timeout: float = 120,
+                   idle_exit: float = None, poll_interval: float = 1.0) -> int:
+        """
+        Leases and runs jobs until the queue stays empty for idle_exit seconds
+        (forever if None).
+
+        Jobs are leased one at a time, right before they run, so a lease only
+        has to cover its own job; with several leased up front the last ones
+        could expire while the first still ran and be taken over by another worker.
+
+        :param visibility_timeout: Seconds a leased job stays invisible to other
+                                   workers; must exceed the slowest job.
+        :return: Number of jobs completed.
+        """
+        worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        kinds = kinds or [SOURCE_JOB, ARTICLE_JOB]
+        self.logger.log(f"Worker {worker_id} started for {kinds}")
+        completed = 0
+        idle_since = time.monotonic()
+        while True:
+            jobs = self.queue.Lease(worker_id, kinds, max_jobs=1, visibility_timeout=visibility_timeout)
+            if not jobs:
+                if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+                    break
+                time.sleep(poll_interval)
+                continue
+            job = jobs[0]
+            try:
+                result = self._run_job(job)
+            except Exception as e:
+                self.logger.log(f"Job {job['kind']} {job['payload']} failed (attempt {job['attempts']}): {str(e)}")
+                self.queue.Fail(job['id'], job['token'], str(e))
+            else:
+                if self.queue.Ack(job['id'], job['token'], result):
+                    completed += 1
+                else:
+                    self.logger.log(f"Lease lost for job {job['id']}, result dropped")
+            idle_since = time.monotonic()
+        self.logger.log(f"Worker {worker_id} exiting after {completed} jobs")
+        return completed
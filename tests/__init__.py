@@ -0,0 +1 @@
+# Behaviour tests. Run from the repository root: python -m pytest -q
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    # Services write the 'log' file and default data paths relative to the working directory
+    monkeypatch.chdir(tmp_path)
@@ -0,0 +1,76 @@
+import json
+import urllib.error
+import urllib.request
+import pytest
+from entity.headlineRecord import HeadlineRecord
+from service.apiService import ApiService
+from service.sqliteService import SQLiteService
+
+
+@pytest.fixture
+def api(tmp_path):
+    db = SQLiteService(str(tmp_path / 'crimenet.db'), pool_size=2, pool_timeout=1)
+    db.append_headlines([
+        HeadlineRecord('bbc', f"Robbery report {n}", f"https://example.com/{n}",
+                       confidence_score=0.9, scraped_at=f"2025-01-{n + 1:02d} 12:00:00")
+        for n in range(5)
+    ])
+    service = ApiService(db, port=0).start()
+    yield service
+    service.stop()
+    db.close()
+
+
+def get(api, path):
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{api.port}{path}", timeout=5) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def test_filtered_page(api):
+    status, body = get(api, '/headlines?from=2025-01-02&to=2025-01-04%2012:00:00&page_size=10')
+    assert status == 200
+    assert [row['url'] for row in json.loads(body)['results']] == [
+        'https://example.com/2', 'https://example.com/1',
+    ]
+
+
+@pytest.mark.parametrize('query', ['to=garbage', 'from=2025-13-01', 'page=x', 'min_confidence=high'])
+def test_malformed_query_is_400(api, query):
+    status, _ = get(api, f"/headlines?{query}")
+    assert status == 400
+
+
+def test_malformed_stream_query_is_400(api):
+    status, _ = get(api, '/headlines/stream?to=garbage')
+    assert status == 400
+
+
+def test_search_borrows_one_connection(api, monkeypatch):
+    borrowed = []
+    connection = api.db.connection
+
+    def counting_connection():
+        borrowed.append(1)
+        return connection()
+
+    monkeypatch.setattr(api.db, 'connection', counting_connection)
+    api.search({'page_size': ['2']})
+    api.search({'page_size': ['2']})
+    assert len(borrowed) == 2
+
+
+def test_cache_misses_after_write(api):
+    first = json.loads(api.search({}))['results']
+    api.db.append_headlines([HeadlineRecord('bbc', 'Late robbery report', 'https://example.com/late',
+                                            scraped_at='2025-02-01 00:00:00')])
+    second = json.loads(api.search({}))['results']
+    assert len(second) == len(first) + 1
+
+
+def test_stream_returns_every_row(api):
+    status, body = get(api, '/headlines/stream?source=bbc')
+    assert status == 200
+    assert len(body.decode('utf-8').splitlines()) == 5
@@ -0,0 +1,102 @@
+import os
+import random
+from datetime import datetime, timedelta
+import pytest
+from entity.headlineRecord import HeadlineRecord
+from service.archiveService import ArchiveService
+
+
+def records(times):
+    return [
+        HeadlineRecord('bbc', f"Headline {i}", f"https://example.com/{i}-{t}", confidence_score=0.9, scraped_at=t)
+        for i, t in enumerate(times)
+    ]
+
+
+def spread(count, start='2025-01-01 00:00:00', days=90):
+    first = datetime.strptime(start, '%Y-%m-%d %H:%M:%S')
+    step = timedelta(days=days) / count
+    return [(first + step * i).strftime('%Y-%m-%d %H:%M:%S') for i in range(count)]
+
+
+def urls_in(archive, start, end):
+    return [record.url for record in archive.iter_time(start, end)]
+
+
+def expected_urls(appended, start, end):
+    start = start if len(start) > 10 else start + ' 00:00:00'
+    end = end if len(end) > 10 else end + ' 00:00:00'
+    return [r.url for r in appended if start <= r.scraped_at < end]
+
+
+WINDOWS = [
+    ('2025-01-01', '2025-02-01'),
+    ('2025-02-01', '2025-03-01'),
+    ('2025-01-15 12:00:00', '2025-03-10'),
+    ('2024-01-01', '2026-01-01'),
+    ('2025-06-01', '2025-07-01'),
+]
+
+
+def test_out_of_order_appends_slice_by_real_time(tmp_path):
+    archive = ArchiveService(str(tmp_path / 'crime_news.archive'))
+    appended = records(spread(31))
+    random.Random(7).shuffle(appended)
+    # One unsorted batch, then batches that reach back before the latest time
+    for batch in (appended[:20], appended[20:26], appended[26:]):
+        archive.append_headlines(batch)
+
+    assert len(archive) == 31
+    assert len(archive.ids_for_time('2025-01-01', '2025-02-01')) == 11
+    for start, end in WINDOWS:
+        assert sorted(urls_in(archive, start, end)) == sorted(expected_urls(appended, start, end))
+
+
+def test_in_order_appends_slice_as_one_view(tmp_path):
+    archive = ArchiveService(str(tmp_path / 'crime_news.archive'))
+    appended = records(spread(30))
+    archive.append_headlines(appended[:10])
+    archive.append_headlines(appended[10:])
+
+    ids = archive.ids_for_time('2025-01-10', '2025-02-20')
+    assert ids == list(range(ids[0], ids[-1] + 1))
+    views = archive.slice_time('2025-01-10', '2025-02-20')
+    assert len(views) == 1
+    assert [r.url for r in archive.iter_records(views[0])] == expected_urls(appended, '2025-01-10', '2025-02-20')
+
+
+def test_get_and_slice_ids(tmp_path):
+    archive = ArchiveService(str(tmp_path / 'crime_news.archive'))
+    appended = records(spread(5))
+    assert archive.append_headlines(appended) == range(0, 5)
+    assert archive.get(3) == appended[3]
+    assert [r.url for r in archive.iter_records(archive.slice_ids(1, 4))] == [r.url for r in appended[1:4]]
+    with pytest.raises(IndexError):
+        archive.raw(5)
+
+
+def test_readers_see_appends_from_other_writers(tmp_path):
+    path = str(tmp_path / 'crime_news.archive')
+    reader, writer = ArchiveService(path), ArchiveService(path)
+    appended = records(spread(10))
+    writer.append_headlines(appended[5:])
+    assert urls_in(reader, '2025-01-01', '2026-01-01') == [r.url for r in appended[5:]]
+
+    # An earlier batch rewrites the time index; the reader remaps
+    writer.append_headlines(appended[:5])
+    assert len(reader) == 10
+    assert sorted(urls_in(reader, '2025-01-01', '2026-01-01')) == sorted(r.url for r in appended)
+
+
+def test_time_index_rebuilt_for_older_archives(tmp_path):
+    path = str(tmp_path / 'crime_news.archive')
+    ArchiveService(path).append_headlines(records(spread(6)))
+    os.remove(path + '.tidx')
+    assert len(ArchiveService(path).ids_for_time('2025-01-01', '2026-01-01')) == 6
+
+
+def test_malformed_bound_raises(tmp_path):
+    archive = ArchiveService(str(tmp_path / 'crime_news.archive'))
+    archive.append_headlines(records(spread(3)))
+    with pytest.raises(ValueError):
+        archive.ids_for_time('January', '2025-02-01')
@@ -0,0 +1,35 @@
+import pandas as pd
+from entity.headlineRecord import HeadlineRecord
+from service.csvService import CSVService
+
+
+def headlines(source, numbers):
+    return [
+        HeadlineRecord(source, f"Police investigate incident {n}", f"https://example.com/{source}/{n}",
+                       confidence_score=0.9, scraped_at='2025-01-01 10:00:00')
+        for n in numbers
+    ]
+
+
+def test_concatenated_chunks_keep_categorical_source(tmp_path):
+    csv_service = CSVService(str(tmp_path / 'crime_news.csv'))
+    # Each chunk of 2 rows holds a different set of sources
+    csv_service.append_headlines(headlines('bbc', [1, 2]) + headlines('yahoonews', [1, 2]) +
+                                 headlines('googlenews', [1]) + headlines('bbc', [3]))
+
+    chunks = list(csv_service.iter_chunks(chunk_size=2))
+    assert len(chunks) == 3
+    assert all(list(chunk['source'].cat.categories) == ['bbc', 'googlenews', 'yahoonews'] for chunk in chunks)
+
+    combined = pd.concat(chunks, ignore_index=True)
+    assert isinstance(combined['source'].dtype, pd.CategoricalDtype)
+    assert combined['source'].value_counts()['bbc'] == 3
+
+
+def test_given_sources_fix_the_categories(tmp_path):
+    csv_service = CSVService(str(tmp_path / 'crime_news.csv'))
+    csv_service.append_headlines(headlines('bbc', [1]) + headlines('unknown', [1]))
+
+    chunk = next(csv_service.iter_chunks(columns=['source'], sources=['newyorktimes', 'bbc']))
+    assert list(chunk['source'].cat.categories) == ['bbc', 'newyorktimes']
+    assert chunk['source'].isna().tolist() == [False, True]
@@ -0,0 +1,53 @@
+from entity.headlineRecord import HeadlineRecord
+from service.extractionService import ExtractionService
+from StrategyExtractor.llmExtractor import LLMExtractor
+from StrategyExtractor.mockLLMServer import MockLLMServer
+from StrategyExtractor.ruleBasedExtractor import RuleBasedExtractor
+
+TEXTS = [
+    "Police arrested a 34-year-old man in Leeds on Monday after a stabbing outside a pub.",
+    "A bank manager was charged with fraud in New York on Tuesday for embezzling client funds.",
+    "Two teenagers were detained in Paris after a robbery at a jewellery store on Friday.",
+    "Detectives in Chicago are investigating a shooting that left one man injured on Sunday.",
+]
+
+
+def articles(texts):
+    return [
+        HeadlineRecord('test', f"headline {i}", f"https://example.com/{i}", full_text=text)
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_llm_extractor_against_mock_server(tmp_path):
+    cache_path = str(tmp_path / 'cache.jsonl')
+    output_path = str(tmp_path / 'out.jsonl')
+    # The duplicate article is extracted once
+    batch = articles(TEXTS + [TEXTS[0]])
+
+    with MockLLMServer() as server:
+        service = ExtractionService(LLMExtractor(server.endpoint), cache_path, output_path, batch_size=2)
+        records = service.extract(batch)
+        assert server.inputs == len(TEXTS)
+        assert server.requests == 2
+
+        # Everything is cached now, also for a fresh service reading the cache file
+        again = ExtractionService(LLMExtractor(server.endpoint), cache_path, output_path, batch_size=2)
+        assert again.extract(batch) == records
+        assert server.requests == 2
+
+    expected = RuleBasedExtractor().ExtractBatch(TEXTS + [TEXTS[0]])
+    assert len(records) == len(batch)
+    for record, fields in zip(records, expected):
+        assert record['extractor'] == 'llm:local'
+        assert {field: record[field] for field in fields} == fields
+
+
+def test_failed_llm_batch_is_skipped(tmp_path):
+    with MockLLMServer() as server:
+        endpoint = server.endpoint
+    # Server is gone: the batch fails, nothing is cached or returned
+    service = ExtractionService(LLMExtractor(endpoint, timeout=2), str(tmp_path / 'cache.jsonl'),
+                                str(tmp_path / 'out.jsonl'))
+    assert service.extract(articles(TEXTS[:1])) == []
+    assert service.cache == {}
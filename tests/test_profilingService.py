@@ -0,0 +1,59 @@
+import json
+from service.profilingService import ProfilingService
+from service.scrapingService import ScrapingService
+from StrategyScraper.bbcNewsScraper import BBCNewsScraper
+from StrategyScraper.scraper import NewsScraper
+from tests.test_scraperSpecs import FixtureSession
+
+
+class WholeScraper(NewsScraper):
+    """
+    Scraper that only implements ScrapeHome, without the fetch/parse split.
+    """
+
+    def ScrapeHome(self):
+        return [{'title': 'Bank robbed downtown', 'link': 'https://example.com/a'}]
+
+    def ScrapeFullText(self, url):
+        return ""
+
+    def ScrapeSpecial(self, url):
+        return []
+
+
+def stages(profiler):
+    with open(profiler.write_summary(), encoding='utf-8') as f:
+        return json.load(f)['stages']
+
+
+def test_fetch_and_parse_are_separate_stages(tmp_path):
+    scraper = BBCNewsScraper()
+    scraper.use_session(FixtureSession('bbc_home.html'))
+    profiler = ProfilingService(str(tmp_path / 'profile'), trace_malloc=False)
+
+    data = ScrapingService([{'name': 'bbc', 'scraper': scraper}]).scrape(profiler)
+
+    assert [record.url for record in data] == [item['link'] for item in scraper.ScrapeHome()]
+    summary = stages(profiler)
+    assert set(summary) == {'scrape.bbc', 'parse.bbc'}
+    assert (tmp_path / 'profile' / 'parse.bbc.pstats').exists()
+
+
+def test_fetch_error_skips_parse_stage(tmp_path):
+    scraper = BBCNewsScraper()
+    session = FixtureSession('bbc_home.html')
+    session.get = lambda url, **kwargs: type('Response', (), {'status_code': 503})()
+    scraper.use_session(session)
+    profiler = ProfilingService(str(tmp_path / 'profile'), trace_malloc=False)
+
+    assert ScrapingService([{'name': 'bbc', 'scraper': scraper}]).scrape(profiler) == []
+    assert set(stages(profiler)) == {'scrape.bbc'}
+
+
+def test_unsplit_scraper_is_profiled_whole(tmp_path):
+    profiler = ProfilingService(str(tmp_path / 'profile'), mode='sample', trace_malloc=False)
+
+    data = ScrapingService([{'name': 'whole', 'scraper': WholeScraper()}]).scrape(profiler)
+
+    assert [record.title for record in data] == ['Bank robbed downtown']
+    assert set(stages(profiler)) == {'scrape.whole'}
@@ -0,0 +1,81 @@
+import os
+import threading
+import requests
+from requests.structures import CaseInsensitiveDict
+from factory.scraperSpecs import scraper_specs
+from StrategyScraper.bbcNewsScraper import BBCNewsScraper
+from StrategyScraper.genericScraper import GenericScraper
+from StrategyScraper.newYorkTimesScraper import NewYorkTimesScraper
+from StrategyScraper.scraper import ThreadLocalSession
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class FixtureSession:
+    """
+    Session stand-in answering every URL with one fixture page.
+    """
+
+    def __init__(self, name: str):
+        with open(os.path.join(FIXTURES, name), 'rb') as f:
+            self.body = f.read()
+        self.headers = CaseInsensitiveDict()
+
+    def get(self, url, **kwargs) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = url
+        resp._content = self.body
+        return resp
+
+
+def scrape(scraper, method, fixture, *args):
+    scraper.use_session(FixtureSession(fixture))
+    return getattr(scraper, method)(*args)
+
+
+def test_bbc_home_parity():
+    site = scrape(BBCNewsScraper(), 'ScrapeHome', 'bbc_home.html')
+    generic = scrape(GenericScraper(scraper_specs['bbc']), 'ScrapeHome', 'bbc_home.html')
+    assert generic == site
+    assert [item['link'] for item in site] == [
+        'https://www.bbc.com/news/articles/c1',
+        'https://www.bbc.com/news/articles/c2',
+    ]
+
+
+def test_bbc_full_text_keeps_every_text_block():
+    url = 'https://www.bbc.com/news/articles/c1'
+    site = scrape(BBCNewsScraper(), 'ScrapeFullText', 'bbc_article.html', url)
+    generic = scrape(GenericScraper(scraper_specs['bbc']), 'ScrapeFullText', 'bbc_article.html', url)
+    assert generic == site
+    assert len(site.split('\n\n')) == 3
+
+
+def test_nyt_full_text_parity():
+    url = 'https://www.nytimes.com/2025/01/01/nyregion/bank.html'
+    site = scrape(NewYorkTimesScraper(), 'ScrapeFullText', 'nyt_article.html', url)
+    generic = scrape(GenericScraper(scraper_specs['newyorktimes']), 'ScrapeFullText', 'nyt_article.html', url)
+    assert generic == site
+    assert 'Advertisement' not in site
+    assert len(site.split('\n\n')) == 2
+
+
+def test_thread_local_session_per_thread():
+    session = ThreadLocalSession({'User-Agent': 'crimenet-test'})
+    sessions = []
+
+    def grab():
+        sessions.append(session._thread_session())
+
+    threads = [threading.Thread(target=grab) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    grab()
+    grab()
+
+    assert len({id(s) for s in sessions[:5]}) == 5
+    assert sessions[-1] is sessions[-2]
+    assert all(s.headers['User-Agent'] == 'crimenet-test' for s in sessions)
@@ -0,0 +1,59 @@
+import pytest
+from entity.headlineRecord import HeadlineRecord
+from service.sqliteService import SQLiteService
+
+
+def headline(n, source='bbc', scraped_at='2025-01-01 10:00:00'):
+    return HeadlineRecord(source, f"Police investigate incident {n}", f"https://example.com/{n}",
+                          confidence_score=0.9, scraped_at=scraped_at)
+
+
+@pytest.fixture
+def db(tmp_path):
+    service = SQLiteService(str(tmp_path / 'crimenet.db'))
+    yield service
+    service.close()
+
+
+def test_append_counts_new_rows_with_version_trigger(db):
+    assert db.append_headlines([headline(1), headline(2)]) == 2
+    version = db.data_version()
+    assert version > 0
+
+    # Two of three already stored
+    assert db.append_headlines([headline(1), headline(2), headline(3)]) == 1
+    assert db.append_headlines([headline(1), headline(3)]) == 0
+    assert db.data_version() > version
+    assert len(db.query_headlines()) == 3
+
+
+def test_insert_new_headlines_returns_new_records_once(db):
+    db.append_headlines([headline(1)])
+    new = db.insert_new_headlines([headline(1), headline(2), headline(2), headline(3)])
+    assert [h.url for h in new] == ['https://example.com/2', 'https://example.com/3']
+
+
+def test_append_hook_sees_only_inserted_rows(db):
+    seen = []
+    db.add_append_hook(lambda conn, rows: seen.append([row['url'] for row in rows]))
+    db.append_headlines([headline(1)])
+    db.append_headlines([headline(1), headline(2)])
+    db.append_headlines([headline(2)])
+    assert seen == [['https://example.com/1'], ['https://example.com/2']]
+
+
+def test_keyword_matches_literally(db):
+    db.append_headlines([
+        HeadlineRecord('bbc', 'Fraud up 100% in a year', 'https://example.com/a', scraped_at='2025-01-01 00:00:00'),
+        HeadlineRecord('bbc', 'Fraud up 1000 cases', 'https://example.com/b', scraped_at='2025-01-01 00:00:00'),
+    ])
+    assert [row['url'] for row in db.query_headlines(keyword='100%')] == ['https://example.com/a']
+    assert db.query_headlines(keyword='_') == []
+
+
+def test_pool_exhaustion_times_out(tmp_path):
+    db = SQLiteService(str(tmp_path / 'crimenet.db'), pool_size=1, pool_timeout=0.05)
+    with db.connection():
+        with pytest.raises(TimeoutError):
+            db.data_version()
+    db.close()
@@ -0,0 +1,32 @@
+from entity.headlineRecord import HeadlineRecord
+from main import store_headlines
+from service.archiveService import ArchiveService
+from service.csvService import CSVService
+from service.sqliteService import SQLiteService
+
+
+def scrape(numbers):
+    return [
+        HeadlineRecord('bbc', f"Police investigate incident {n}", f"https://example.com/{n}",
+                       confidence_score=0.9, scraped_at='2025-01-01 10:00:00')
+        for n in numbers
+    ]
+
+
+def test_csv_and_sqlite_stay_in_sync_over_repeated_scrapes(tmp_path):
+    db = SQLiteService(str(tmp_path / 'crimenet.db'))
+    csv_service = CSVService(str(tmp_path / 'crime_news.csv'))
+    archive = ArchiveService(str(tmp_path / 'crime_news.archive'))
+
+    new_counts = [
+        len(store_headlines(scrape(numbers), db, csv_service, archive=archive))
+        for numbers in ([1, 2, 3], [2, 3, 4, 4], [1, 2, 3, 4], [5])
+    ]
+    assert new_counts == [3, 1, 0, 1]
+
+    csv_urls = [url for chunk in csv_service.iter_chunks(columns=['url']) for url in chunk['url']]
+    sqlite_urls = [row['url'] for row in db.query_headlines(limit=100)]
+    archive_urls = [record.url for record in archive.iter_records(archive.slice_ids(0, len(archive)))]
+    assert sorted(csv_urls) == sorted(sqlite_urls) == sorted(archive_urls)
+    assert len(csv_urls) == len(set(csv_urls)) == 5
+    db.close()
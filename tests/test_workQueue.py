@@ -0,0 +1,121 @@
+import time
+import pytest
+from service.workQueueService import WorkQueueService, SOURCE_JOB, ARTICLE_JOB
+from StrategyQueue.redisWorkQueue import RedisWorkQueue
+from StrategyQueue.sqliteWorkQueue import SQLiteWorkQueue
+from StrategyQueue.workQueue import READY, LEASED, DONE, DEAD
+
+
+def fake_redis():
+    fakeredis = pytest.importorskip('fakeredis')
+    pytest.importorskip('lupa')  # runs the Lua scripts
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def queue(request, tmp_path):
+    if request.param == 'sqlite':
+        return SQLiteWorkQueue(str(tmp_path / 'work_queue.db'))
+    return RedisWorkQueue(fake_redis())
+
+
+def test_lease_ack_collect(queue):
+    assert queue.Enqueue('article', [{'url': 'a'}, {'url': 'b'}, {'url': 'a'}], keys=['a', 'b', 'a']) == 2
+    jobs = queue.Lease('w1', ['article'], max_jobs=5)
+    assert sorted(job['payload']['url'] for job in jobs) == ['a', 'b']
+    assert queue.Stats('article')[LEASED] == 2
+
+    for job in jobs:
+        assert queue.Ack(job['id'], job['token'], job['payload']['url'].upper())
+    assert queue.Stats('article') == {READY: 0, LEASED: 0, DONE: 2, DEAD: 0}
+
+    collected = queue.Collect('article')
+    assert sorted(job['result'] for job in collected) == ['A', 'B']
+    assert queue.Collect('article') == []
+    assert queue.Stats('article') == {READY: 0, LEASED: 0, DONE: 0, DEAD: 0}
+    # Collected jobs give up their dedup keys
+    assert queue.Enqueue('article', [{'url': 'a'}], keys=['a']) == 1
+
+
+def test_failures_retry_then_dead_and_release_key(queue):
+    queue.Enqueue('article', [{'url': 'a'}], keys=['a'], max_attempts=2)
+    for attempt in (1, 2):
+        (job,) = queue.Lease('w1', ['article'])
+        assert job['attempts'] == attempt
+        assert queue.Fail(job['id'], job['token'], 'timeout')
+    assert queue.Lease('w1', ['article']) == []
+    assert queue.Stats('article')[DEAD] == 1
+    assert queue.Enqueue('article', [{'url': 'a'}], keys=['a']) == 1
+
+
+def test_expired_lease_is_taken_over(queue):
+    queue.Enqueue('source', [{'source': 'bbc'}], max_attempts=3)
+    (stale,) = queue.Lease('w1', ['source'], visibility_timeout=0.05)
+    time.sleep(0.1)
+    (job,) = queue.Lease('w2', ['source'], visibility_timeout=60)
+    assert job['id'] == stale['id'] and job['attempts'] == 2
+
+    # The first worker's lease is gone: its late result is rejected
+    assert not queue.Ack(stale['id'], stale['token'], 'late')
+    assert not queue.Fail(stale['id'], stale['token'], 'late')
+    assert queue.Ack(job['id'], job['token'], 'fresh')
+    assert [j['result'] for j in queue.Collect('source')] == ['fresh']
+
+
+def test_expired_lease_out_of_attempts_goes_dead(queue):
+    queue.Enqueue('source', [{'source': 'bbc'}], max_attempts=1)
+    queue.Lease('w1', ['source'], visibility_timeout=0.05)
+    time.sleep(0.1)
+    assert queue.Lease('w2', ['source']) == []
+    assert queue.Stats('source')[DEAD] == 1
+
+
+def test_redis_keys_share_one_cluster_slot_and_collect_cleans_up():
+    client = fake_redis()
+    queue = RedisWorkQueue(client)
+    queue.Enqueue('article', [{'url': str(i)} for i in range(3)], keys=[str(i) for i in range(3)])
+    for job in queue.Lease('w1', ['article'], max_jobs=3):
+        queue.Ack(job['id'], job['token'], 'ok')
+    queue.Collect('article')
+
+    keys = [key.decode('utf-8') for key in client.keys('*')]
+    assert keys and all(key.startswith('{crimenet:queue}:') for key in keys)
+    # Nothing of the collected jobs is left behind
+    assert not any(client.hlen(key) for key in keys if ':job:' in key)
+    assert client.scard('{crimenet:queue}:keys') == 0
+
+
+class FakeScraper:
+    def __init__(self, name):
+        self.name = name
+
+    def ScrapeHome(self):
+        return [{'title': f"{self.name} headline {i}", 'link': f"https://{self.name}/{i}"} for i in range(2)]
+
+    def ScrapeFullText(self, url):
+        return f"text of {url}"
+
+
+def test_worker_runs_jobs_leased_one_at_a_time(queue):
+    websites = [{'name': name, 'scraper': FakeScraper(name)} for name in ('bbc', 'nyt')]
+    leases = []
+    lease = queue.Lease
+
+    def recording_lease(*args, **kwargs):
+        leases.append(kwargs.get('max_jobs'))
+        return lease(*args, **kwargs)
+
+    queue.Lease = recording_lease
+    service = WorkQueueService(queue, websites)
+    service.enqueue_sources()
+    assert service.run_worker(idle_exit=0, poll_interval=0) == 2
+    headlines = service.collect_headlines()
+    assert sorted(h.url for h in headlines) == ['https://bbc/0', 'https://bbc/1', 'https://nyt/0', 'https://nyt/1']
+
+    service.enqueue_articles(headlines)
+    assert service.run_worker(idle_exit=0, poll_interval=0) == 4
+    service.collect_full_text(headlines)
+    assert all(h.full_text == f"text of {h.url}" for h in headlines)
+    assert set(leases) == {1}
+    assert service.wait(ARTICLE_JOB, timeout=0)[DONE] == 0
+    assert service.wait(SOURCE_JOB, timeout=0)[READY] == 0
@@ -0,0 +1,33 @@
+import argparse
+from service.modelRegistryService import ModelRegistryService
+from service.trainingService import TrainingService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CRIMENET - incremental crime classifier training")
+    parser.add_argument('data', help="labelled CSV with 'title' and 'label' (1 = crime, 0 = not crime)")
+    parser.add_argument('--registry', default='model/registry')
+    parser.add_argument('--base', help="registry version to continue from (default: active)")
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--activate', action='store_true', help="make the new version active")
+    parser.add_argument('--language', help="train a per-language model, e.g. 'es' (see LanguageRouterService)")
+    args = parser.parse_args()
+
+    print("CRIMENET - Global Crime Intelligence Engine Training")
+    print("=" * 50)
+
+    training_service = TrainingService(ModelRegistryService(args.registry))
+    try:
+        version = training_service.update_from_csv(
+            args.data, base_version=args.base, activate=args.activate, batch_size=args.batch_size,
+            language=args.language,
+        )
+    except ValueError as e:
+        print(f"Training failed: {e}")
+        return
+
+    print(f"Model version {version} registered in {args.registry}")
+
+
+if __name__ == "__main__":
+    main()